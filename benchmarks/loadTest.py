@@ -0,0 +1,371 @@
+"""
+Network load test for the in-game HostLobby. Connects hundreds of fake clients that
+speak the game protocol ('join', then 'confirmedTopCards' once the host deals, then a
+steady cycle of 'updateCards', 'updatePile', 'drawCards' and 'updateCurrentPlayer'), and
+reports throughput, relay latency percentiles and errors.
+
+    python benchmarks/loadTest.py --clients 201 --duration 10 --slow 0.05 --drop 0.05
+
+Without --port the lobbies run in a child process (so they do not share the load
+generator's interpreter lock): one main.HostLobby per CLIENTS_PER_LOBBY clients on the
+offscreen Qt platform, each on a free port, exactly as the app hosts a game. Once every
+client is seated each lobby starts its game, and the hosts' time from receiving an
+'updateCurrentPlayer' to handling it on the GUI thread is included.
+With --port the clients join a lobby hosted from the app instead; it seats
+CLIENTS_PER_LOBBY clients, so use --clients 3 and press Start Game once they have joined.
+Every message carries a palaceTrace trace; latency is measured from the sender's
+'sent' stamp to its arrival at each other client at the table, on the same clock.
+
+--slow makes that fraction of clients read with a small receive buffer and only every
+SLOW_READ_INTERVAL seconds. Like a congested link, a full receive buffer also delays what
+those clients send (the kernel drops the acknowledgements), so latency is reported
+separately for messages between normal clients and messages to or from slow ones.
+--drop makes that fraction reset their connection at a random point of the run. All
+clients run on one selector loop.
+"""
+import os
+import sys
+import json
+import time
+import heapq
+import random
+import socket
+import struct
+import argparse
+import selectors
+import multiprocessing
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+from palaceRules import newDeck
+from palaceTrace import TurnLatencyTracer
+
+# HostLobby seats 3 clients besides the host, who is Player 1
+CLIENTS_PER_LOBBY = 3
+SEATS = CLIENTS_PER_LOBBY + 1
+# How long to wait for every client to be given a seat before starting the games
+SEAT_TIMEOUT = 5.0
+
+SLOW_READ_INTERVAL = 0.25
+SLOW_READ_BYTES = 512
+SLOW_RECEIVE_BUFFER = 4096
+
+class FakeClient:
+    def __init__(self, number, behavior, rng):
+        self.number = number
+        self.behavior = behavior
+        self.rng = rng
+        self.socket = None
+        self.index = None
+        self.buffer = b""
+        self.pending = b""
+        self.tracer = TurnLatencyTracer(origin=f"load{number}", enabled=True)
+        self.step = 0
+        self.nextRead = 0.0
+        self.events = 0
+        self.closed = False
+
+    def connect(self, host, port):
+        self.socket = socket.create_connection((host, port), timeout=5)
+        self.socket.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+        if self.behavior == 'slow':
+            self.socket.setsockopt(socket.SOL_SOCKET, socket.SO_RCVBUF, SLOW_RECEIVE_BUFFER)
+        self.socket.setblocking(False)
+
+    def nextMessage(self):
+        """
+        The next message of the scripted turn cycle.
+        """
+        self.step += 1
+        cards = [list(card) for card in newDeck(self.rng)[:3]]
+        kind = self.step % 4
+        if kind == 0:
+            return 'updateCards', {'playerIndex': self.index, 'handCards': cards, 'topCards': cards, 'bottomCards': cards}
+        if kind == 1:
+            return 'updatePile', {'pile': cards}
+        if kind == 2:
+            return 'drawCards', {'count': 1}
+        return 'updateCurrentPlayer', {'currentPlayer': self.index % SEATS + 1, 'checksum': self.rng.getrandbits(63)}
+
+    def encode(self, action, data):
+        return self.tracer.encode(action, data).encode()
+
+    def reset(self):
+        """
+        Drop the connection abruptly, with a TCP reset instead of a clean close.
+        """
+        self.socket.setsockopt(socket.SOL_SOCKET, socket.SO_LINGER, struct.pack('ii', 1, 0))
+        self.socket.close()
+        self.closed = True
+
+def percentile(samples, fraction):
+    if not samples:
+        return float('nan')
+    ordered = sorted(samples)
+    return ordered[min(len(ordered) - 1, int(fraction * len(ordered)))]
+
+class LoadTest:
+    def __init__(self, args):
+        self.args = args
+        self.rng = random.Random(args.seed)
+        self.selector = selectors.DefaultSelector()
+        self.clients = []
+        self.schedule = []
+        self.latencies = {'normal': [], 'slow': []}
+        self.behaviors = {}
+        self.relayTimes = []
+        self.counts = {'sent': 0, 'delivered': 0, 'connectErrors': 0, 'sendErrors': 0, 'unexpectedDisconnects': 0, 'dropped': 0}
+
+    def run(self, host, ports, startGames=None):
+        """
+        Connect the clients, CLIENTS_PER_LOBBY to each of ports, call startGames once they
+        are seated, and run the load for --duration seconds.
+        """
+        args = self.args
+        behaviors = ['slow'] * int(args.clients * args.slow) + ['drop'] * int(args.clients * args.drop)
+        behaviors += ['normal'] * (args.clients - len(behaviors))
+        self.rng.shuffle(behaviors)
+        start = time.monotonic()
+        end = start + args.duration
+        for number, behavior in enumerate(behaviors):
+            client = FakeClient(number, behavior, random.Random(self.rng.random()))
+            try:
+                client.connect(host, ports[number // CLIENTS_PER_LOBBY])
+            except OSError:
+                self.counts['connectErrors'] += 1
+                continue
+            self.clients.append(client)
+            self.behaviors[client.tracer.origin] = behavior
+            self.watch(client)
+            if behavior == 'drop':
+                heapq.heappush(self.schedule, (self.rng.uniform(start, end), number, 'drop', client))
+
+        if startGames:
+            deadline = time.monotonic() + SEAT_TIMEOUT
+            while any(client.index is None for client in self.clients) and time.monotonic() < deadline:
+                self.poll(0.05)
+            startGames()
+        while time.monotonic() < end:
+            now = time.monotonic()
+            while self.schedule and self.schedule[0][0] <= now:
+                _, _, event, client = heapq.heappop(self.schedule)
+                if not client.closed:
+                    self.fire(event, client, now)
+            timeout = max(0.0, min(end, self.schedule[0][0] if self.schedule else end) - time.monotonic())
+            self.poll(min(timeout, 0.05))
+        return time.monotonic() - start
+
+    def closeAll(self):
+        for client in self.clients:
+            if not client.closed:
+                self.close(client)
+
+    def poll(self, timeout):
+        for key, mask in self.selector.select(timeout):
+            client = key.data
+            if mask & selectors.EVENT_READ:
+                self.read(client)
+            if mask & selectors.EVENT_WRITE and not client.closed:
+                self.flush(client)
+
+    def fire(self, event, client, now):
+        if event == 'drop':
+            self.close(client, reset=True)
+            self.counts['dropped'] += 1
+        elif event == 'send':
+            self.send(client, *client.nextMessage())
+            heapq.heappush(self.schedule, (now + 1.0 / self.args.rate, client.number, 'send', client))
+        elif event == 'read':
+            self.watch(client)
+
+    def send(self, client, action, data):
+        client.pending += client.encode(action, data)
+        self.counts['sent'] += 1
+        self.flush(client)
+
+    def flush(self, client):
+        try:
+            sent = client.socket.send(client.pending)
+        except BlockingIOError:
+            sent = 0
+        except OSError:
+            self.counts['sendErrors'] += 1
+            self.close(client)
+            return
+        client.pending = client.pending[sent:]
+        self.watch(client)
+
+    def watch(self, client):
+        """
+        Select on client's socket for reading, unless it is a slow client between reads,
+        and for writing while it has unsent data.
+        """
+        events = selectors.EVENT_WRITE if client.pending else 0
+        if client.behavior != 'slow' or client.nextRead <= time.monotonic():
+            events |= selectors.EVENT_READ
+        if events == client.events:
+            return
+        if not client.events:
+            self.selector.register(client.socket, events, client)
+        elif not events:
+            self.selector.unregister(client.socket)
+        else:
+            self.selector.modify(client.socket, events, client)
+        client.events = events
+
+    def read(self, client):
+        size = SLOW_READ_BYTES if client.behavior == 'slow' else 65536
+        try:
+            chunk = client.socket.recv(size)
+        except BlockingIOError:
+            return
+        except OSError:
+            chunk = b""
+        if not chunk:
+            self.counts['unexpectedDisconnects'] += 1
+            self.close(client)
+            return
+        now = time.time()
+        client.buffer += chunk
+        *lines, client.buffer = client.buffer.split(b"\n")
+        for line in lines:
+            data = json.loads(line)
+            if data['action'] == 'setIndex':
+                self.seated(client, data['index'])
+                continue
+            if data['action'] == 'deckSync':
+                self.dealt(client)
+                continue
+            self.counts['delivered'] += 1
+            trace = data.get('trace')
+            if trace:
+                slow = 'slow' in (client.behavior, self.behaviors.get(trace['origin']))
+                self.latencies['slow' if slow else 'normal'].append(now - trace['sent'])
+                if 'relayed' in trace:
+                    self.relayTimes.append(trace['relayed'] - trace['hostRecv'])
+        if client.behavior == 'slow':
+            # Stop reading until the next slow read is due
+            client.nextRead = time.monotonic() + SLOW_READ_INTERVAL
+            self.watch(client)
+            heapq.heappush(self.schedule, (client.nextRead, client.number, 'read', client))
+
+    def seated(self, client, index):
+        """
+        Take the seat the host gives; it renumbers the seats when a client leaves.
+        """
+        joined = client.index is not None
+        client.index = index
+        if not joined:
+            self.send(client, 'join', {'nickname': f"load{client.number}"})
+
+    def dealt(self, client):
+        self.send(client, 'confirmedTopCards', {})
+        first = time.monotonic() + self.rng.uniform(0, 1.0 / self.args.rate)
+        heapq.heappush(self.schedule, (first, client.number, 'send', client))
+
+    def close(self, client, reset=False):
+        if client.events:
+            self.selector.unregister(client.socket)
+            client.events = 0
+        if reset:
+            client.reset()
+        else:
+            client.socket.close()
+            client.closed = True
+
+def serve(connection, lobbies):
+    """
+    Child process: host lobbies HostLobbys on the offscreen Qt platform and send their
+    ports, start their games when told to, and send the hosts' traced turns when asked to
+    stop. The process then exits with the clients still connected, so the hosts do not
+    report every client leaving.
+    """
+    os.environ.setdefault('QT_QPA_PLATFORM', 'offscreen')
+    # The lobbies log every message they receive
+    sys.stdout = open(os.devnull, 'w')
+    from PySide6.QtCore import QTimer
+    from PySide6.QtWidgets import QApplication, QWidget
+    import main as palaceMain
+
+    app = QApplication([])
+    menu = QWidget()
+    hosts = [palaceMain.HostLobby(menu, menu, port=0) for _ in range(lobbies)]
+    for host in hosts:
+        host.tracer.enabled = True
+    connection.send([host.port for host in hosts])
+
+    def poll():
+        if not connection.poll():
+            return
+        if connection.recv() == 'start':
+            for host in hosts:
+                if host.clients:
+                    host.startGame()
+        else:
+            # exit() rather than quit(), which would ask every game view to close
+            app.exit()
+    timer = QTimer()
+    timer.timeout.connect(poll)
+    timer.start(20)
+    app.exec()
+
+    turns = [turn for host in hosts for turn in host.tracer.turns]
+    connection.send({'games': sum(host.hostController is not None for host in hosts), 'turns': turns})
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Load test HostLobby with simulated clients.")
+    parser.add_argument('--clients', type=int, default=201)
+    parser.add_argument('--duration', type=float, default=10.0, help="seconds of load")
+    parser.add_argument('--rate', type=float, default=2.0, help="messages per second per client")
+    parser.add_argument('--slow', type=float, default=0.0, help="fraction of clients that read slowly")
+    parser.add_argument('--drop', type=float, default=0.0, help="fraction of clients that reset their connection")
+    parser.add_argument('--host', default="127.0.0.1")
+    parser.add_argument('--port', type=int, help="lobby hosted from the app to test; default hosts lobbies in a child process")
+    parser.add_argument('--seed', type=int, default=0)
+    args = parser.parse_args(argv)
+
+    server = None
+    ports = [args.port]
+    startGames = None
+    if args.port is None:
+        connection, childConnection = multiprocessing.Pipe()
+        lobbies = -(-args.clients // CLIENTS_PER_LOBBY)
+        server = multiprocessing.Process(target=serve, args=(childConnection, lobbies), daemon=True)
+        server.start()
+        ports = connection.recv()
+        startGames = lambda: connection.send('start')
+
+    test = LoadTest(args)
+    elapsed = test.run(args.host, ports, startGames)
+    if server:
+        connection.send('stop')
+        stats = connection.recv()
+        server.join()
+    test.closeAll()
+
+    counts = test.counts
+    print(f"{args.clients} clients ({int(args.clients * args.slow)} slow, {int(args.clients * args.drop)} dropping) for {elapsed:.1f} s")
+    print(f"Sent {counts['sent']} messages ({counts['sent'] / elapsed:.0f}/s), delivered {counts['delivered']} relays ({counts['delivered'] / elapsed:.0f}/s)")
+    labels = {'normal': "between normal clients", 'slow': "to or from slow clients"}
+    for behavior, samples in test.latencies.items():
+        if samples:
+            latencies = [latency * 1000 for latency in samples]
+            print(f"Relay latency {labels[behavior]}: p50 {percentile(latencies, 0.5):.2f} ms, "
+                  f"p99 {percentile(latencies, 0.99):.2f} ms, max {max(latencies):.2f} ms")
+    if test.relayTimes:
+        relay = [value * 1000 for value in test.relayTimes]
+        print(f"Server relay time p50 {percentile(relay, 0.5):.3f} ms, p99 {percentile(relay, 0.99):.3f} ms")
+    errors = counts['connectErrors'] + counts['sendErrors'] + counts['unexpectedDisconnects']
+    print(f"Errors: {counts['connectErrors']} connect, {counts['sendErrors']} send, {counts['unexpectedDisconnects']} disconnected by the server "
+          f"({errors / max(1, len(test.clients) + counts['connectErrors']):.1%} of clients); {counts['dropped']} dropped on purpose")
+    if server:
+        print(f"Hosts: {stats['games']} of {len(ports)} lobbies started a game")
+        handled = [turn['render'] * 1000 for turn in stats['turns']]
+        if handled:
+            print(f"Host receive to handled on the GUI thread ('updateCurrentPlayer'): p50 {percentile(handled, 0.5):.2f} ms, "
+                  f"p99 {percentile(handled, 0.99):.2f} ms over the last {len(handled)} turns")
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,233 @@
+"""
+Render benchmark for the game view. Drives a GameView (or CanvasGameView with --mode
+canvas) through scripted table states on Qt's offscreen platform and reports, per
+scenario, the time to apply the updates and rebuild the widgets, the time to paint a
+frame, the widgets created and destroyed and the peak Python allocations.
+
+    python benchmarks/renderBench.py --runs 20 --frames /tmp/frames
+
+Scenarios:
+- deal: the first render of a 4 player table after top card selection
+- pickup40: picking up a 40 card pile into the hand
+- layoutSwitch: a 4 player table dropping to 3 players (switchToThreePlayerLayout)
+- burn: a 10 played on a 3 card pile, which burns it
+
+The cards are dealt from a seeded deck, so a frame hash only changes when the rendered
+pixels do; --frames saves the last frame of each scenario as a PNG for comparison.
+Runs headlessly on Linux without a display.
+"""
+import os
+import sys
+import json
+import random
+import hashlib
+import argparse
+import statistics
+import time
+import tracemalloc
+
+os.environ.setdefault('QT_QPA_PLATFORM', 'offscreen')
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+try:
+    import resource
+except ImportError:
+    resource = None
+from shiboken6 import getCppPointer
+from PySide6.QtWidgets import QApplication
+from PySide6.QtCore import QCoreApplication, QEvent, QRect
+from palaceRules import newDeck
+from palaceTable import TableState, sharedCard
+import main as palaceMain
+
+def dealTable(seed, numPlayers=4):
+    """
+    A table in the main game phase: 3 hand, top and bottom cards per player and the rest
+    of the deck.
+    """
+    table = TableState(numPlayers, newDeck(random.Random(seed)))
+    for player in table.players:
+        cards = table.deck.draw(9)
+        player.setCards(
+            [(card[0], card[1], False, False) for card in cards[:3]],
+            [(card[0], card[1], True, False) for card in cards[3:6]],
+            [(card[0], card[1], False, True) for card in cards[6:]],
+        )
+    table.currentPlayer = 1
+    return table
+
+class Table:
+    """
+    A GameView for player 1 with a controller holding a seeded table, in the main
+    game phase.
+    """
+    def __init__(self, viewClass, seed, numPlayers=4):
+        self.controller = palaceMain.GameController(dealTable(seed, numPlayers), 1, lambda action, data: None, {})
+        self.controller.topCardSelectionPhase = False
+        self.seed = seed
+        self.view = viewClass(self.controller, QRect(0, 0, 900, 900), numPlayers, None)
+        self.view.startMainView()
+        self.view.show()
+
+    def close(self):
+        self.view.hide()
+        self.view.deleteLater()
+        self.controller.deleteLater()
+        settle(None)
+
+    def renderOthers(self):
+        for playerIndex, player in self.controller.table.seats():
+            if playerIndex != 1:
+                self.view.updateOtherPlayerCards(playerIndex, player.handCards, player.topCards, player.bottomCards)
+
+def settle(view):
+    """
+    Render whatever the view has pending and destroy the widgets it dropped.
+    """
+    if view is not None and view.dirtyZones:
+        view.flushRender()
+    QCoreApplication.sendPostedEvents(None, QEvent.Type.DeferredDelete)
+    QCoreApplication.processEvents()
+
+def setupNothing(table):
+    pass
+
+def setupDealt(table):
+    deal(table)
+
+def deal(table):
+    controller = table.controller
+    table.view.updateHandCards(controller.handCards)
+    table.view.updateTopCards(controller.topCards)
+    table.view.updateBottomCards(controller.bottomCards)
+    table.renderOthers()
+    table.view.updateDeck(controller.deck)
+    table.view.updatePile(controller.pile)
+
+def pickUp40(table):
+    controller = table.controller
+    pile = newDeck(random.Random(table.seed))[:40]
+    table.view.updatePile(pile)
+    settle(table.view)
+    controller.handCards = controller.handCards + pile
+    table.view.updateHandCards(controller.handCards)
+    table.view.updatePile([])
+
+def switchLayout(table):
+    table.view.switchToThreePlayerLayout({1, 2, 3})
+
+def setupPile(table):
+    deal(table)
+    table.controller.pile = [card for card in table.controller.deck if card[0] not in ('10', '2')][:3]
+    table.view.updatePile(table.controller.pile)
+
+def burn(table):
+    controller = table.controller
+    controller.table.addToPile(sharedCard('10', 'hearts'))
+    table.view.updatePile(controller.pile)
+    settle(table.view)
+    controller.pile = []
+    controller.table.addCards(controller.player, 'handCards', controller.deck.draw(1))
+    table.view.updatePile(controller.pile)
+    table.view.updatePileLabel("Pile:\nBurned")
+    table.view.updateHandCards(controller.handCards)
+    table.view.updateDeck(controller.deck)
+
+# name: (setup, step); only the step is measured
+SCENARIOS = {
+    'deal': (setupNothing, deal),
+    'pickup40': (setupDealt, pickUp40),
+    'layoutSwitch': (setupDealt, switchLayout),
+    'burn': (setupPile, burn),
+}
+
+def liveWidgets():
+    return {getCppPointer(widget)[0] for widget in QApplication.allWidgets()}
+
+def runScenario(viewClass, setup, step, seed):
+    table = Table(viewClass, seed)
+    setup(table)
+    settle(table.view)
+    before = liveWidgets()
+    tracemalloc.start()
+    start = time.perf_counter()
+    step(table)
+    settle(table.view)
+    updateMs = (time.perf_counter() - start) * 1000
+    _, peakBytes = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    after = liveWidgets()
+    start = time.perf_counter()
+    frame = table.view.grab().toImage()
+    paintMs = (time.perf_counter() - start) * 1000
+    table.close()
+    return {
+        'updateMs': updateMs,
+        'paintMs': paintMs,
+        'created': len(after - before),
+        'destroyed': len(before - after),
+        'peakKiB': peakBytes / 1024,
+    }, frame
+
+def peakRssMiB():
+    if resource is None:
+        return None
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # ru_maxrss is in bytes on macOS and KiB elsewhere
+    return peak / (1024 * 1024 if sys.platform == 'darwin' else 1024)
+
+def frameHash(frame):
+    return hashlib.sha1(bytes(frame.constBits())).hexdigest()[:12]
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Measure game view render times offscreen.")
+    parser.add_argument('--runs', type=int, default=20, help="measured runs per scenario")
+    parser.add_argument('--mode', choices=['widgets', 'canvas'], default='widgets', help="GameView or CanvasGameView")
+    parser.add_argument('--scenarios', nargs='+', choices=list(SCENARIOS), default=list(SCENARIOS))
+    parser.add_argument('--seed', type=int, default=0)
+    parser.add_argument('--frames', help="directory to save the last frame of each scenario to")
+    parser.add_argument('--json', help="also write the results to this file")
+    args = parser.parse_args(argv)
+
+    app = QApplication.instance() or QApplication([])
+    app.setStyleSheet(palaceMain.darkStyleSheet())
+    viewClass = palaceMain.CanvasGameView if args.mode == 'canvas' else palaceMain.GameView
+    if args.frames:
+        os.makedirs(args.frames, exist_ok=True)
+
+    # Warm up the pixmap cache and first-use costs outside the measurements
+    runScenario(viewClass, setupNothing, deal, args.seed)
+
+    results = {}
+    print(f"{'scenario':<14}{'update ms':>11}{'paint ms':>10}{'created':>9}{'destroyed':>11}{'peak KiB':>10}  frame")
+    for name in args.scenarios:
+        setup, step = SCENARIOS[name]
+        samples = []
+        for _ in range(args.runs):
+            sample, frame = runScenario(viewClass, setup, step, args.seed)
+            samples.append(sample)
+        result = {
+            'updateMs': statistics.median(sample['updateMs'] for sample in samples),
+            'paintMs': statistics.median(sample['paintMs'] for sample in samples),
+            'created': samples[-1]['created'],
+            'destroyed': samples[-1]['destroyed'],
+            'peakKiB': max(sample['peakKiB'] for sample in samples),
+            'frame': frameHash(frame),
+        }
+        results[name] = result
+        if args.frames:
+            frame.save(os.path.join(args.frames, f"{args.mode}-{name}.png"))
+        print(f"{name:<14}{result['updateMs']:>11.2f}{result['paintMs']:>10.2f}{result['created']:>9}"
+              f"{result['destroyed']:>11}{result['peakKiB']:>10.0f}  {result['frame']}")
+
+    rss = peakRssMiB()
+    if rss is not None:
+        print(f"Peak process memory: {rss:.0f} MiB")
+    if args.json:
+        with open(args.json, 'w') as f:
+            json.dump({'mode': args.mode, 'runs': args.runs, 'scenarios': results, 'peakRssMiB': rss}, f, indent=2)
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
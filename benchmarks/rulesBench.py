@@ -0,0 +1,168 @@
+"""
+Microbenchmarks for the game rules: isCardPlayable and the GameController rule methods
+(updatePlayableCards, placeCard with each special card, pickUpPile, calculateRankTotals).
+
+    python benchmarks/rulesBench.py            # compare with rulesBaseline.json
+    python benchmarks/rulesBench.py --update   # record a new baseline
+
+Every case builds its table fresh before each call, outside the timing, and reports the
+median time per call in microseconds over --repeats rounds. A case more than
+--tolerance slower than its baseline fails the run, so regressions show up per commit.
+Baselines are machine specific; record them on the machine that compares against them.
+"""
+import os
+import io
+import sys
+import json
+import time
+import argparse
+import platform
+import statistics
+import contextlib
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+BASELINE_PATH = os.path.join(ROOT, 'benchmarks', 'rulesBaseline.json')
+
+from PySide6.QtCore import QCoreApplication
+from palaceRules import VALUES, SUITS, isCardPlayable
+from palaceTable import TableState
+from main import GameController
+
+def fullDeck():
+    return [(value, suit, False, False) for value in VALUES for suit in SUITS]
+
+def controller(handCards, pile=(), deck=None, numPlayers=4):
+    """
+    Player 1's controller mid game, with every other seat holding 3 top cards.
+    """
+    table = TableState(numPlayers, fullDeck()[20:] if deck is None else deck)
+    table.setCards(1, handCards, [('8', 'clubs', True, False)] * 3, [('9', 'clubs', False, True)] * 3)
+    for playerIndex in range(2, numPlayers + 1):
+        table.setCards(
+            playerIndex,
+            [('5', 'hearts', False, False)] * 3,
+            [(list(VALUES)[playerIndex], 'spades', True, False)] * 3,
+            [('4', 'hearts', False, True)] * 3,
+        )
+    table.setPile(pile)
+    table.currentPlayer = 1
+    table.clockwise = True
+    game = GameController(table, 1, lambda action, data: None, {})
+    game.topCardSelectionPhase = False
+    return game
+
+def playing(cards, pile=(), **kwargs):
+    """
+    setup for placeCard: cards selected from a 3 card hand on top of pile.
+    """
+    def setup():
+        hand = list(cards) + [('K', 'clubs', False, False)] * (3 - len(cards))
+        game = controller(hand, pile, **kwargs)
+        game.selectedCards = [(card, None) for card in cards]
+        return game
+    return setup
+
+def isCardPlayableCase():
+    piles = [[], [('K', 'hearts', False, False)], [('7', 'hearts', False, False)], [('2', 'hearts', False, False)]]
+    cards = fullDeck()
+    def run(_):
+        for pile in piles:
+            for sevenSwitch in (False, True):
+                for card in cards:
+                    isCardPlayable(card, pile, sevenSwitch)
+    # One call covers the whole deck on each pile state
+    return lambda: None, run
+
+def updatePlayableCardsCase(handSize):
+    hand = (fullDeck() * 2)[:handSize]
+    return lambda: controller(hand, [('9', 'hearts', False, False)]), lambda game: game.updatePlayableCards()
+
+def placeCardCase(cards, pile=()):
+    return playing(cards, pile), lambda game: game.placeCard()
+
+def pickUpPileCase(pileSize):
+    pile = fullDeck()[:pileSize]
+    return lambda: controller([('3', 'clubs', False, False)], pile), lambda game: game.pickUpPile()
+
+def rankTotalsCase(numPlayers):
+    return lambda: controller([], numPlayers=numPlayers), lambda game: game.calculateRankTotals()
+
+KING = ('K', 'hearts', False, False)
+CASES = {
+    'isCardPlayable[deck x 8 piles]': isCardPlayableCase(),
+    'updatePlayableCards[3]': updatePlayableCardsCase(3),
+    'updatePlayableCards[40]': updatePlayableCardsCase(40),
+    'placeCard[plain]': placeCardCase([('Q', 'spades', False, False)], [('9', 'hearts', False, False)]),
+    'placeCard[2]': placeCardCase([('2', 'spades', False, False)], [KING]),
+    'placeCard[7]': placeCardCase([('7', 'spades', False, False)], [('5', 'hearts', False, False)]),
+    'placeCard[10]': placeCardCase([('10', 'spades', False, False)], [('6', 'hearts', False, False), ('J', 'clubs', False, False), KING]),
+    'placeCard[four of a kind]': placeCardCase(
+        [('Q', 'spades', False, False), ('Q', 'clubs', False, False)],
+        [('9', 'hearts', False, False), ('Q', 'hearts', False, False), ('Q', 'diamonds', False, False)],
+    ),
+    'pickUpPile[12]': pickUpPileCase(12),
+    'pickUpPile[48]': pickUpPileCase(48),
+    'calculateRankTotals[4]': rankTotalsCase(4),
+}
+
+def measure(setup, run, calls, repeats):
+    """
+    Median time per call in microseconds, over repeats rounds of calls calls each.
+    """
+    rounds = []
+    for _ in range(repeats):
+        total = 0.0
+        for _ in range(calls):
+            state = setup()
+            start = time.perf_counter()
+            run(state)
+            total += time.perf_counter() - start
+        rounds.append(total / calls * 1e6)
+    return statistics.median(rounds)
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Benchmark the game rules against the stored baseline.")
+    parser.add_argument('--calls', type=int, default=200, help="calls per round")
+    parser.add_argument('--repeats', type=int, default=7, help="rounds per case")
+    parser.add_argument('--tolerance', type=float, default=0.25, help="allowed slowdown over the baseline")
+    parser.add_argument('--update', action='store_true', help="store the results as the new baseline")
+    parser.add_argument('--baseline', default=BASELINE_PATH)
+    args = parser.parse_args(argv)
+
+    QCoreApplication.instance() or QCoreApplication([])
+    baseline = {}
+    if os.path.exists(args.baseline) and not args.update:
+        with open(args.baseline) as f:
+            baseline = json.load(f)['cases']
+
+    results = {}
+    failed = False
+    for name, (setup, run) in CASES.items():
+        # The controller prints game events; keep them out of the report
+        with contextlib.redirect_stdout(io.StringIO()):
+            micros = measure(setup, run, args.calls, args.repeats)
+        results[name] = round(micros, 2)
+        line = f"{name:<32}{micros:10.2f} us"
+        if name in baseline:
+            change = micros / baseline[name] - 1
+            regressed = change > args.tolerance
+            failed = failed or regressed
+            line += f"  {change:+7.1%} vs baseline{'  REGRESSION' if regressed else ''}"
+        print(line)
+
+    if args.update:
+        with open(args.baseline, 'w') as f:
+            json.dump({
+                'machine': f"{platform.machine()} {platform.processor() or platform.system()}",
+                'python': platform.python_version(),
+                'calls': args.calls,
+                'repeats': args.repeats,
+                'cases': results,
+            }, f, indent=2)
+            f.write("\n")
+        print(f"Wrote {args.baseline}")
+    return 1 if failed else 0
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,82 @@
+"""
+Cold start benchmark. Imports each headless module in a fresh interpreter, reports the
+best time over several runs and fails if one goes over IMPORT_BUDGET_MS or pulls in Qt,
+qdarktheme or NumPy. With PySide6 installed it also times importing main.py and
+building the dark stylesheet against GUI_BUDGET_MS.
+
+    python benchmarks/startupBench.py --runs 5
+"""
+import os
+import sys
+import json
+import argparse
+import subprocess
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# Modules used by headless tools (simulations, the top card fit, AI workers)
+HEADLESS_MODULES = [
+    'palaceRules', 'palaceProtocol', 'palaceTrace', 'palaceEval', 'palaceTracker',
+    'palaceEndgame', 'palaceAI', 'palaceSim',
+]
+# Modules a headless import must not load
+HEAVY_MODULES = ['PySide6', 'qdarktheme', 'numpy']
+
+IMPORT_BUDGET_MS = 100
+GUI_BUDGET_MS = 1500
+
+PROBE = """
+import sys, time, json
+start = time.perf_counter()
+{code}
+elapsed = (time.perf_counter() - start) * 1000
+print(json.dumps({{'ms': elapsed, 'loaded': [name for name in {heavy!r} if name in sys.modules]}}))
+"""
+
+def coldRun(code, runs):
+    """
+    Best time in ms of running code in a fresh interpreter, and the heavy modules it loaded.
+    """
+    best = None
+    for _ in range(runs):
+        result = subprocess.run(
+            [sys.executable, '-c', PROBE.format(code=code, heavy=HEAVY_MODULES)],
+            cwd=ROOT, capture_output=True, text=True,
+        )
+        if result.returncode:
+            raise RuntimeError(result.stderr.strip().splitlines()[-1])
+        sample = json.loads(result.stdout.strip().splitlines()[-1])
+        if best is None or sample['ms'] < best['ms']:
+            best = sample
+    return best
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Measure cold import times against the startup budget.")
+    parser.add_argument('--runs', type=int, default=5, help="fresh interpreters per measurement")
+    args = parser.parse_args(argv)
+
+    failed = False
+    for module in HEADLESS_MODULES:
+        sample = coldRun(f"import {module}", args.runs)
+        problems = []
+        if sample['ms'] > IMPORT_BUDGET_MS:
+            problems.append(f"over {IMPORT_BUDGET_MS} ms")
+        if sample['loaded']:
+            problems.append("loads " + ", ".join(sample['loaded']))
+        failed = failed or bool(problems)
+        print(f"{module:<16} {sample['ms']:7.1f} ms  {'; '.join(problems) or 'ok'}")
+
+    try:
+        import PySide6  # noqa: F401
+    except ImportError:
+        print("PySide6 is not installed, skipping the GUI measurements")
+    else:
+        for name, code in (("main", "import main"), ("main + theme", "import main\nmain.darkStyleSheet()")):
+            sample = coldRun(code, args.runs)
+            over = sample['ms'] > GUI_BUDGET_MS
+            failed = failed or over
+            print(f"{name:<16} {sample['ms']:7.1f} ms  {f'over {GUI_BUDGET_MS} ms' if over else 'ok'}")
+    return 1 if failed else 0
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,83 @@
+"""
+Build the display size card images read by palaceAssets, and optionally the resource bundle.
+
+    python buildAssets.py [--bundle]
+
+Every card image in palaceData/cards is scaled to fit CARD_WIDTH x CARD_HEIGHT, at 1x
+and 2x pixel density, and saved as 8-bit RGBA to palaceData/cards/{CARD_WIDTH}x{CARD_HEIGHT}/.
+Rerun it after changing the cards or the card size; missing variants are scaled from
+the source images at runtime instead.
+
+--bundle also compiles the window icon and every card image into palaceData.rcc with
+Qt's rcc. palaceAssets serves all assets from the bundle when it is present, so rebuild
+or delete it after changing anything in palaceData.
+"""
+import os
+import sys
+import argparse
+import subprocess
+import tempfile
+from PySide6.QtGui import QImage
+from palaceAssets import (
+    ASSET_DIR, BUNDLE_PATH, SCALED_DIR, SCALES, cardNames, filePath, scaledPath, scaleImage, sourcePath,
+)
+
+def buildVariants(force):
+    os.makedirs(filePath(SCALED_DIR), exist_ok=True)
+    sourceBytes = scaledBytes = written = 0
+    for name in cardNames():
+        source = filePath(sourcePath(name))
+        sourceBytes += os.path.getsize(source)
+        image = None
+        for scale in SCALES:
+            path = filePath(scaledPath(name, scale))
+            if force or not os.path.exists(path) or os.path.getmtime(path) < os.path.getmtime(source):
+                if image is None:
+                    image = QImage(source)
+                    if image.isNull():
+                        raise OSError(f"Could not read {source}")
+                if not scaleImage(image, scale).save(path, 'PNG'):
+                    raise OSError(f"Could not write {path}")
+                written += 1
+            if scale == 1:
+                scaledBytes += os.path.getsize(path)
+    print(f"Wrote {written} images to {filePath(SCALED_DIR)}")
+    print(f"Display size images: {scaledBytes / 1024:.0f} KiB, down from {sourceBytes / 1024:.0f} KiB")
+
+def buildBundle(output):
+    """
+    Compile the assets the app loads into a binary Qt resource bundle at output.
+    """
+    assets = ["palaceIcon.ico"]
+    for name in cardNames():
+        assets.append(sourcePath(name))
+        assets.extend(scaledPath(name, scale) for scale in SCALES)
+    entries = "\n".join(f'        <file>{asset}</file>' for asset in assets)
+    qrc = f'<!DOCTYPE RCC><RCC version="1.0">\n    <qresource prefix="/palaceData">\n{entries}\n    </qresource>\n</RCC>\n'
+    # rcc resolves the listed files relative to the .qrc, so it is written into palaceData
+    with tempfile.NamedTemporaryFile('w', suffix='.qrc', dir=ASSET_DIR, delete=False) as f:
+        f.write(qrc)
+    try:
+        subprocess.run(['pyside6-rcc', '--binary', f.name, '-o', output], check=True)
+    finally:
+        os.remove(f.name)
+    print(f"Bundled {len(assets)} assets into {output} ({os.path.getsize(output) / 1024:.0f} KiB)")
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Build the display size card images.")
+    parser.add_argument('--force', action='store_true', help="rebuild variants that are already up to date")
+    parser.add_argument('--bundle', action='store_true', help="also compile the assets into a Qt resource bundle")
+    parser.add_argument('--output', default=BUNDLE_PATH, help="where to write the bundle")
+    args = parser.parse_args(argv)
+
+    try:
+        buildVariants(args.force)
+        if args.bundle:
+            buildBundle(args.output)
+    except (OSError, subprocess.CalledProcessError) as e:
+        print(e)
+        return 1
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
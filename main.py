@@ -1,27 +1,32 @@
+import os
 import sys
 import socket
 import threading
 import random
 import json
+import time
+import queue
+import hashlib
+import tempfile
+import itertools
+import importlib.util
+from functools import partial
+from operator import attrgetter
 from PySide6.QtWidgets import (
     QApplication, QWidget, QVBoxLayout, QHBoxLayout, QLabel, QPushButton, QLineEdit,\
-    QTextEdit, QGridLayout, QSpacerItem, QSizePolicy, QDialog, QMessageBox)
-from PySide6.QtGui import QPixmap, QIcon, QTransform, QPainter
-from PySide6.QtCore import Qt, QRect, QObject, Signal, QTimer, QMetaObject, Slot, Q_ARG
-import qdarktheme
-
-# Dark Mode Styling
-Dark = qdarktheme.load_stylesheet(
-    theme="dark",
-    custom_colors={
-        "[dark]": {
-            "primary": "#0078D4",
-            "background": "#202124",
-            "border": "#8A8A8A",
-            "background>popup": "#252626",
-        }
-    },
-) + """
+    QTextEdit, QGridLayout, QSpacerItem, QSizePolicy, QDialog, QMessageBox, QComboBox)
+from PySide6.QtGui import QPixmap, QTransform, QPainter, QColor, QPen
+from PySide6.QtCore import Qt, QEvent, QRect, QRectF, QPointF, QObject, Signal, QTimer, QMetaObject, Slot, Q_ARG, QStandardPaths
+from palaceTrace import TurnLatencyTracer
+from palaceProtocol import ActionDispatcher, ProtocolError, coalesceBarrier, coalesceKey
+from palaceRules import RANKS, RANK_INDEX, isCardPlayable, newDeck, tableChecksum
+from palaceTable import Deck, TableState, sharedCard
+from palaceAI import AI_DIFFICULTIES, PARALLEL_DIFFICULTIES, bestTopCards, chooseMove, chooseTopCards, shutdownSearchPool, warmSearchPool
+from palaceTracker import CardTracker
+from palaceAssets import CARD_WIDTH, CARD_HEIGHT, CardPreloader, cardName, cardPixmap, windowIcon
+
+# Dark Mode Styling: the app's overrides on top of qdarktheme's dark theme
+DARK_OVERRIDES = """
     QMessageBox QLabel {
         color: #E4E7EB;
     }
@@ -52,7 +57,95 @@ Dark = qdarktheme.load_stylesheet(
         border: 1px solid #3B3B3B;
         color: #FFFFFF;   
     }
+    QLabel#title {
+        font-size: 36px;
+        font-weight: bold;
+    }
+    QLabel#placeholder {
+        border: 2px dashed gray;
+        background-color: transparent;
+    }
+    QLabel#cardBack {
+        border: 0px solid black;
+        background-color: transparent;
+    }
+    QLabel#handCard {
+        border: 2px solid transparent;
+        background-color: transparent;
+    }
+    QLabel#handCard[borderless="true"] {
+        border: 0px solid black;
+    }
+    QLabel#handCard[selected="true"] {
+        border: 2px solid blue;
+    }
+    QPushButton#leaveButton {
+        background-color: red;
+        color: white;
+    }
+    QPushButton#leaveButton:hover {
+        background-color: #FF6666;
+        color: lightgray;
+    }
 """
+DARK_THEME_COLORS = {
+    "[dark]": {
+        "primary": "#0078D4",
+        "background": "#202124",
+        "border": "#8A8A8A",
+        "background>popup": "#252626",
+    }
+}
+_darkStyleSheet = None
+
+def qdarkthemeVersion():
+    """
+    Identifies the installed qdarktheme by its package file, so a cached stylesheet can
+    be used without importing it.
+    """
+    spec = importlib.util.find_spec('qdarktheme')
+    if spec is None or spec.origin is None:
+        raise ImportError("qdarktheme is not installed")
+    return f"{spec.origin}:{os.stat(spec.origin).st_mtime_ns}"
+
+def styleSheetCachePath(key):
+    directory = QStandardPaths.writableLocation(QStandardPaths.StandardLocation.CacheLocation) or tempfile.gettempdir()
+    return os.path.join(directory, 'stylesheets', f'dark-{key}.qss')
+
+def darkStyleSheet():
+    """
+    The app's stylesheet, built the first time a window needs it. Generating qdarktheme's
+    stylesheet is the slowest part of startup, so the result is cached on disk under a
+    key of the installed qdarktheme, theme colors and overrides, and only regenerated
+    (and qdarktheme only imported) when one of them changes.
+    """
+    global _darkStyleSheet
+    if _darkStyleSheet is None:
+        key = hashlib.sha1(json.dumps([qdarkthemeVersion(), "dark", DARK_THEME_COLORS, DARK_OVERRIDES]).encode()).hexdigest()[:16]
+        path = styleSheetCachePath(key)
+        try:
+            with open(path, encoding='utf-8') as f:
+                _darkStyleSheet = f.read()
+        except OSError:
+            import qdarktheme
+            _darkStyleSheet = qdarktheme.load_stylesheet(theme="dark", custom_colors=DARK_THEME_COLORS) + DARK_OVERRIDES
+            try:
+                os.makedirs(os.path.dirname(path), exist_ok=True)
+                with open(path + '.tmp', 'w', encoding='utf-8') as f:
+                    f.write(_darkStyleSheet)
+                os.replace(path + '.tmp', path)
+            except OSError as e:
+                print(f"Could not cache the stylesheet: {e}")
+    return _darkStyleSheet
+
+def repolish(widget):
+    """
+    Re-apply the stylesheet to a widget after one of the properties its rules match on changed.
+    Polishing alone keeps a frame's old border width, so it also gets a StyleChange event.
+    """
+    widget.style().unpolish(widget)
+    widget.style().polish(widget)
+    QApplication.sendEvent(widget, QEvent(QEvent.Type.StyleChange))
 
 def centerDialog(dialog, parent, name=None):
     offset = 0
@@ -92,14 +185,94 @@ def centerDialog(dialog, parent, name=None):
     newY = parentCenterY - dialogCenterY - offset
     dialog.move(newX, newY)
 
-# Constants for card dimensions
-CARD_WIDTH = 56
-CARD_HEIGHT = 84
+# Constants for card button dimensions (card dimensions are in palaceAssets)
 BUTTON_WIDTH = 66
 BUTTON_HEIGHT = 87
 
-RANKS = {'3': 2, '4': 3, '5': 4, '6': 5, '8': 6, '9': 7, 'J': 8, 'Q': 9, '7': 10, 'K': 11, 'A': 12, '2': 13, '10': 14}
-VALUES = {'2': 2, '3': 3, '4': 4, '5': 5, '6': 6, '7': 7, '8': 8, '9': 9, '10': 10, 'J': 11, 'Q': 12, 'K': 13, 'A': 14}
+# "widgets" lays the table out with one QLabel per card, "canvas" paints it on a TableCanvas
+RENDER_MODE = os.environ.get("PALACE_RENDER_MODE", "widgets")
+
+
+class GuiMarshaller(QObject):
+    """
+    Delivers updates posted from network threads to the GUI thread.
+    Posts are queued and applied together at most once per frame; a post sharing a
+    coalesce key with a pending one replaces it in its place in the queue, so only the
+    latest value of a piece of state is applied. Nothing is replaced across a barrier
+    post, so everything queued before a barrier is applied before it.
+    """
+    flushRequested = Signal()
+
+    FRAME_INTERVAL_MS = 16
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self.lock = threading.Lock()
+        self.pending = {}
+        self.sequence = itertools.count()
+        # Bumped by every barrier post; keys only coalesce within one epoch
+        self.epoch = 0
+        self.scheduled = False
+        self.lastFlush = 0.0
+        self.flushRequested.connect(self.scheduleFlush, Qt.ConnectionType.QueuedConnection)
+
+    def post(self, callback, *args, key=None, barrier=False):
+        """
+        Queue callback(*args) to run on the GUI thread. Safe to call from any thread.
+        """
+        with self.lock:
+            if key is None:
+                key = ('ordered', next(self.sequence))
+            else:
+                key = ('coalesced', self.epoch, key)
+            self.pending[key] = (callback, args)
+            if barrier:
+                self.epoch += 1
+            if self.scheduled:
+                return
+            self.scheduled = True
+        self.flushRequested.emit()
+
+    @Slot()
+    def scheduleFlush(self):
+        elapsed = (time.monotonic() - self.lastFlush) * 1000
+        QTimer.singleShot(max(0, int(self.FRAME_INTERVAL_MS - elapsed)), self.flush)
+
+    @Slot()
+    def flush(self):
+        with self.lock:
+            pending = self.pending
+            self.pending = {}
+            self.scheduled = False
+        self.lastFlush = time.monotonic()
+        for callback, args in pending.values():
+            try:
+                callback(*args)
+            except Exception as e:
+                print(f"Error applying network update: {e}")
+
+class CardLabel(QLabel):
+    """
+    A card in the player's hand that can be highlighted as selected. Its border comes
+    from the QLabel#handCard rules in the app stylesheet, keyed on the selected and
+    borderless properties.
+    """
+    def __init__(self, *args):
+        super().__init__(*args)
+        self.setObjectName("handCard")
+        self.setProperty("selected", False)
+        self.setProperty("borderless", False)
+
+    def setSelected(self, selected, borderless=False):
+        """
+        borderless drops the transparent border of an unselected card, as the main game
+        does when a card is deselected.
+        """
+        borderless = borderless and not selected
+        if self.property("selected") != selected or self.property("borderless") != borderless:
+            self.setProperty("selected", selected)
+            self.setProperty("borderless", borderless)
+            repolish(self)
 
 class GameOverDialog(QDialog):
     playAgainSignal = Signal()
@@ -111,7 +284,7 @@ class GameOverDialog(QDialog):
         self.numPlayers = numPlayers
         playAgainCount = 0
         self.setWindowTitle("Game Over")
-        self.setWindowIcon(QIcon(r"palaceData\palaceIcon.ico"))
+        self.setWindowIcon(windowIcon())
         self.setGeometry(805, 350, 300, 200)
         layout = QVBoxLayout()
         label = QLabel(f"Game Over! Player {winnerName} wins!")
@@ -157,16 +330,19 @@ class HomeMenu(QWidget):
     def __init__(self):
         super().__init__()
         self.initUI()
+        # Decode the card images while the menus are up, so the first deal reads nothing from disk
+        self.cardPreloader = CardPreloader(self)
+        self.cardPreloader.start()
 
     def initUI(self):
         self.setWindowTitle("Palace")
-        self.setWindowIcon(QIcon(r"palaceData\palaceIcon.ico"))
+        self.setWindowIcon(windowIcon())
         self.setGeometry(660, 215, 600, 500)
         layout = QVBoxLayout()
 
         title = QLabel("Palace")
         title.setAlignment(Qt.AlignmentFlag.AlignCenter)
-        title.setStyleSheet("font-size: 36px; font-weight: bold;")
+        title.setObjectName("title")
         layout.addWidget(title)
 
         buttonLayout = QVBoxLayout()
@@ -177,7 +353,7 @@ class HomeMenu(QWidget):
         playButton = QPushButton("Play")
         playButton.setFixedHeight(40)
         playButton.setFixedWidth(275)
-        # playButton.clicked.connect(self.playLocalGame)
+        playButton.clicked.connect(self.playLocalGame)
         buttonLayout.addWidget(playButton, alignment=Qt.AlignmentFlag.AlignCenter)
 
         buttonLayout.addWidget(QLabel(""))
@@ -206,6 +382,11 @@ class HomeMenu(QWidget):
         layout.addLayout(buttonLayout)
         self.setLayout(layout)
 
+    def playLocalGame(self):
+        self.hide()
+        self.offlineMenu = OfflineMenu(self)
+        self.offlineMenu.show()
+
     def showOnlineMenu(self):
         self.hide()
         self.onlineMenu = OnlineMenu(self)
@@ -221,6 +402,52 @@ class HomeMenu(QWidget):
             self.onlineMenu.close()
         super().closeEvent(event)
     
+### Offline Menu ###
+class OfflineMenu(QDialog):
+    def __init__(self, parent):
+        super().__init__()
+        self.parent = parent
+        self.initUI()
+        centerDialog(self, parent, "playerSelectionDialog")
+
+    def initUI(self):
+        self.setWindowTitle("Play Offline")
+        self.setWindowIcon(windowIcon())
+        self.setGeometry(700, 300, 300, 200)
+        layout = QVBoxLayout()
+
+        layout.addWidget(QLabel("Number of Players:"))
+        self.playerCountBox = QComboBox()
+        self.playerCountBox.addItems(["2", "3", "4"])
+        layout.addWidget(self.playerCountBox)
+
+        layout.addWidget(QLabel("AI Difficulty:"))
+        self.difficultyBox = QComboBox()
+        self.difficultyBox.addItems(AI_DIFFICULTIES)
+        self.difficultyBox.setCurrentText("Medium")
+        layout.addWidget(self.difficultyBox)
+
+        buttonBox = QHBoxLayout()
+        okButton = QPushButton("OK")
+        okButton.clicked.connect(self.startGame)
+        backButton = QPushButton("Back")
+        backButton.clicked.connect(self.goBack)
+        buttonBox.addWidget(okButton)
+        buttonBox.addWidget(backButton)
+        layout.addLayout(buttonBox)
+
+        self.setLayout(layout)
+
+    def startGame(self):
+        self.hide()
+        numPlayers = int(self.playerCountBox.currentText())
+        self.parent.localGame = OfflineGameView(self.parent, numPlayers, self.difficultyBox.currentText(), self.geometry())
+        self.parent.localGame.startGame()
+
+    def goBack(self):
+        self.hide()
+        self.parent.show()
+
 ### Online Menu ###
 class OnlineMenu(QWidget):
     def __init__(self, parent):
@@ -231,7 +458,7 @@ class OnlineMenu(QWidget):
 
     def initUI(self):
         self.setWindowTitle("Online Menu")
-        self.setWindowIcon(QIcon(r"palaceData\palaceIcon.ico"))
+        self.setWindowIcon(windowIcon())
         self.setGeometry(700, 300, 400, 300)
         layout = QVBoxLayout()
 
@@ -266,11 +493,21 @@ class OnlineMenu(QWidget):
 ### Host Lobby ###
 class HostLobby(QDialog):
     updateOtherPlayerHandSignal = Signal(int, list, list, list)
+
+    # Game state messages passed on unchanged to the other clients. They are relayed as
+    # they arrive, on the client's socket thread, so only the host's own GUI coalesces them.
+    RELAYED_ACTIONS = {
+        'updateCards', 'updateCurrentPlayer', 'updatePlayAgainCount', 'updateDeck', 'drawCards',
+        'updatePile', 'updatePileLabel', 'sevenSwitch',
+    }
+    PORT = 12345
     
-    def __init__(self, mainMenu, onlineMenu):
+    def __init__(self, mainMenu, onlineMenu, port=PORT):
         super().__init__()
         self.parent = onlineMenu
         self.mainMenu = mainMenu
+        # Port 0 picks a free port (benchmarks/loadTest.py runs many lobbies at once)
+        self.port = port
         self.server = None
         self.hostGameView = None
         self.clients = {}  # Map client sockets to indices
@@ -280,13 +517,34 @@ class HostLobby(QDialog):
         self.playerNicknames = {}
         self.gameOverDialog = None
         self.hostController = None
+        self.tracer = TurnLatencyTracer(origin=1)
+        # Client sockets are written from the GUI thread and every client's socket thread
+        self.sendLock = threading.Lock()
+        self.marshaller = GuiMarshaller(self)
+        self.dispatcher = ActionDispatcher({
+            'join': self.handleJoin,
+            'updateCards': self.handleUpdateCards,
+            'confirmedTopCards': self.handleConfirmedTopCards,
+            'startMainGame': self.handleStartMainGame,
+            'startNewGame': self.handleStartNewGame,
+            'updateCurrentPlayer': self.handleUpdateCurrentPlayer,
+            'gameOver': self.handleGameOver,
+            'updatePlayAgainCount': self.handleUpdatePlayAgainCount,
+            'updateDeck': self.handleUpdateDeck,
+            'drawCards': self.handleDrawCards,
+            'updatePile': self.handleUpdatePile,
+            'updatePileLabel': self.handleUpdatePileLabel,
+            'sevenSwitch': self.handleSevenSwitch,
+            'playerDisconnected': self.handlePlayerDisconnected,
+            'leaveLobby': self.handleLeaveLobby,
+        })
         self.initUI()
         centerDialog(self, self.parent, "hostLobby")
         self.startServer()
         
     def initUI(self):
         self.setWindowTitle("Hosting Lobby")
-        self.setWindowIcon(QIcon(r"palaceData\palaceIcon.ico"))
+        self.setWindowIcon(windowIcon())
         self.setGeometry(700, 300, 400, 300)
         layout = QVBoxLayout()
         
@@ -320,11 +578,12 @@ class HostLobby(QDialog):
             if self.server:
                 self.shutdownServer()  # Ensure the previous server is closed properly
             self.server = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
-            self.server.bind(("0.0.0.0", 12345))
+            self.server.bind(("0.0.0.0", self.port))
+            self.port = self.server.getsockname()[1]
             hostIP = socket.gethostbyname(socket.gethostname())
             self.server.listen(4)
             QMetaObject.invokeMethod(self.logText, "append", Qt.ConnectionType.QueuedConnection,
-                         Q_ARG(str, f"Server started on {hostIP}, port 12345."))
+                         Q_ARG(str, f"Server started on {hostIP}, port {self.port}."))
             threading.Thread(target=self.acceptConnections, daemon=True).start()
         except OSError as e:
             if e.errno == 10048:
@@ -344,7 +603,7 @@ class HostLobby(QDialog):
                     # Notify the client of their player index
                     indexData = json.dumps({"action": "setIndex", "index": index}) + "\n"
                     clientSocket.send(indexData.encode())
-                    self.updatePlayerCount()
+                    self.marshaller.post(self.updatePlayerCount, key='updatePlayerCount')
                     threading.Thread(target=self.handleClient, args=(clientSocket, addr), daemon=True).start()
                 else:
                     clientSocket.send(b"Lobby full.\n")
@@ -368,101 +627,19 @@ class HostLobby(QDialog):
                     json_message, buffer = buffer.split("\n", 1)  # Split by delimiter
                     try:
                         print(f"received from Player {index}: {json_message}")
+                        recvTime = time.time()
                         data = json.loads(json_message)  # Parse JSON
-                        if data['action'] == 'join':
-                            nickname = data.get('nickname', f"Player {index}")
-                            if nickname != "":
-                                QMetaObject.invokeMethod(self.logText, "append", Qt.ConnectionType.QueuedConnection,
-                                    Q_ARG(str, f"Player {index} joined with nickname: {nickname}"))
-                                self.broadcastToClients('updateLog', {'log': f"Player {index} connected from {addr}.\nPlayer {index} joined with nickname: {nickname}"}, exclude=clientSocket)
-                                self.playerNicknames[str(index)] = nickname
-                            else:
-                                QMetaObject.invokeMethod(self.logText, "append", Qt.ConnectionType.QueuedConnection,
-                                    Q_ARG(str, f"Player {index} joined"))
-                        elif data['action'] == 'updateCards':
-                            playerIndex = data['playerIndex']
-                            handCards = data['handCards']
-                            topCards = data['topCards']
-                            bottomCards = data['bottomCards']
-                            self.hostController.updateOtherPlayerHand(playerIndex, handCards, topCards, bottomCards)
-                            self.broadcastToClients('updateCards', data, exclude=clientSocket)
-                        elif data['action'] == 'confirmedTopCards':
-                            self.hostController.topCardConfirms += 1
-                            self.hostController.checkAllPlayersConfirmed()
-                        elif data['action'] == 'startMainGame':
-                            self.hostController.startMainGame(data['lowestPlayer'])
-                            self.broadcastToClients('startMainGame', data)
-                        elif data['action'] == 'startNewGame':
-                            self.startNewGame()
-                            self.broadcastToClients('startNewGame', data)
-                        elif data['action'] == 'updateCurrentPlayer':
-                            self.hostController.currentPlayer = data['currentPlayer']
-                            self.hostGameView.updateCurrentPlayer(data['currentPlayer'])
-                            self.broadcastToClients('updateCurrentPlayer', data, exclude=clientSocket)
-                        elif data['action'] == 'gameOver':
-                            self.broadcastToClients('gameEnd', {'winner': data['winner']})
-                            QMetaObject.invokeMethod(self, "showGameOverDialog", Qt.ConnectionType.QueuedConnection,
-                                Q_ARG(int, data['winner']))
-                        elif data['action'] == 'updatePlayAgainCount':
-                            self.playAgainCount = data['playAgainCount']
-                            self.gameOverDialog.updateCounter(data['playAgainCount'])
-                            self.broadcastToClients('updatePlayAgainCount', data, exclude=clientSocket)
-                        elif data['action'] == 'updateDeck':
-                            self.hostController.deck = data['deck']
-                            self.hostGameView.updateDeck(data['deck'])
-                            self.broadcastToClients('updateDeck', data, exclude=clientSocket)
-                        elif data['action'] == 'updatePile':
-                            self.hostController.pile = data['pile']
-                            self.hostGameView.updatePile(data['pile'])
-                            self.broadcastToClients('updatePile', data, exclude=clientSocket)
-                        elif data['action'] == 'updatePileLabel':
-                            self.hostGameView.updatePileLabel(data['pileLabel'])
-                            self.broadcastToClients('updatePileLabel', data, exclude=clientSocket)
-                        elif data['action'] == 'sevenSwitch':
-                            self.hostController.sevenSwitch = data['sevenSwitch']
-                            self.broadcastToClients('sevenSwitch', data, exclude=clientSocket)
-                        elif data['action'] == 'playerDisconnected':
-                            del self.clients[clientSocket]
-                            try:
-                                clientSocket.close()  # Ensure the socket is properly closed
-                            except Exception as e:
-                                print(f"Error closing client socket: {e}")
-                            if self.hostController.numPlayers == 2:
-                                self.broadcastToClients('gameClose', {})
-                                QMetaObject.invokeMethod(self.hostGameView, "returnToMainMenu", Qt.ConnectionType.QueuedConnection)
-                                self.shutdownServer()
-                            elif self.hostController.numPlayers == 3:
-                                self.numPlayers -= 1
-                                self.hostController.numPlayers = self.numPlayers
-                                allPlayers = [1, 2, 3, 4]
-                                remainingPlayers = [p for p in allPlayers if p != index]
-                                self.hostGameView.switchToTwoPlayerLayout(remainingPlayers)
-                                self.broadcastToClients('switchToTwoPlayerLayout', {'remainingPlayers': remainingPlayers})
-                            elif self.hostController.numPlayers == 4:
-                                self.numPlayers -= 1
-                                self.hostController.numPlayers = self.numPlayers
-                                allPlayers = [1, 2, 3, 4]
-                                remainingPlayers = [p for p in allPlayers if p != index]
-                                self.hostGameView.switchToThreePlayerLayout(remainingPlayers)
-                                self.broadcastToClients('switchToThreePlayerLayout', {'remainingPlayers': remainingPlayers})
-                        elif data['action'] == 'leaveLobby':
-                            del self.clients[clientSocket]
-                            try:
-                                clientSocket.close()  # Ensure the socket is properly closed
-                            except Exception as e:
-                                print(f"Error closing client socket: {e}")
-                            self.numPlayers -= 1
-                            self.gameOverDialog.numPlayers = self.numPlayers
-                            if self.numPlayers == 1:
-                                QMetaObject.invokeMethod(self.gameOverDialog, "close", Qt.ConnectionType.QueuedConnection)
-                                QMetaObject.invokeMethod(self.hostGameView, "returnToMainMenu", Qt.ConnectionType.QueuedConnection)
-                                self.shutdownServer()
-                            self.gameOverDialog.updateCounter(self.playAgainCount)
-                            self.broadcastToClients('updateNumPlayersLobby', {}, exclude=clientSocket)
-                            self.checkAllPlayersPlayAgain()
+                        trace = self.tracer.markReceived(data, recvTime)
+                        handler = self.dispatcher.resolve(data)
+                        if data['action'] in self.RELAYED_ACTIONS:
+                            self.broadcastToClients(data['action'], data, exclude=clientSocket)
+                        self.marshaller.post(self.applyMessage, handler, data, trace, recvTime, clientSocket, index, addr,
+                            key=coalesceKey(data), barrier=coalesceBarrier(data))
                     except json.JSONDecodeError:
                         print(f"Received invalid data from Player {index}: {message}")
                         break
+                    except ProtocolError as e:
+                        print(f"Ignored message from Player {index}: {e}")
         except Exception as e:
             print(f"Player {index} disconnected: {e}")
         finally:
@@ -477,8 +654,119 @@ class HostLobby(QDialog):
                 self.broadcastToClients('updateLog', {'log': f"Player {index} disconnected"})
             self.nextIndex -= 1
             self.reassignIndices()
-            self.updatePlayerCount()
+            self.marshaller.post(self.updatePlayerCount, key='updatePlayerCount')
             clientSocket.close()
+
+    def applyMessage(self, handler, data, trace, recvTime, *args):
+        """
+        Run a client message's handler on the GUI thread.
+        """
+        handler(data, *args)
+        self.tracer.record(data['action'], trace, recvTime, time.time())
+
+    def handleJoin(self, data, clientSocket, index, addr):
+        nickname = data.get('nickname', f"Player {index}")
+        if nickname != "":
+            QMetaObject.invokeMethod(self.logText, "append", Qt.ConnectionType.QueuedConnection,
+                Q_ARG(str, f"Player {index} joined with nickname: {nickname}"))
+            self.broadcastToClients('updateLog', {'log': f"Player {index} connected from {addr}.\nPlayer {index} joined with nickname: {nickname}"}, exclude=clientSocket)
+            self.playerNicknames[str(index)] = nickname
+        else:
+            QMetaObject.invokeMethod(self.logText, "append", Qt.ConnectionType.QueuedConnection,
+                Q_ARG(str, f"Player {index} joined"))
+
+    def handleUpdateCards(self, data, clientSocket, index, addr):
+        playerIndex = data['playerIndex']
+        handCards = data['handCards']
+        topCards = data['topCards']
+        bottomCards = data['bottomCards']
+        self.hostController.updateOtherPlayerHand(playerIndex, handCards, topCards, bottomCards)
+
+    def handleConfirmedTopCards(self, data, clientSocket, index, addr):
+        self.hostController.topCardConfirms += 1
+        self.hostController.checkAllPlayersConfirmed()
+
+    def handleStartMainGame(self, data, clientSocket, index, addr):
+        self.hostController.startMainGame(data['lowestPlayer'])
+        self.broadcastToClients('startMainGame', data)
+
+    def handleStartNewGame(self, data, clientSocket, index, addr):
+        self.startNewGame()
+        self.broadcastToClients('startNewGame', data)
+
+    def handleUpdateCurrentPlayer(self, data, clientSocket, index, addr):
+        self.hostController.currentPlayer = data['currentPlayer']
+        self.hostController.verifyChecksum(data['checksum'])
+        self.hostGameView.updateCurrentPlayer(data['currentPlayer'])
+
+    def handleGameOver(self, data, clientSocket, index, addr):
+        self.broadcastToClients('gameEnd', {'winner': data['winner']})
+        QMetaObject.invokeMethod(self, "showGameOverDialog", Qt.ConnectionType.QueuedConnection,
+            Q_ARG(int, data['winner']))
+
+    def handleUpdatePlayAgainCount(self, data, clientSocket, index, addr):
+        self.playAgainCount = data['playAgainCount']
+        self.gameOverDialog.updateCounter(data['playAgainCount'])
+
+    def handleUpdateDeck(self, data, clientSocket, index, addr):
+        self.hostController.deck = data['deck']
+        self.hostGameView.updateDeck(data['deck'])
+
+    def handleDrawCards(self, data, clientSocket, index, addr):
+        self.hostController.deck.draw(data['count'])
+        self.hostGameView.updateDeck(self.hostController.deck)
+
+    def handleUpdatePile(self, data, clientSocket, index, addr):
+        self.hostController.pile = data['pile']
+        self.hostGameView.updatePile(data['pile'])
+
+    def handleUpdatePileLabel(self, data, clientSocket, index, addr):
+        self.hostGameView.updatePileLabel(data['pileLabel'])
+
+    def handleSevenSwitch(self, data, clientSocket, index, addr):
+        self.hostController.sevenSwitch = data['sevenSwitch']
+
+    def handlePlayerDisconnected(self, data, clientSocket, index, addr):
+        # The client's socket thread has usually dropped it already
+        self.clients.pop(clientSocket, None)
+        try:
+            clientSocket.close()  # Ensure the socket is properly closed
+        except Exception as e:
+            print(f"Error closing client socket: {e}")
+        if self.hostController.numPlayers == 2:
+            self.broadcastToClients('gameClose', {})
+            QMetaObject.invokeMethod(self.hostGameView, "returnToMainMenu", Qt.ConnectionType.QueuedConnection)
+            self.shutdownServer()
+        elif self.hostController.numPlayers == 3:
+            self.numPlayers -= 1
+            self.hostController.numPlayers = self.numPlayers
+            allPlayers = [1, 2, 3, 4]
+            remainingPlayers = [p for p in allPlayers if p != index]
+            self.hostGameView.switchToTwoPlayerLayout(remainingPlayers)
+            self.broadcastToClients('switchToTwoPlayerLayout', {'remainingPlayers': remainingPlayers})
+        elif self.hostController.numPlayers == 4:
+            self.numPlayers -= 1
+            self.hostController.numPlayers = self.numPlayers
+            allPlayers = [1, 2, 3, 4]
+            remainingPlayers = [p for p in allPlayers if p != index]
+            self.hostGameView.switchToThreePlayerLayout(remainingPlayers)
+            self.broadcastToClients('switchToThreePlayerLayout', {'remainingPlayers': remainingPlayers})
+
+    def handleLeaveLobby(self, data, clientSocket, index, addr):
+        self.clients.pop(clientSocket, None)
+        try:
+            clientSocket.close()  # Ensure the socket is properly closed
+        except Exception as e:
+            print(f"Error closing client socket: {e}")
+        self.numPlayers -= 1
+        self.gameOverDialog.numPlayers = self.numPlayers
+        if self.numPlayers == 1:
+            QMetaObject.invokeMethod(self.gameOverDialog, "close", Qt.ConnectionType.QueuedConnection)
+            QMetaObject.invokeMethod(self.hostGameView, "returnToMainMenu", Qt.ConnectionType.QueuedConnection)
+            self.shutdownServer()
+        self.gameOverDialog.updateCounter(self.playAgainCount)
+        self.broadcastToClients('updateNumPlayersLobby', {}, exclude=clientSocket)
+        self.checkAllPlayersPlayAgain()
     
     @Slot()
     def handleHostDisconnect(self):
@@ -567,12 +855,18 @@ class HostLobby(QDialog):
         self.startButton.setEnabled(count > 1)  # Enabled only if 2+ players
     
     def broadcastToClients(self, action, data, exclude=None):
-        message = json.dumps({"action": action, **data}) + "\n"
+        if 'trace' in data:
+            # Relayed message: keep the sender's trace and stamp the relay time
+            self.tracer.markRelayed(data)
+            message = json.dumps({"action": action, **data}) + "\n"
+        else:
+            message = self.tracer.encode(action, data)
         current_clients = list(self.clients.keys())
         for clientSocket in current_clients:
             if clientSocket != exclude:
                 try:
-                    clientSocket.send(message.encode())
+                    with self.sendLock:
+                        clientSocket.sendall(message.encode())
                 except Exception as e:
                     QMetaObject.invokeMethod(self.logText, "append", Qt.ConnectionType.QueuedConnection,
                         Q_ARG(str, f"Error broadcasting to client: {e}"))
@@ -582,39 +876,10 @@ class HostLobby(QDialog):
         self.playAgainCount = 0
         if self.nicknameInput.text() != "":
             self.playerNicknames[1] = self.nicknameInput.text()
-        suits = ['hearts', 'diamonds', 'clubs', 'spades']
-        self.deck = [(value, suit, False, False) for value in VALUES.keys() for suit in suits]
-        random.shuffle(self.deck)
-
-        self.players = []
-        playerData = {}
-
-        for i, client in enumerate(list(self.clients.keys()) + [None], start=1):
-            bottomCards = [(card[0], card[1], False, True) for card in self.deck[:3]]
-            hand = [(card[0], card[1], False, False) for card in self.deck[3:9]]
-            self.deck = self.deck[9:]
-            topCards = []
-
-            player = {
-                'bottomCards': bottomCards,
-                'topCards': topCards,
-                'hand': hand
-            }
-            playerData[f'player{i}'] = player
-
-            if client is None:
-                # Assign cards to the host
-                self.hostCards = hand
-
-        # Prepare payload for clients
-        self.numPlayers = len(playerData)
-        data = {
-            'action': 'deckSync',
-            'deck': self.deck,
-            'players': playerData,
-            'numPlayers': self.numPlayers,
-            'nicknames': self.playerNicknames
-        }
+        # The host's controller owns the dealt table; clients rebuild theirs from deckSync
+        self.numPlayers = len(self.clients) + 1
+        table = TableState.deal(newDeck(), self.numPlayers)
+        data = {'action': 'deckSync', **table.deckSyncData(), 'nicknames': self.playerNicknames}
         payload = json.dumps(data) + "\n"
         for client in self.clients.keys():
             try:
@@ -623,26 +888,14 @@ class HostLobby(QDialog):
                 print(f"Error sending data to client: {e}")
 
         print("Deck and player data synced with all players.")
-        print(f"Player Data: {playerData}")
+        print(f"Player Data: {data['players']}")
 
         # Start the host's game view
         self.hide()
-        players = data.get("players", {})
-        playerKey = f'player1'
-        self.hostCards = players.get(playerKey, {}).get('hand', [])
-        self.bottomCards = players.get(playerKey, {}).get('bottomCards', [])
-        self.hostController = GameController(
-            self.deck,
-            1,
-            self.hostCards,
-            self.bottomCards,
-            self.numPlayers,
-            self.broadcastToClients,
-            self.playerNicknames
-        )
+        self.hostController = GameController(table, 1, self.broadcastToClients, self.playerNicknames)
         self.hostController.gameOverSignal.connect(self.showGameOverDialog)
         self.hostController.hostDisconnectedSignal.connect(self.handleHostDisconnect)
-        self.hostGameView = GameView(self.hostController, self.geometry(), self.numPlayers, self.mainMenu)
+        self.hostGameView = createGameView(self.hostController, self.geometry(), self.numPlayers, self.mainMenu)
         self.hostGameView.show()
         self.hostController.startGame()
     
@@ -699,6 +952,31 @@ class JoinLobby(QDialog):
         self.playAgainCount = 0
         self.gameView = None
         self.playerNicknames = {}
+        self.tracer = TurnLatencyTracer()
+        self.marshaller = GuiMarshaller(self)
+        self.dispatcher = ActionDispatcher({
+            'setIndex': self.handleSetIndex,
+            'deckSync': self.handleDeckSync,
+            'updateCards': self.handleUpdateCards,
+            'updateCurrentPlayer': self.handleUpdateCurrentPlayer,
+            'startMainGame': self.handleStartMainGame,
+            'confirmedTopCards': self.handleConfirmedTopCards,
+            'gameOver': self.handleGameOver,
+            'gameEnd': self.handleGameEnd,
+            'updatePlayAgainCount': self.handleUpdatePlayAgainCount,
+            'updateDeck': self.handleUpdateDeck,
+            'drawCards': self.handleDrawCards,
+            'updatePile': self.handleUpdatePile,
+            'updatePileLabel': self.handleUpdatePileLabel,
+            'sevenSwitch': self.handleSevenSwitch,
+            'playerDisconnected': self.handlePlayerDisconnected,
+            'switchToTwoPlayerLayout': self.handleSwitchToTwoPlayerLayout,
+            'switchToThreePlayerLayout': self.handleSwitchToThreePlayerLayout,
+            'gameClose': self.handleGameClose,
+            'updateNumPlayersLobby': self.handleUpdateNumPlayersLobby,
+            'updateLog': self.handleUpdateLog,
+            'shutdownServer': self.handleShutdownServer,
+        })
         self.initUI()
         centerDialog(self, self.parent, "joinLobby")
 
@@ -707,7 +985,7 @@ class JoinLobby(QDialog):
 
     def initUI(self):
         self.setWindowTitle("Join Lobby")
-        self.setWindowIcon(QIcon(r"palaceData\palaceIcon.ico"))
+        self.setWindowIcon(windowIcon())
         self.setGeometry(700, 300, 400, 300)
         layout = QVBoxLayout()
 
@@ -731,16 +1009,7 @@ class JoinLobby(QDialog):
         layout.addWidget(self.joinButton)
         
         self.leaveButton = QPushButton("Leave Server")
-        self.leaveButton.setStyleSheet("""
-            QPushButton {
-                background-color: red;
-                color: white;
-            }
-            QPushButton:hover {
-                background-color: #FF6666;
-                color: lightgray;
-            }
-        """)
+        self.leaveButton.setObjectName("leaveButton")
         self.leaveButton.clicked.connect(self.closeEvent2)
         self.leaveButton.setVisible(False)
         layout.addWidget(self.leaveButton)
@@ -787,86 +1056,123 @@ class JoinLobby(QDialog):
                 while "\n" in buffer:
                     json_message, buffer = buffer.split("\n", 1)  # Split by delimiter
                     try:
+                        recvTime = time.time()
                         data = json.loads(json_message)  # Deserialize JSON
                         print(f"received from server: {data}")
-                        if data["action"] == "setIndex":
-                            self.playerIndex = data["index"]
-                            QMetaObject.invokeMethod(self.logText, "append", Qt.ConnectionType.QueuedConnection,
-                                Q_ARG(str, f"Assigned Player {self.playerIndex}"))
-                        elif data["action"] == "deckSync":
-                            QMetaObject.invokeMethod(self.logText, "append", Qt.ConnectionType.QueuedConnection,
-                                Q_ARG(str, "Deck and player data received."))
-                            self.processDeckSync(data)
-                        elif data['action'] == 'updateCards':
-                            playerIndex = data['playerIndex']
-                            handCards = data['handCards']
-                            topCards = data['topCards']
-                            bottomCards = data['bottomCards']
-                            self.controller.updateOtherPlayerHand(playerIndex, handCards, topCards, bottomCards)
-                        elif data['action'] == 'updateCurrentPlayer':
-                            self.controller.currentPlayer = data['currentPlayer']
-                            self.gameView.updateCurrentPlayer(data['currentPlayer'])
-                        elif data['action'] == 'startMainGame':
-                            lowestPlayer = data['lowestPlayer']
-                            self.controller.clockwise = data['direction']
-                            self.controller.startMainGame(lowestPlayer)
-                        elif data['action'] == 'confirmedTopCards':
-                            self.controller.topCardConfirms += 1
-                            self.controller.checkAllPlayersConfirmed()
-                        elif data['action'] == 'gameOver':
-                            self.broadcastUpdate('gameOver', data)
-                        elif data['action'] == 'gameEnd':
-                            QMetaObject.invokeMethod(self, "showGameOverDialog", Qt.ConnectionType.QueuedConnection,
-                                Q_ARG(int, data['winner']))
-                        elif data['action'] == 'updatePlayAgainCount':
-                            self.playAgainCount = data['playAgainCount']
-                            self.gameOverDialog.updateCounter(data['playAgainCount'])
-                        elif data['action'] == 'updateDeck':
-                            self.controller.deck = data['deck']
-                            self.gameView.updateDeck(data['deck'])
-                        elif data['action'] == 'updatePile':
-                            self.controller.pile = data['pile']
-                            self.gameView.updatePile(data['pile'])
-                        elif data['action'] == 'updatePileLabel':
-                            self.gameView.updatePileLabel(data['pileLabel'])
-                        elif data['action'] == 'sevenSwitch':
-                            self.controller.sevenSwitch = data['sevenSwitch']
-                        elif data['action'] == 'playerDisconnected':
-                            if self.controller.numPlayers == 2:
-                                self.broadcastUpdate('playerDisconnected', {})
-                        elif data['action'] == 'switchToTwoPlayerLayout':
-                            self.numPlayers -= 1
-                            self.controller.numPlayers = self.numPlayers
-                            self.gameView.switchToTwoPlayerLayout(data['remainingPlayers'])
-                        elif data['action'] == 'switchToThreePlayerLayout':
-                            self.numPlayers -= 1
-                            self.controller.numPlayers = self.numPlayers
-                            self.gameView.switchToThreePlayerLayout(data['remainingPlayers'])
-                        elif data['action'] == 'gameClose':
-                            try:
-                                QMetaObject.invokeMethod(self.gameOverDialog, "close", Qt.ConnectionType.QueuedConnection)
-                            except Exception:
-                                pass
-                            QMetaObject.invokeMethod(self.gameView, "returnToMainMenu", Qt.ConnectionType.QueuedConnection)
-                            self.leaveServer()
-                        elif data['action'] == 'updateNumPlayersLobby':
-                            self.numPlayers -= 1
-                            self.gameOverDialog.numPlayers = self.numPlayers
-                            self.gameOverDialog.updateCounter(self.playAgainCount)
-                        elif data['action'] == 'updateLog':
-                            QMetaObject.invokeMethod(self.logText, "append", Qt.ConnectionType.QueuedConnection,
-                                Q_ARG(str, data['log']))
-                        elif data['action'] == 'shutdownServer':
-                            QMetaObject.invokeMethod(self.logText, "append", Qt.ConnectionType.QueuedConnection,
-                                Q_ARG(str, "Server shutdown by host."))
-                            self.leaveButton.hide()
-                            self.joinButton.setDisabled(False)
+                        handler = self.dispatcher.resolve(data)
+                        self.marshaller.post(self.applyMessage, handler, data, recvTime,
+                            key=coalesceKey(data), barrier=coalesceBarrier(data))
                     except Exception as e:
                         print(f"Error processing server message: {e}") 
         except Exception as e:
             print(f"Error in listenToServer: {e}")
         finally:
             print("Exiting listenToServer and closing client socket.")
+
+    def applyMessage(self, handler, data, recvTime):
+        """
+        Run a server message's handler on the GUI thread.
+        """
+        handler(data)
+        self.tracer.record(data['action'], data.get('trace'), recvTime, time.time())
+
+    def handleSetIndex(self, data):
+        self.playerIndex = data["index"]
+        self.tracer.origin = self.playerIndex
+        QMetaObject.invokeMethod(self.logText, "append", Qt.ConnectionType.QueuedConnection,
+            Q_ARG(str, f"Assigned Player {self.playerIndex}"))
+
+    def handleDeckSync(self, data):
+        QMetaObject.invokeMethod(self.logText, "append", Qt.ConnectionType.QueuedConnection,
+            Q_ARG(str, "Deck and player data received."))
+        self.processDeckSync(data)
+
+    def handleUpdateCards(self, data):
+        playerIndex = data['playerIndex']
+        handCards = data['handCards']
+        topCards = data['topCards']
+        bottomCards = data['bottomCards']
+        self.controller.updateOtherPlayerHand(playerIndex, handCards, topCards, bottomCards)
+
+    def handleUpdateCurrentPlayer(self, data):
+        self.controller.currentPlayer = data['currentPlayer']
+        self.controller.verifyChecksum(data['checksum'])
+        self.gameView.updateCurrentPlayer(data['currentPlayer'])
+
+    def handleStartMainGame(self, data):
+        lowestPlayer = data['lowestPlayer']
+        self.controller.clockwise = data['direction']
+        self.controller.startMainGame(lowestPlayer)
+
+    def handleConfirmedTopCards(self, data):
+        self.controller.topCardConfirms += 1
+        self.controller.checkAllPlayersConfirmed()
+
+    def handleGameOver(self, data):
+        self.broadcastUpdate('gameOver', data)
+
+    def handleGameEnd(self, data):
+        QMetaObject.invokeMethod(self, "showGameOverDialog", Qt.ConnectionType.QueuedConnection,
+            Q_ARG(int, data['winner']))
+
+    def handleUpdatePlayAgainCount(self, data):
+        self.playAgainCount = data['playAgainCount']
+        self.gameOverDialog.updateCounter(data['playAgainCount'])
+
+    def handleUpdateDeck(self, data):
+        self.controller.deck = data['deck']
+        self.gameView.updateDeck(data['deck'])
+
+    def handleDrawCards(self, data):
+        self.controller.deck.draw(data['count'])
+        self.gameView.updateDeck(self.controller.deck)
+
+    def handleUpdatePile(self, data):
+        self.controller.pile = data['pile']
+        self.gameView.updatePile(data['pile'])
+
+    def handleUpdatePileLabel(self, data):
+        self.gameView.updatePileLabel(data['pileLabel'])
+
+    def handleSevenSwitch(self, data):
+        self.controller.sevenSwitch = data['sevenSwitch']
+
+    def handlePlayerDisconnected(self, data):
+        if self.controller.numPlayers == 2:
+            self.broadcastUpdate('playerDisconnected', {})
+
+    def handleSwitchToTwoPlayerLayout(self, data):
+        self.numPlayers -= 1
+        self.controller.numPlayers = self.numPlayers
+        self.gameView.switchToTwoPlayerLayout(data['remainingPlayers'])
+
+    def handleSwitchToThreePlayerLayout(self, data):
+        self.numPlayers -= 1
+        self.controller.numPlayers = self.numPlayers
+        self.gameView.switchToThreePlayerLayout(data['remainingPlayers'])
+
+    def handleGameClose(self, data):
+        try:
+            QMetaObject.invokeMethod(self.gameOverDialog, "close", Qt.ConnectionType.QueuedConnection)
+        except Exception:
+            pass
+        QMetaObject.invokeMethod(self.gameView, "returnToMainMenu", Qt.ConnectionType.QueuedConnection)
+        self.leaveServer()
+
+    def handleUpdateNumPlayersLobby(self, data):
+        self.numPlayers -= 1
+        self.gameOverDialog.numPlayers = self.numPlayers
+        self.gameOverDialog.updateCounter(self.playAgainCount)
+
+    def handleUpdateLog(self, data):
+        QMetaObject.invokeMethod(self.logText, "append", Qt.ConnectionType.QueuedConnection,
+            Q_ARG(str, data['log']))
+
+    def handleShutdownServer(self, data):
+        QMetaObject.invokeMethod(self.logText, "append", Qt.ConnectionType.QueuedConnection,
+            Q_ARG(str, "Server shutdown by host."))
+        self.leaveButton.hide()
+        self.joinButton.setDisabled(False)
     
     @Slot(int)
     def showGameOverDialog(self, winner):
@@ -909,7 +1215,7 @@ class JoinLobby(QDialog):
             self.broadcastUpdate('startNewGame', {})
     
     def broadcastUpdate(self, action, data):
-        message = json.dumps({"action": action, **data}) + "\n"
+        message = self.tracer.encode(action, data)
         try:
             self.client.send(message.encode())
         except Exception as e:
@@ -931,12 +1237,9 @@ class JoinLobby(QDialog):
         except Exception:
             pass
         self.playerNicknames = data.get("nicknames", {})
-        self.deck = data.get("deck", [])
-        players = data.get("players", {})
-        playerKey = f'player{self.playerIndex}'
         self.numPlayers = data.get('numPlayers')
-        self.handCards = players.get(playerKey, {}).get('hand', [])
-        self.bottomCards = players.get(playerKey, {}).get('bottomCards', [])
+        # Handed over to the game's controller in startGame
+        self.table = TableState.fromDeckSync(data)
         self.startGameSignal.emit(self.playerIndex)
 
     def leaveServer(self):
@@ -987,16 +1290,9 @@ class JoinLobby(QDialog):
         self.playAgainCount = 0
         print(f"Starting game as Player {playerIndex}.")
         self.hide()
-        self.controller = GameController(
-            self.deck,
-            self.playerIndex,
-            self.handCards,
-            self.bottomCards,
-            self.numPlayers,
-            self.broadcastUpdate,
-            self.playerNicknames
-        )
-        self.gameView = GameView(self.controller, self.geometry(), self.numPlayers, self.mainMenu)
+        table, self.table = self.table, None
+        self.controller = GameController(table, self.playerIndex, self.broadcastUpdate, self.playerNicknames)
+        self.gameView = createGameView(self.controller, self.geometry(), self.numPlayers, self.mainMenu)
         self.gameView.show()
         self.controller.startGame()
 
@@ -1015,6 +1311,12 @@ class GameView(QWidget):
         self.playerIndex = self.controller.playerIndex
         self.selectedCards = []
         self.playAgainCount = 0
+        self.dirtyZones = {}
+        self.pendingHandEnabled = None
+        self.pendingCardStates = {}
+        self.renderScheduled = False
+        self.rendering = False
+        self.lastRender = 0.0
         self.initUI()
         centerDialog(self, parentCoords, "gameView")
                 
@@ -1038,7 +1340,7 @@ class GameView(QWidget):
         
     def initUI(self):
         self.setWindowTitle(f'Palace Card Game - Player {self.playerIndex}')
-        self.setWindowIcon(QIcon(r"palaceData\palaceIcon.ico"))
+        self.setWindowIcon(windowIcon())
         self.setGeometry(450, 75, 900, 900)
         self.layout = QGridLayout()
 
@@ -1074,6 +1376,9 @@ class GameView(QWidget):
         self.confirmButton.setEnabled(False)
         self.confirmButton.setFixedWidth(240)
         self.confirmButton.clicked.connect(self.controller.confirmTopCards)
+        self.suggestButton = QPushButton("Suggest")
+        self.suggestButton.setFixedWidth(240)
+        self.suggestButton.clicked.connect(self.suggestTopCards)
         self.placeButton = QPushButton("Select A Card")
         self.placeButton.setEnabled(False)
         self.placeButton.setFixedWidth(240)
@@ -1084,6 +1389,7 @@ class GameView(QWidget):
         buttonsLeftContainerLayout.addWidget(self.spacerButtonLeftRight, alignment=Qt.AlignmentFlag.AlignCenter)
         buttonsRightContainerLayout.addWidget(self.spacerButtonLeftRight, alignment=Qt.AlignmentFlag.AlignCenter)
         buttonsBottomContainerLayout.addWidget(self.confirmButton, alignment=Qt.AlignmentFlag.AlignCenter)
+        buttonsBottomContainerLayout.addWidget(self.suggestButton, alignment=Qt.AlignmentFlag.AlignCenter)
         buttonsBottomContainerLayout.addWidget(self.placeButton, alignment=Qt.AlignmentFlag.AlignCenter)
         self.layout.addLayout(buttonsTopContainerLayout, 0, 6, alignment=Qt.AlignmentFlag.AlignCenter)
         self.layout.addLayout(buttonsBottomContainerLayout, 12, 6, alignment=Qt.AlignmentFlag.AlignCenter)
@@ -1166,17 +1472,17 @@ class GameView(QWidget):
         for _ in range(3):  # Assume max 3 cards for each area
             handSpacer = QLabel()
             handSpacer.setFixedSize(BUTTON_WIDTH, BUTTON_HEIGHT)
-            handSpacer.setStyleSheet("border: 2px dashed gray; background-color: transparent;")
+            handSpacer.setObjectName("placeholder")
             handLayout.addWidget(handSpacer)
 
             topSpacer = QLabel()
             topSpacer.setFixedSize(BUTTON_WIDTH, BUTTON_HEIGHT)
-            topSpacer.setStyleSheet("border: 2px dashed gray; background-color: transparent;")
+            topSpacer.setObjectName("placeholder")
             topCardsLayout.addWidget(topSpacer)
 
             bottomSpacer = QLabel()
             bottomSpacer.setFixedSize(BUTTON_WIDTH, BUTTON_HEIGHT)
-            bottomSpacer.setStyleSheet("border: 2px dashed gray; background-color: transparent;")
+            bottomSpacer.setObjectName("placeholder")
             bottomCardsLayout.addWidget(bottomSpacer)
 
         self.layout.addLayout(layout, *position)
@@ -1209,17 +1515,17 @@ class GameView(QWidget):
         for _ in range(3):  # Assume max 3 cards for each area
             handSpacer = QLabel()
             handSpacer.setFixedSize(BUTTON_WIDTH, BUTTON_HEIGHT)
-            handSpacer.setStyleSheet("border: 2px dashed gray; background-color: transparent;")
+            handSpacer.setObjectName("placeholder")
             handLayout.addWidget(handSpacer)
 
             topSpacer = QLabel()
             topSpacer.setFixedSize(BUTTON_WIDTH, BUTTON_HEIGHT)
-            topSpacer.setStyleSheet("border: 2px dashed gray; background-color: transparent;")
+            topSpacer.setObjectName("placeholder")
             topCardsLayout.addWidget(topSpacer)
 
             bottomSpacer = QLabel()
             bottomSpacer.setFixedSize(BUTTON_WIDTH, BUTTON_HEIGHT)
-            bottomSpacer.setStyleSheet("border: 2px dashed gray; background-color: transparent;")
+            bottomSpacer.setObjectName("placeholder")
             bottomCardsLayout.addWidget(bottomSpacer)
 
         self.layout.addLayout(layout, *position)
@@ -1269,17 +1575,17 @@ class GameView(QWidget):
         for _ in range(3):  # Assume max 3 cards for each area
             handSpacer = QLabel()
             handSpacer.setFixedSize(BUTTON_HEIGHT, BUTTON_WIDTH)
-            handSpacer.setStyleSheet("border: 2px dashed gray; background-color: transparent;")
+            handSpacer.setObjectName("placeholder")
             handLayout.addWidget(handSpacer)
 
             topSpacer = QLabel()
             topSpacer.setFixedSize(BUTTON_HEIGHT, BUTTON_WIDTH)
-            topSpacer.setStyleSheet("border: 2px dashed gray; background-color: transparent;")
+            topSpacer.setObjectName("placeholder")
             topCardsLayout.addWidget(topSpacer)
 
             bottomSpacer = QLabel()
             bottomSpacer.setFixedSize(BUTTON_HEIGHT, BUTTON_WIDTH)
-            bottomSpacer.setStyleSheet("border: 2px dashed gray; background-color: transparent;")
+            bottomSpacer.setObjectName("placeholder")
             bottomCardsLayout.addWidget(bottomSpacer)
 
         self.layout.addLayout(layout, *position)
@@ -1329,17 +1635,17 @@ class GameView(QWidget):
         for _ in range(3):  # Assume max 3 cards for each area
             handSpacer = QLabel()
             handSpacer.setFixedSize(BUTTON_HEIGHT, BUTTON_WIDTH)
-            handSpacer.setStyleSheet("border: 2px dashed gray; background-color: transparent;")
+            handSpacer.setObjectName("placeholder")
             handLayout.addWidget(handSpacer)
 
             topSpacer = QLabel()
             topSpacer.setFixedSize(BUTTON_HEIGHT, BUTTON_WIDTH)
-            topSpacer.setStyleSheet("border: 2px dashed gray; background-color: transparent;")
+            topSpacer.setObjectName("placeholder")
             topCardsLayout.addWidget(topSpacer)
 
             bottomSpacer = QLabel()
             bottomSpacer.setFixedSize(BUTTON_HEIGHT, BUTTON_WIDTH)
-            bottomSpacer.setStyleSheet("border: 2px dashed gray; background-color: transparent;")
+            bottomSpacer.setObjectName("placeholder")
             bottomCardsLayout.addWidget(bottomSpacer)
 
         self.layout.addLayout(layout, *position)
@@ -1418,50 +1724,34 @@ class GameView(QWidget):
             self.numPlayers = 2
             self.controller.numPlayers = self.numPlayers
             self.controller.currentPlayer = 2
-            storedCards = self.controller.allPlayerCards.get(3, {}).get('handCards', []) + \
-                          self.controller.allPlayerCards.get(3, {}).get('topCards', []) + \
-                          self.controller.allPlayerCards.get(3, {}).get('bottomCards', [])
-            self.controller.allPlayerCards = {
-                1: self.controller.allPlayerCards.get(1, {}),
-                2: self.controller.allPlayerCards.get(2, {}),
-            }
+            storedCards = self.controller.table.player(3).allCards()
+            self.controller.table.reseat([1, 2])
         elif self.controller.playerIndex == 1 and 3 in remainingPlayers:
             self.numPlayers = 2
             self.controller.numPlayers = self.numPlayers
             self.controller.currentPlayer = 3
-            storedCards = self.controller.allPlayerCards.get(2, {}).get('handCards', []) + \
-                          self.controller.allPlayerCards.get(2, {}).get('topCards', []) + \
-                          self.controller.allPlayerCards.get(2, {}).get('bottomCards', [])
-            self.controller.allPlayerCards = {
-                1: self.controller.allPlayerCards.get(1, {}),
-                2: self.controller.allPlayerCards.get(3, {}),
-            }
+            storedCards = self.controller.table.player(2).allCards()
+            self.controller.table.reseat([1, 3])
         elif self.controller.playerIndex == 2:
             self.numPlayers = 2
             self.controller.numPlayers = self.numPlayers
             self.controller.currentPlayer = 2
-            self.controller.allPlayerCards = {
-                1: self.controller.allPlayerCards.get(1, {}),
-                2: self.controller.allPlayerCards.get(2, {}),
-            }
+            self.controller.table.reseat([1, 2])
         elif self.controller.playerIndex == 3:
             self.playerIndex = 2
             self.controller.playerIndex = self.playerIndex
             self.numPlayers = 2
             self.controller.numPlayers = self.numPlayers
             self.controller.currentPlayer = 2
-            self.controller.allPlayerCards = {
-                1: self.controller.allPlayerCards.get(1, {}),
-                2: self.controller.allPlayerCards.get(3, {}),
-            }
+            self.controller.table.reseat([1, 3])
         
         self.controller.currentPlayerChangedSignal.emit(self.controller.currentPlayer)
         
         # Reinitialize the layout for a 2-player game
         if self.playerIndex == 1:
-            topPlayerCards = self.controller.allPlayerCards.get(2, {})
+            topPlayer = self.controller.table.player(2)
         elif self.playerIndex == 2:
-            topPlayerCards = self.controller.allPlayerCards.get(1, {})
+            topPlayer = self.controller.table.player(1)
         self.twoPlayerLayoutSignal.emit()
         
         if not self.controller.topCardSelectionPhase:
@@ -1471,12 +1761,12 @@ class GameView(QWidget):
         if self.playerIndex == 1:
             if self.controller.deck and storedCards:
                 random.shuffle(storedCards)
-                self.controller.deck.extend(storedCards)
+                self.controller.deck = self.controller.deck.extended(storedCards)
                 self.controller.updateDeckSignal.emit(self.controller.deck)
-                self.controller.broadcastUpdate('updateDeck', {'deck': self.controller.deck})
-            self.controller.updateOtherPlayerCardsSignal.emit(2, topPlayerCards.get('handCards', []), topPlayerCards.get('topCards', []), topPlayerCards.get('bottomCards', []))
+                self.controller.broadcastUpdate('updateDeck', {'deck': self.controller.deck.remaining()})
+            self.controller.updateOtherPlayerCardsSignal.emit(2, topPlayer.handCards, topPlayer.topCards, topPlayer.bottomCards)
         elif self.playerIndex == 2:
-            self.controller.updateOtherPlayerCardsSignal.emit(1, topPlayerCards.get('handCards', []), topPlayerCards.get('topCards', []), topPlayerCards.get('bottomCards', []))
+            self.controller.updateOtherPlayerCardsSignal.emit(1, topPlayer.handCards, topPlayer.topCards, topPlayer.bottomCards)
         
         self.setWindowTitle(f'Palace Card Game - Player {self.playerIndex}')
         
@@ -1486,108 +1776,66 @@ class GameView(QWidget):
             self.numPlayers = 3
             self.controller.numPlayers = self.numPlayers
             self.controller.currentPlayer = 2
-            storedCards = self.controller.allPlayerCards.get(4, {}).get('handCards', []) + \
-                          self.controller.allPlayerCards.get(4, {}).get('topCards', []) + \
-                          self.controller.allPlayerCards.get(4, {}).get('bottomCards', [])
-            self.controller.allPlayerCards = {
-                1: self.controller.allPlayerCards.get(1, {}),
-                2: self.controller.allPlayerCards.get(2, {}),
-                3: self.controller.allPlayerCards.get(3, {}),
-            }
+            storedCards = self.controller.table.player(4).allCards()
+            self.controller.table.reseat([1, 2, 3])
         elif self.controller.playerIndex == 1 and 2 in remainingPlayers and 4 in remainingPlayers:
             self.numPlayers = 3
             self.controller.numPlayers = self.numPlayers
             self.controller.currentPlayer = 2
-            storedCards = self.controller.allPlayerCards.get(3, {}).get('handCards', []) + \
-                          self.controller.allPlayerCards.get(3, {}).get('topCards', []) + \
-                          self.controller.allPlayerCards.get(3, {}).get('bottomCards', [])
-            self.controller.allPlayerCards = {
-                1: self.controller.allPlayerCards.get(1, {}),
-                2: self.controller.allPlayerCards.get(2, {}),
-                3: self.controller.allPlayerCards.get(4, {}),
-            }
+            storedCards = self.controller.table.player(3).allCards()
+            self.controller.table.reseat([1, 2, 4])
         elif self.controller.playerIndex == 1 and 3 in remainingPlayers and 4 in remainingPlayers:
             self.numPlayers = 3
             self.controller.numPlayers = self.numPlayers
             self.controller.currentPlayer = 3
-            storedCards = self.controller.allPlayerCards.get(2, {}).get('handCards', []) + \
-                          self.controller.allPlayerCards.get(2, {}).get('topCards', []) + \
-                          self.controller.allPlayerCards.get(2, {}).get('bottomCards', [])
-            self.controller.allPlayerCards = {
-                1: self.controller.allPlayerCards.get(1, {}),
-                2: self.controller.allPlayerCards.get(3, {}),
-                3: self.controller.allPlayerCards.get(4, {}),
-            }
+            storedCards = self.controller.table.player(2).allCards()
+            self.controller.table.reseat([1, 3, 4])
         elif self.controller.playerIndex == 2 and 1 in remainingPlayers and 3 in remainingPlayers:
             self.numPlayers = 3
             self.controller.numPlayers = self.numPlayers
             self.controller.currentPlayer = 2
-            self.controller.allPlayerCards = {
-                1: self.controller.allPlayerCards.get(1, {}),
-                2: self.controller.allPlayerCards.get(2, {}),
-                3: self.controller.allPlayerCards.get(3, {}),
-            }
+            self.controller.table.reseat([1, 2, 3])
         elif self.controller.playerIndex == 2 and 1 in remainingPlayers and 4 in remainingPlayers:
             self.numPlayers = 3
             self.controller.numPlayers = self.numPlayers
             self.controller.currentPlayer = 2
-            self.controller.allPlayerCards = {
-                1: self.controller.allPlayerCards.get(1, {}),
-                2: self.controller.allPlayerCards.get(2, {}),
-                3: self.controller.allPlayerCards.get(4, {}),
-            }
+            self.controller.table.reseat([1, 2, 4])
         elif self.controller.playerIndex == 3 and 1 in remainingPlayers and 2 in remainingPlayers:
             self.numPlayers = 3
             self.controller.numPlayers = self.numPlayers
             self.controller.currentPlayer = 3
-            self.controller.allPlayerCards = {
-                1: self.controller.allPlayerCards.get(1, {}),
-                2: self.controller.allPlayerCards.get(2, {}),
-                3: self.controller.allPlayerCards.get(3, {}),
-            }
+            self.controller.table.reseat([1, 2, 3])
         elif self.controller.playerIndex == 3 and 1 in remainingPlayers and 4 in remainingPlayers:
             self.numPlayers = 3
             self.controller.numPlayers = self.numPlayers
             self.controller.currentPlayer = 3
-            self.controller.allPlayerCards = {
-                1: self.controller.allPlayerCards.get(1, {}),
-                2: self.controller.allPlayerCards.get(3, {}),
-                3: self.controller.allPlayerCards.get(4, {}),
-            }
+            self.controller.table.reseat([1, 3, 4])
         elif self.controller.playerIndex == 4 and 1 in remainingPlayers and 2 in remainingPlayers:
             self.playerIndex = 3
             self.controller.playerIndex = self.playerIndex
             self.numPlayers = 3
             self.controller.numPlayers = self.numPlayers
             self.controller.currentPlayer = 3
-            self.controller.allPlayerCards = {
-                1: self.controller.allPlayerCards.get(1, {}),
-                2: self.controller.allPlayerCards.get(2, {}),
-                3: self.controller.allPlayerCards.get(4, {}),
-            }
+            self.controller.table.reseat([1, 2, 4])
         elif self.controller.playerIndex == 4 and 1 in remainingPlayers and 3 in remainingPlayers:
             self.playerIndex = 3
             self.controller.playerIndex = self.playerIndex
             self.numPlayers = 3
             self.controller.numPlayers = self.numPlayers
             self.controller.currentPlayer = 3
-            self.controller.allPlayerCards = {
-                1: self.controller.allPlayerCards.get(1, {}),
-                2: self.controller.allPlayerCards.get(3, {}),
-                3: self.controller.allPlayerCards.get(4, {}),
-            }
+            self.controller.table.reseat([1, 3, 4])
 
         self.controller.currentPlayerChangedSignal.emit(self.controller.currentPlayer) 
         
         if self.playerIndex == 1:
-            leftPlayerCards = self.controller.allPlayerCards.get(2, {})
-            topPlayerCards = self.controller.allPlayerCards.get(3, {})
+            leftPlayer = self.controller.table.player(2)
+            topPlayer = self.controller.table.player(3)
         elif self.playerIndex == 2:
-            leftPlayerCards = self.controller.allPlayerCards.get(3, {})
-            topPlayerCards = self.controller.allPlayerCards.get(1, {})
+            leftPlayer = self.controller.table.player(3)
+            topPlayer = self.controller.table.player(1)
         elif self.playerIndex == 3:
-            leftPlayerCards = self.controller.allPlayerCards.get(1, {})
-            topPlayerCards = self.controller.allPlayerCards.get(2, {})
+            leftPlayer = self.controller.table.player(1)
+            topPlayer = self.controller.table.player(2)
         
         self.threePlayerLayoutSignal.emit()
 
@@ -1600,17 +1848,17 @@ class GameView(QWidget):
         if self.playerIndex == 1:
             if self.controller.deck and storedCards:
                 random.shuffle(storedCards)
-                self.controller.deck.extend(storedCards)
+                self.controller.deck = self.controller.deck.extended(storedCards)
                 self.controller.updateDeckSignal.emit(self.controller.deck)
-                self.controller.broadcastUpdate('updateDeck', {'deck': self.controller.deck})
-            self.controller.updateOtherPlayerCardsSignal.emit(2, leftPlayerCards.get('handCards', []), leftPlayerCards.get('topCards', []), leftPlayerCards.get('bottomCards', []))
-            self.controller.updateOtherPlayerCardsSignal.emit(3, topPlayerCards.get('handCards', []), topPlayerCards.get('topCards', []), topPlayerCards.get('bottomCards', []))
+                self.controller.broadcastUpdate('updateDeck', {'deck': self.controller.deck.remaining()})
+            self.controller.updateOtherPlayerCardsSignal.emit(2, leftPlayer.handCards, leftPlayer.topCards, leftPlayer.bottomCards)
+            self.controller.updateOtherPlayerCardsSignal.emit(3, topPlayer.handCards, topPlayer.topCards, topPlayer.bottomCards)
         elif self.playerIndex == 2:
-            self.controller.updateOtherPlayerCardsSignal.emit(3, leftPlayerCards.get('handCards', []), leftPlayerCards.get('topCards', []), leftPlayerCards.get('bottomCards', []))
-            self.controller.updateOtherPlayerCardsSignal.emit(1, topPlayerCards.get('handCards', []), topPlayerCards.get('topCards', []), topPlayerCards.get('bottomCards', []))
+            self.controller.updateOtherPlayerCardsSignal.emit(3, leftPlayer.handCards, leftPlayer.topCards, leftPlayer.bottomCards)
+            self.controller.updateOtherPlayerCardsSignal.emit(1, topPlayer.handCards, topPlayer.topCards, topPlayer.bottomCards)
         elif self.playerIndex == 3:
-            self.controller.updateOtherPlayerCardsSignal.emit(1, leftPlayerCards.get('handCards', []), leftPlayerCards.get('topCards', []), leftPlayerCards.get('bottomCards', []))
-            self.controller.updateOtherPlayerCardsSignal.emit(2, topPlayerCards.get('handCards', []), topPlayerCards.get('topCards', []), topPlayerCards.get('bottomCards', []))
+            self.controller.updateOtherPlayerCardsSignal.emit(1, leftPlayer.handCards, leftPlayer.topCards, leftPlayer.bottomCards)
+            self.controller.updateOtherPlayerCardsSignal.emit(2, topPlayer.handCards, topPlayer.topCards, topPlayer.bottomCards)
         
         self.setWindowTitle(f'Palace Card Game - Player {self.playerIndex}')
         
@@ -1625,7 +1873,54 @@ class GameView(QWidget):
             if handLabel:
                 handLabel.deleteLater()
     
+    def scheduleRender(self, zone, render, *args):
+        """
+        Mark a zone of the table dirty. Only the latest update of each zone is kept
+        and all dirty zones are rendered together on the next event-loop tick,
+        capped at one pass per frame.
+        """
+        self.dirtyZones[zone] = (render, args)
+        self.requestRender()
+
+    def requestRender(self):
+        if self.renderScheduled or self.rendering:
+            return
+        self.renderScheduled = True
+        elapsed = (time.monotonic() - self.lastRender) * 1000
+        QTimer.singleShot(max(0, int(GuiMarshaller.FRAME_INTERVAL_MS - elapsed)), self.flushRender)
+
+    def flushRender(self):
+        self.renderScheduled = False
+        self.rendering = True
+        try:
+            zones = self.dirtyZones
+            self.dirtyZones = {}
+            for render, args in zones.values():
+                render(*args)
+            # Card enabled states go last so they apply to freshly built hand widgets
+            self.renderCardStates()
+        finally:
+            self.rendering = False
+            self.lastRender = time.monotonic()
+        if self.dirtyZones:
+            self.requestRender()
+
     def updateHandCards(self, handCards):
+        # Rebuilding the hand resets every card to enabled
+        self.pendingHandEnabled = None
+        self.pendingCardStates.clear()
+        self.scheduleRender('hand', self.renderHandCards, handCards)
+
+    def updateTopCards(self, topCards):
+        self.scheduleRender('top', self.renderTopCards, topCards)
+
+    def updateBottomCards(self, bottomCards):
+        self.scheduleRender('bottom', self.renderBottomCards, bottomCards)
+
+    def updateOtherPlayerCards(self, playerIndex, handCards, topCards, bottomCards):
+        self.scheduleRender(('other', playerIndex), self.renderOtherPlayerCards, playerIndex, handCards, topCards, bottomCards)
+
+    def renderHandCards(self, handCards):
         """
         Update the current player's hand cards display (face up).
         """
@@ -1638,20 +1933,16 @@ class GameView(QWidget):
 
         # Add player hand cards
         for idx, card in enumerate(handCards):
-            button = QLabel()
+            button = CardLabel()
             button.setFixedSize(BUTTON_WIDTH, BUTTON_HEIGHT)
-            button.setStyleSheet("border: 2px solid transparent; background-color: transparent;")
+            button.setSelected(False)
             if card:
                 if not card[3]:
-                    pixmap = QPixmap(fr"palaceData\cards\{card[0].lower()}_of_{card[1].lower()}.png").scaled(
-                        CARD_WIDTH, CARD_HEIGHT, Qt.AspectRatioMode.KeepAspectRatio, Qt.TransformationMode.SmoothTransformation
-                    )
+                    pixmap = cardPixmap(cardName(card))
                     button.setPixmap(pixmap)
                     button.setAlignment(Qt.AlignmentFlag.AlignCenter)
                 else:
-                    pixmap = QPixmap(fr"palaceData\cards\back.png").scaled(
-                        CARD_WIDTH, CARD_HEIGHT, Qt.AspectRatioMode.KeepAspectRatio, Qt.TransformationMode.SmoothTransformation
-                    )
+                    pixmap = cardPixmap("back")
                     button.setPixmap(pixmap)
                     button.setAlignment(Qt.AlignmentFlag.AlignCenter)
                 # Add mouse press event for card selection
@@ -1662,10 +1953,10 @@ class GameView(QWidget):
             for _ in range(3):  # Assume maximum 3 placeholders
                 placeholder = QLabel()
                 placeholder.setFixedSize(BUTTON_WIDTH, BUTTON_HEIGHT)
-                placeholder.setStyleSheet("border: 2px dashed gray; background-color: transparent;")
+                placeholder.setObjectName("placeholder")
                 self.playerHand.addWidget(placeholder)
     
-    def updateTopCards(self, topCards):
+    def renderTopCards(self, topCards):
         """
         Update the current player's top cards display (face up).
         """
@@ -1680,9 +1971,7 @@ class GameView(QWidget):
         for card in topCards:
             button = QLabel()
             button.setFixedSize(BUTTON_WIDTH, BUTTON_HEIGHT)
-            pixmap = QPixmap(fr"palaceData\cards\{card[0].lower()}_of_{card[1].lower()}.png").scaled(
-                CARD_WIDTH, CARD_HEIGHT, Qt.AspectRatioMode.KeepAspectRatio, Qt.TransformationMode.SmoothTransformation
-            )
+            pixmap = cardPixmap(cardName(card))
             button.setPixmap(pixmap)
             button.setAlignment(Qt.AlignmentFlag.AlignCenter)
             self.playerTop.addWidget(button)
@@ -1692,10 +1981,10 @@ class GameView(QWidget):
             for _ in range(3):  
                 placeholder = QLabel()
                 placeholder.setFixedSize(BUTTON_WIDTH, BUTTON_HEIGHT)
-                placeholder.setStyleSheet("border: 2px dashed gray; background-color: transparent;")
+                placeholder.setObjectName("placeholder")
                 self.playerTop.addWidget(placeholder)
 
-    def updateBottomCards(self, bottomCards):
+    def renderBottomCards(self, bottomCards):
         """
         Update the current player's bottom cards display (face down).
         """
@@ -1710,10 +1999,8 @@ class GameView(QWidget):
         for card in bottomCards:
             button = QLabel()
             button.setFixedSize(BUTTON_WIDTH, BUTTON_HEIGHT)
-            button.setStyleSheet("border: 0px solid black; background-color: transparent;")
-            pixmap = QPixmap(r"palaceData\cards\back.png").scaled(
-                CARD_WIDTH, CARD_HEIGHT, Qt.AspectRatioMode.KeepAspectRatio, Qt.TransformationMode.SmoothTransformation
-            )
+            button.setObjectName("cardBack")
+            pixmap = cardPixmap("back")
             button.setPixmap(pixmap)
             button.setAlignment(Qt.AlignmentFlag.AlignCenter)
             self.playerBottom.addWidget(button)
@@ -1723,10 +2010,10 @@ class GameView(QWidget):
             for _ in range(3):
                 placeholder = QLabel()
                 placeholder.setFixedSize(BUTTON_WIDTH, BUTTON_HEIGHT)
-                placeholder.setStyleSheet("border: 2px dashed gray; background-color: transparent;")
+                placeholder.setObjectName("placeholder")
                 self.playerBottom.addWidget(placeholder)
 
-    def updateOtherPlayerCards(self, playerIndex, handCards, topCards, bottomCards):
+    def renderOtherPlayerCards(self, playerIndex, handCards, topCards, bottomCards):
         # Mapping based on self.playerIndex
         layoutMap = {
             'hand': {},
@@ -1796,7 +2083,6 @@ class GameView(QWidget):
                     rotate = False
                     rotatedDimensions = (BUTTON_HEIGHT, BUTTON_WIDTH)
                     standardDimensions = (BUTTON_WIDTH, BUTTON_HEIGHT)
-                    pixmapDimensions = (CARD_WIDTH, CARD_HEIGHT)
                     
                     # Determine layout properties
                     if layout in [getattr(self, 'leftHand', None), getattr(self, 'rightHand', None),
@@ -1807,21 +2093,16 @@ class GameView(QWidget):
                     else:
                         button.setFixedSize(*standardDimensions)
 
+                    # Determine rotation if necessary
+                    rotationAngle = 0
+                    if rotate:
+                        rotationAngle = 90 if layout in [getattr(self, 'leftHand', None), getattr(self, 'leftTop', None), getattr(self, 'leftBottom', None)] else -90
+
                     # Load the card image
                     if cardType == 'top':  # Top and hand cards (face up)
-                        pixmap = QPixmap(fr"palaceData\cards\{card[0].lower()}_of_{card[1].lower()}.png").scaled(
-                            *pixmapDimensions, Qt.AspectRatioMode.KeepAspectRatio, Qt.TransformationMode.SmoothTransformation
-                        )
+                        pixmap = cardPixmap(cardName(card), rotationAngle)
                     else:  # Bottom cards (face down)
-                        pixmap = QPixmap(fr"palaceData\cards\back.png").scaled(
-                            *pixmapDimensions, Qt.AspectRatioMode.KeepAspectRatio, Qt.TransformationMode.SmoothTransformation
-                        )
-                
-                    # Apply rotation if necessary
-                    if rotate:
-                        rotationAngle = 90 if layout in [getattr(self, 'leftHand', None), getattr(self, 'leftTop', None), getattr(self, 'leftBottom', None)] else -90
-                        transform = QTransform().rotate(rotationAngle)
-                        pixmap = pixmap.transformed(transform, Qt.TransformationMode.SmoothTransformation).scaled(CARD_HEIGHT, CARD_WIDTH, Qt.AspectRatioMode.KeepAspectRatio, Qt.TransformationMode.SmoothTransformation)
+                        pixmap = cardPixmap("back", rotationAngle)
 
                     # Set pixmap and alignment
                     button.setPixmap(pixmap)
@@ -1839,9 +2120,23 @@ class GameView(QWidget):
                         rotate = True
                     else:
                         placeholder.setFixedSize(*standardDimensions)
-                    placeholder.setStyleSheet("border: 2px dashed gray; background-color: transparent;")
+                    placeholder.setObjectName("placeholder")
                     layout.addWidget(placeholder)
     
+    def handCardLabel(self, index):
+        return self.playerHand.itemAt(index).widget()
+
+    def suggestTopCards(self):
+        """
+        Select the AI's top cards for the current hand in place of the current selection.
+        """
+        if not self.controller.topCardSelectionPhase or len(self.controller.handCards) != 6:
+            return
+        for index, _ in list(self.controller.selectedCards):
+            self.controller.prepareCardPlacement(index, self.handCardLabel(index))
+        for index in bestTopCards(self.controller.handCards):
+            self.controller.prepareCardPlacement(index, self.handCardLabel(index))
+
     def updateConfirmButton(self, selectedCount):
         """
         Enable the confirm button only when exactly 3 cards are selected.
@@ -1865,22 +2160,30 @@ class GameView(QWidget):
             self.placeButton.setText(text)
     
     def updateDeck(self, deck):
+        self.scheduleRender('deck', self.renderDeck, deck)
+
+    def updatePile(self, pile):
+        # The pile and its label share one widget, so they share one zone
+        self.scheduleRender('pile', self.renderPile, pile)
+
+    def updatePileLabel(self, text):
+        self.scheduleRender('pile', self.renderPileLabel, text)
+
+    def renderDeck(self, deck):
         self.deckLabel.setText(f"Draw Deck:\n\n{len(deck)} cards remaining")
     
-    def updatePile(self, pile):
+    def renderPile(self, pile):
         """
         Update the pile view with the top card.
         """
         if pile:
             topCard = pile[-1]
-            pixmap = QPixmap(fr"palaceData\cards\{topCard[0].lower()}_of_{topCard[1].lower()}.png").scaled(
-                CARD_WIDTH, CARD_HEIGHT, Qt.AspectRatioMode.KeepAspectRatio, Qt.TransformationMode.SmoothTransformation
-            )
+            pixmap = cardPixmap(cardName(topCard))
             self.pileLabel.setPixmap(pixmap)
         else:
             self.pileLabel.setText("Pile:\nEmpty")
     
-    def updatePileLabel(self, text):
+    def renderPileLabel(self, text):
         self.pileLabel.setText(text)
     
     def updateCurrentPlayer(self, currentPlayer):
@@ -1905,15 +2208,27 @@ class GameView(QWidget):
             self.placeButton.setText(f"Player {currentPlayerNickname}'s Turn...")
     
     def updateCardState(self, cardIndex, isEnabled):
-        widget = self.playerHand.itemAt(cardIndex).widget()
-        if widget:
-            widget.setEnabled(isEnabled)
+        self.pendingCardStates[cardIndex] = isEnabled
+        self.requestRender()
     
     def setPlayerHandEnabled(self, enabled):
-        for i in range(self.playerHand.count()):
-            widget = self.playerHand.itemAt(i).widget()
-            if widget:
-                widget.setEnabled(enabled)
+        # Enabling or disabling the whole hand overrides earlier per-card states
+        self.pendingHandEnabled = enabled
+        self.pendingCardStates.clear()
+        self.requestRender()
+
+    def renderCardStates(self):
+        if self.pendingHandEnabled is not None:
+            for i in range(self.playerHand.count()):
+                widget = self.playerHand.itemAt(i).widget()
+                if widget:
+                    widget.setEnabled(self.pendingHandEnabled)
+        for cardIndex, isEnabled in self.pendingCardStates.items():
+            item = self.playerHand.itemAt(cardIndex)
+            if item and item.widget():
+                item.widget().setEnabled(isEnabled)
+        self.pendingHandEnabled = None
+        self.pendingCardStates.clear()
     
     def startMainView(self):
         """
@@ -1921,6 +2236,7 @@ class GameView(QWidget):
         """
         # Remove confirm button
         self.confirmButton.hide()
+        self.suggestButton.hide()
         self.placeButton.show()
         self.updatePlaceButton(False, f"Player {self.controller.currentPlayer}'s Turn...")
         self.deckLabel.show()
@@ -1929,7 +2245,8 @@ class GameView(QWidget):
         self.pileLabel.setText("Pile:\nEmpty")
         self.pileLabel.setAlignment(Qt.AlignmentFlag.AlignCenter)
         self.pileLabel.setFixedSize(BUTTON_WIDTH, BUTTON_HEIGHT + 4)
-        self.pileLabel.setStyleSheet("border: 2px dashed gray; background-color: transparent;")
+        self.pileLabel.setObjectName("placeholder")
+        repolish(self.pileLabel)
         self.currentPlayerLabel.setText(f"Current Player: {self.controller.currentPlayer}")
         self.updateCurrentPlayer(self.controller.currentPlayer)
             
@@ -1971,6 +2288,358 @@ class GameView(QWidget):
         else:
             event.ignore()
     
+class CanvasCard:
+    """
+    Stand-in for a hand CardLabel when the table is drawn by a TableCanvas.
+    """
+    def __init__(self, canvas, index):
+        self.canvas = canvas
+        self.index = index
+
+    def setSelected(self, selected, borderless=False):
+        self.canvas.setCardSelected(self.index, selected)
+
+    def __eq__(self, other):
+        return isinstance(other, CanvasCard) and other.canvas is self.canvas and other.index == self.index
+
+    def __hash__(self):
+        return hash((id(self.canvas), self.index))
+
+class TableCanvas(QWidget):
+    """
+    Draws every seat, the pile and the deck from cached pixmaps in a single paintEvent.
+    Each seat is laid out in its own frame, with cards along x and rows stacked inward
+    along -y from the table edge, and is placed on the table by a QTransform, so
+    rearranging seats only changes transforms.
+    """
+    SEAT_ANGLES = {'bottom': 0, 'left': 90, 'top': 180, 'right': -90}
+    MAX_ROW_WIDTH = 400
+    EDGE_MARGIN = 8
+    LABEL_HEIGHT = 20
+    BOTTOM_CARD_OFFSET = 12
+
+    def __init__(self, controller, parent=None):
+        super().__init__(parent)
+        self.controller = controller
+        self.seats = {}
+        self.pileCard = None
+        self.pileText = ""
+        self.deckText = ""
+        self.handEnabled = []
+        self.selected = set()
+        self.handRects = []
+        self.setMinimumSize(880, 740)
+
+    def cardPixmap(self, card, faceUp=True):
+        return cardPixmap(cardName(card, faceUp))
+
+    def clearSeats(self):
+        self.seats = {}
+        self.update()
+
+    def assignSeat(self, seat, label, faceUpHand=False):
+        self.seats[seat] = {'label': label, 'faceUpHand': faceUpHand, 'hand': [], 'top': [], 'bottom': []}
+        self.update()
+
+    def setSeatCards(self, seat, zone, cards):
+        if seat in self.seats:
+            self.seats[seat][zone] = list(cards)
+            self.update()
+
+    def resetHandState(self, count):
+        self.handEnabled = [True] * count
+        self.selected = set()
+        self.update()
+
+    def setHandEnabled(self, enabled):
+        self.handEnabled = [enabled] * len(self.handEnabled)
+        self.update()
+
+    def setCardEnabled(self, index, enabled):
+        if 0 <= index < len(self.handEnabled):
+            self.handEnabled[index] = enabled
+            self.update()
+
+    def setCardSelected(self, index, selected):
+        if selected:
+            self.selected.add(index)
+        else:
+            self.selected.discard(index)
+        self.update()
+
+    def setPile(self, topCard, text=""):
+        self.pileCard = topCard
+        self.pileText = text
+        self.update()
+
+    def setDeckText(self, text):
+        self.deckText = text
+        self.update()
+
+    def seatTransform(self, seat):
+        anchors = {
+            'bottom': (self.width() / 2, self.height()),
+            'top': (self.width() / 2, 0),
+            'left': (0, self.height() / 2),
+            'right': (self.width(), self.height() / 2),
+        }
+        x, y = anchors[seat]
+        return QTransform().translate(x, y).rotate(self.SEAT_ANGLES[seat])
+
+    def rowRects(self, count, rowTop):
+        """
+        Card rectangles for a row of count cards centered on x = 0 in seat coordinates.
+        Cards overlap once the row would grow past MAX_ROW_WIDTH.
+        """
+        if count == 0:
+            return []
+        step = BUTTON_WIDTH + 4
+        if count > 1:
+            step = min(step, (self.MAX_ROW_WIDTH - BUTTON_WIDTH) / (count - 1))
+        left = -(step * (count - 1) + BUTTON_WIDTH) / 2
+        return [QRectF(left + i * step, rowTop, BUTTON_WIDTH, BUTTON_HEIGHT) for i in range(count)]
+
+    def paintRow(self, painter, cards, rowTop, faceUp):
+        if not cards:
+            painter.setPen(QPen(QColor("gray"), 2, Qt.PenStyle.DashLine))
+            for rect in self.rowRects(3, rowTop):
+                painter.drawRect(rect.adjusted(2, 2, -2, -2))
+            return []
+        rects = self.rowRects(len(cards), rowTop)
+        for card, rect in zip(cards, rects):
+            painter.drawPixmap(rect.topLeft() + QPointF(5, 1), self.cardPixmap(card, faceUp(card)))
+        return rects
+
+    def paintSeat(self, painter, seat, model):
+        handTop = -(self.EDGE_MARGIN + BUTTON_HEIGHT)
+        labelTop = handTop - self.LABEL_HEIGHT
+        topCardsTop = labelTop - BUTTON_HEIGHT
+        bottomCardsTop = topCardsTop - self.BOTTOM_CARD_OFFSET
+
+        self.paintRow(painter, model['bottom'], bottomCardsTop, lambda card: False)
+        self.paintRow(painter, model['top'], topCardsTop, lambda card: True)
+
+        painter.setPen(QColor("white"))
+        painter.drawText(QRectF(-self.MAX_ROW_WIDTH / 2, labelTop, self.MAX_ROW_WIDTH, self.LABEL_HEIGHT),
+                         Qt.AlignmentFlag.AlignCenter, model['label'])
+
+        if seat != 'bottom':
+            self.paintRow(painter, model['hand'], handTop, lambda card: False)
+            return []
+
+        # The local player's hand: face up except blind bottom cards, with selection and enabled state
+        hand = model['hand']
+        if not hand:
+            return self.paintRow(painter, hand, handTop, None)
+        rects = self.rowRects(len(hand), handTop)
+        for index, (card, rect) in enumerate(zip(hand, rects)):
+            enabled = self.handEnabled[index] if index < len(self.handEnabled) else True
+            painter.setOpacity(1.0 if enabled else 0.4)
+            painter.drawPixmap(rect.topLeft() + QPointF(5, 1), self.cardPixmap(card, not card[3]))
+            painter.setOpacity(1.0)
+            if index in self.selected:
+                painter.setPen(QPen(QColor("blue"), 2))
+                painter.drawRect(rect.adjusted(1, 1, -1, -1))
+        return rects
+
+    def paintCenter(self, painter):
+        center = QPointF(self.width() / 2, self.height() / 2)
+        pileRect = QRectF(center.x() - BUTTON_WIDTH / 2, center.y() - BUTTON_HEIGHT / 2, BUTTON_WIDTH, BUTTON_HEIGHT)
+        painter.setPen(QColor("white"))
+        if self.pileCard:
+            painter.drawPixmap(pileRect.topLeft() + QPointF(5, 1), self.cardPixmap(self.pileCard))
+        elif self.deckText:
+            painter.setPen(QPen(QColor("gray"), 2, Qt.PenStyle.DashLine))
+            painter.drawRect(pileRect)
+            painter.setPen(QColor("white"))
+            painter.drawText(pileRect, Qt.AlignmentFlag.AlignCenter, self.pileText)
+        else:
+            # Top card selection phase: the pile area only shows instructions
+            painter.drawText(QRectF(center.x() - 150, center.y() - 20, 300, 40), Qt.AlignmentFlag.AlignCenter, self.pileText)
+        if self.deckText:
+            painter.drawText(QRectF(center.x() - 230, center.y() - BUTTON_HEIGHT / 2, 150, BUTTON_HEIGHT),
+                             Qt.AlignmentFlag.AlignLeft | Qt.AlignmentFlag.AlignVCenter, self.deckText)
+
+    def paintEvent(self, event):
+        painter = QPainter(self)
+        painter.setRenderHint(QPainter.RenderHint.SmoothPixmapTransform)
+        painter.setRenderHint(QPainter.RenderHint.TextAntialiasing)
+        for seat, model in self.seats.items():
+            transform = self.seatTransform(seat)
+            painter.setTransform(transform)
+            rects = self.paintSeat(painter, seat, model)
+            if seat == 'bottom':
+                self.handRects = [transform.mapRect(rect) for rect in rects] if model['hand'] else []
+        painter.resetTransform()
+        self.paintCenter(painter)
+        painter.end()
+
+    def mousePressEvent(self, event):
+        position = event.position()
+        # Later cards are drawn on top, so hit-test from the last one back
+        for index in reversed(range(len(self.handRects))):
+            if self.handRects[index].contains(position):
+                if index < len(self.handEnabled) and self.handEnabled[index]:
+                    self.controller.prepareCardPlacement(index, CanvasCard(self, index))
+                return
+        super().mousePressEvent(event)
+
+class CanvasGameView(GameView):
+    """
+    GameView that draws the table on a single TableCanvas instead of nested layouts of
+    QLabels. Selected with PALACE_RENDER_MODE=canvas.
+    """
+    def initUI(self):
+        self.setWindowTitle(f'Palace Card Game - Player {self.playerIndex}')
+        self.setWindowIcon(windowIcon())
+        self.setGeometry(450, 75, 900, 900)
+        self.layout = QVBoxLayout()
+
+        self.disconnectButton = QPushButton("Disconnect")
+        self.disconnectButton.setFixedWidth(125)
+        self.disconnectButton.clicked.connect(self.closeEvent)
+        self.layout.addWidget(self.disconnectButton, alignment=Qt.AlignmentFlag.AlignLeft)
+
+        self.currentPlayerLabel = QLabel("")
+        self.layout.addWidget(self.currentPlayerLabel, alignment=Qt.AlignmentFlag.AlignCenter)
+
+        self.canvas = TableCanvas(self.controller)
+        self.canvas.setPile(None, "Select your 3 Top cards...")
+        self.layout.addWidget(self.canvas, 1)
+
+        buttonLayout = QHBoxLayout()
+        self.confirmButton = QPushButton("Confirm")
+        self.confirmButton.setEnabled(False)
+        self.confirmButton.setFixedWidth(240)
+        self.confirmButton.clicked.connect(self.controller.confirmTopCards)
+        self.suggestButton = QPushButton("Suggest")
+        self.suggestButton.setFixedWidth(123)
+        self.suggestButton.clicked.connect(self.suggestTopCards)
+        self.placeButton = QPushButton("Select A Card")
+        self.placeButton.setEnabled(False)
+        self.placeButton.setFixedWidth(240)
+        self.placeButton.clicked.connect(self.controller.placeCard)
+        self.placeButton.setVisible(False)
+        self.pickUpPileButton = QPushButton("Pick Up Pile")
+        self.pickUpPileButton.setFixedWidth(123)
+        self.pickUpPileButton.clicked.connect(self.controller.pickUpPile)
+        self.pickUpPileButton.hide()
+        buttonLayout.addWidget(self.confirmButton, alignment=Qt.AlignmentFlag.AlignCenter)
+        buttonLayout.addWidget(self.suggestButton, alignment=Qt.AlignmentFlag.AlignCenter)
+        buttonLayout.addWidget(self.placeButton, alignment=Qt.AlignmentFlag.AlignCenter)
+        buttonLayout.addWidget(self.pickUpPileButton, alignment=Qt.AlignmentFlag.AlignCenter)
+        self.layout.addLayout(buttonLayout)
+
+        self.setLayout(self.layout)
+        self.assignSeats()
+
+    def assignSeats(self):
+        """
+        Seat the other players clockwise from the local player, who always sits at the bottom.
+        """
+        self.canvas.clearSeats()
+        self.canvas.assignSeat('bottom', "Your Hand", faceUpHand=True)
+        seats = {2: ['top'], 3: ['left', 'top'], 4: ['left', 'top', 'right']}[self.numPlayers]
+        self.seatOf = {}
+        for offset, seat in enumerate(seats, start=1):
+            playerIndex = (self.playerIndex + offset - 1) % self.numPlayers + 1
+            self.seatOf[playerIndex] = seat
+            nickname = self.controller.playerNicknames.get(str(playerIndex), f"Player {playerIndex}")
+            self.canvas.assignSeat(seat, f"{nickname}'s Hand")
+
+    def initTwoPlayerLayout(self):
+        self.assignSeats()
+
+    def initThreePlayerLayout(self):
+        self.assignSeats()
+
+    def initFourPlayerLayout(self):
+        self.assignSeats()
+
+    def renderHandCards(self, handCards):
+        self.canvas.setSeatCards('bottom', 'hand', handCards)
+        self.canvas.resetHandState(len(handCards))
+
+    def renderTopCards(self, topCards):
+        self.canvas.setSeatCards('bottom', 'top', topCards)
+
+    def renderBottomCards(self, bottomCards):
+        self.canvas.setSeatCards('bottom', 'bottom', bottomCards)
+
+    def renderOtherPlayerCards(self, playerIndex, handCards, topCards, bottomCards):
+        seat = self.seatOf.get(playerIndex)
+        if seat is None:
+            return  # Invalid playerIndex for the current view
+        self.canvas.setSeatCards(seat, 'hand', handCards)
+        self.canvas.setSeatCards(seat, 'top', topCards)
+        self.canvas.setSeatCards(seat, 'bottom', bottomCards)
+
+    def renderDeck(self, deck):
+        self.canvas.setDeckText(f"Draw Deck:\n\n{len(deck)} cards remaining")
+
+    def renderPile(self, pile):
+        if pile:
+            self.canvas.setPile(pile[-1])
+        else:
+            self.canvas.setPile(None, "Pile:\nEmpty")
+
+    def renderPileLabel(self, text):
+        self.canvas.setPile(None, text)
+
+    def renderCardStates(self):
+        if self.pendingHandEnabled is not None:
+            self.canvas.setHandEnabled(self.pendingHandEnabled)
+        for cardIndex, isEnabled in self.pendingCardStates.items():
+            self.canvas.setCardEnabled(cardIndex, isEnabled)
+        self.pendingHandEnabled = None
+        self.pendingCardStates.clear()
+
+    def handCardLabel(self, index):
+        return CanvasCard(self.canvas, index)
+
+    def startMainView(self):
+        self.confirmButton.hide()
+        self.suggestButton.hide()
+        self.placeButton.show()
+        self.updatePlaceButton(False, f"Player {self.controller.currentPlayer}'s Turn...")
+        self.pickUpPileButton.show()
+        self.canvas.setDeckText(f"Draw Deck:\n\n{len(self.controller.deck)} cards remaining")
+        self.canvas.setPile(None, "Pile:\nEmpty")
+        self.currentPlayerLabel.setText(f"Current Player: {self.controller.currentPlayer}")
+        self.updateCurrentPlayer(self.controller.currentPlayer)
+
+def createGameView(controller, parentCoords, numPlayers, mainMenu):
+    """
+    Create the game view for the configured RENDER_MODE.
+    """
+    viewClass = CanvasGameView if RENDER_MODE == "canvas" else GameView
+    return viewClass(controller, parentCoords, numPlayers, mainMenu)
+    
+def delegated(owner, name, convert=None):
+    """
+    A property reading and writing self.<owner>.<name>, passing written values through convert.
+    """
+    def setter(self, value):
+        setattr(getattr(self, owner), name, convert(value) if convert else value)
+    return property(attrgetter(f'{owner}.{name}'), setter)
+
+def tableWritten(name, method):
+    """
+    A property reading self.table.<name> and writing it through self.table.<method>,
+    which keeps the table's checksum up to date.
+    """
+    def setter(self, value):
+        getattr(self.table, method)(value)
+    return property(attrgetter(f'table.{name}'), setter)
+
+def seatZone(zone):
+    """
+    A property for one of this seat's card zones, written through the TableState.
+    """
+    def setter(self, cards):
+        self.table.setZone(self.player, zone, cards)
+    return property(attrgetter(f'player.{zone}'), setter)
+
 class GameController(QObject):
     selectedCardsChanged = Signal(int)
     updatePlayerHandSignal = Signal(list)
@@ -1983,77 +2652,74 @@ class GameController(QObject):
     currentPlayerChangedSignal = Signal(int)
     updatePileSignal = Signal(list)
     updatePileLabelSignal = Signal(str)
-    updateDeckSignal = Signal(list)
+    updateDeckSignal = Signal(object)
     gameWonSignal = Signal(int)
     gameOverSignal = Signal(int)
     hostDisconnectedSignal = Signal()
     playerDisconnectedSignal = Signal()
+    # Moves as they happen, for card tracking: (playerIndex, cards placed on the pile,
+    # deck size before drawing) and (playerIndex, whether a blind bottom card forced it)
+    cardsPlayedSignal = Signal(int, list, int)
+    pileTakenSignal = Signal(int, bool)
     
     topCardSelectionPhase = True
 
-    def __init__(self, deck, playerIndex, handCards, bottomCards, numPlayers, broadcastUpdate, playerNicknames):
+    # This seat's view of the table lives in its TableState; these read and write it there.
+    # The card lists are only changed through the table, so its checksum stays current.
+    deck = delegated('table', 'deck', Deck)
+    pile = tableWritten('pile', 'setPile')
+    numPlayers = delegated('table', 'numPlayers')
+    currentPlayer = delegated('table', 'currentPlayer')
+    clockwise = delegated('table', 'clockwise')
+    sevenSwitch = delegated('table', 'sevenSwitch')
+    handCards = seatZone('handCards')
+    topCards = seatZone('topCards')
+    bottomCards = seatZone('bottomCards')
+
+    def __init__(self, table, playerIndex, broadcastUpdate, playerNicknames):
         super().__init__()
-        self.deck = deck
+        self.table = table
+        # Stays this seat's PlayerState when the table is reseated
+        self.player = table.player(playerIndex)
         self.playerIndex = playerIndex
-        self.numPlayers = numPlayers
         self.selectedCards = []
-        self.sevenSwitch = False
-        self.pile = []
         self.playerNicknames = playerNicknames
-        self.handCards = handCards
-        self.topCards = []
-        self.clockwise = None
-        self.bottomCards = bottomCards 
         self.broadcastUpdate = broadcastUpdate
         self.topCardConfirms = 0
-        self.currentPlayer = None
         self.gameWon = False
-        
-        self.allPlayerCards = {
-            self.playerIndex: {
-                'handCards': self.handCards,
-                'topCards': self.topCards,
-                'bottomCards': self.bottomCards,
-            }
-        }
+        self.pickUpPending = False
 
     def startGame(self):
         self.updatePlayerHandSignal.emit(self.handCards)
     
     def updatePlayableCards(self):
+        pile, sevenSwitch = self.pile, self.sevenSwitch
         for i, card in enumerate(self.handCards):
-            isPlayable = self.isCardPlayable(card) or card[3]
+            isPlayable = isCardPlayable(card, pile, sevenSwitch) or card[3]
             self.updateCardStateSignal.emit(i, isPlayable)
     
     def isCardPlayable(self, card):
-        topCard = self.pile[-1] if self.pile else None
-        if self.sevenSwitch:
-            return VALUES[card[0]] <= 7 or card[0] in ['2', '10']
-        if not topCard:
-            return True 
-        if card[3]:
-            return True
-        return card[0] == '2' or card[0] == '10' or VALUES[card[0]] >= VALUES[topCard[0]]
+        return isCardPlayable(card, self.pile, self.sevenSwitch)
     
     def prepareCardPlacement(self, cardIndex, cardLabel):
         card = self.handCards[cardIndex]
         if self.topCardSelectionPhase:
             if (cardIndex, card) in self.selectedCards:
                 self.selectedCards.remove((cardIndex, card))
-                cardLabel.setStyleSheet("border: 2px solid transparent; background-color: transparent;")
+                cardLabel.setSelected(False)
             elif len(self.selectedCards) < 3:
                 self.selectedCards.append((cardIndex, card))
-                cardLabel.setStyleSheet("border: 2px solid blue; background-color: transparent;")
+                cardLabel.setSelected(True)
 
             self.selectedCardsChanged.emit(len(self.selectedCards))
         else:
             if (card, cardLabel) in self.selectedCards:
                 self.selectedCards.remove((card, cardLabel))
-                cardLabel.setStyleSheet("border: 0px solid black; background-color: transparent;")
+                cardLabel.setSelected(False, borderless=True)
             else:
                 if card[3] or self.isCardPlayable(card):
                     self.selectedCards.append((card, cardLabel))
-                    cardLabel.setStyleSheet("border: 2px solid blue; background-color: transparent;")
+                    cardLabel.setSelected(True)
                     
             selectedCardRank = card[0]
             for i, handCard in enumerate(self.handCards):
@@ -2075,15 +2741,16 @@ class GameController(QObject):
     def placeCard(self):
         playedCards = []
         pickUpFlag = False
+        pileSize = len(self.pile)
         # Add selected cards to the pile
         for card, label in self.selectedCards:
-            popped = self.handCards.pop(self.handCards.index(card))
+            popped = self.table.takeCard(self.player, 'handCards', card)
             if popped[2]:
-                popped = [card[0], card[1], False, False]
-                self.pile.append(popped)
+                popped = sharedCard(card[0], card[1])
+                self.table.addToPile(popped)
             elif card[3]:
-                popped = [card[0], card[1], card[2], False]
-                self.pile.append(popped)
+                popped = sharedCard(card[0], card[1], card[2], False)
+                self.table.addToPile(popped)
                 if not self.sevenSwitch:
                     if len(self.pile) >= 2 and self.pile[-1][0] not in {"2", "10"} and self.pile[-2][0] >= self.pile[-1][0]:
                         pickUpFlag = True
@@ -2093,32 +2760,34 @@ class GameController(QObject):
                         pickUpFlag = True
                         continue
             else:
-                self.pile.append(popped)
+                self.table.addToPile(popped)
             playedCards.append(popped)
         
         # Clear selected cards
         self.selectedCards.clear()
+        self.cardsPlayedSignal.emit(self.playerIndex, self.pile[pileSize:], len(self.deck))
 
         # Update the pile view
         self.updatePileSignal.emit(self.pile)
         self.broadcastUpdate('updatePile', {'pile': self.pile})
 
         if pickUpFlag:
+            self.pickUpPending = True
             QTimer.singleShot(1250, self.pickUpPile)
             return
         
-        # Draw a card if hand has fewer than 3 cards
-        while len(self.handCards) < 3 and self.deck:
-            newCard = self.deck.pop(0)
-            self.handCards.append(newCard)
+        # Draw back up to 3 cards; peers only need to know how many were drawn
+        drawn = self.deck.draw(3 - len(self.handCards)) if len(self.handCards) < 3 else []
+        self.table.addCards(self.player, 'handCards', drawn)
             
         self.updatePlayerHandSignal.emit(self.handCards)
         self.updateDeckSignal.emit(self.deck)
-        self.broadcastUpdate('updateDeck', {'deck': self.deck})
+        if drawn:
+            self.broadcastUpdate('drawCards', {'count': len(drawn)})
 
         if self.checkFourOfAKind():
             print("Four of a kind! Clearing the pile.\n")
-            self.pile.clear()
+            self.table.burn()
             self.updatePileSignal.emit(self.pile)
             self.broadcastUpdate('updatePile', {'pile': self.pile})
             self.updatePileLabelSignal.emit("Pile:\nBombed!!!")
@@ -2141,7 +2810,7 @@ class GameController(QObject):
                 QTimer.singleShot(1250, self.gameOver)
             return
         elif '10' in [card[0] for card in playedCards]:
-            self.pile.clear()
+            self.table.burn()
             self.updatePileSignal.emit(self.pile)
             self.broadcastUpdate('updatePile', {'pile': self.pile})
             self.updatePileLabelSignal.emit("Pile:\nBombed!!!")
@@ -2166,11 +2835,13 @@ class GameController(QObject):
         self.rotateTurn()
     
     def pickUpPile(self):
+        # Only a bottom card that could not be played leaves a pickup pending
+        self.pileTakenSignal.emit(self.playerIndex, self.pickUpPending)
+        self.pickUpPending = False
         topFlag = False
         bottomFlag = False
-        self.handCards.extend(self.pile)
+        self.table.pickUp(self.player)
         self.updatePlayerHandSignal.emit(self.handCards)
-        self.pile.clear()
         print(f"Player {self.playerIndex} picks up the pile\n")
         topCardsIndices = [index for index, card in enumerate(self.handCards) if card[2]]
         bottomCardsIndices = [index for index, card in enumerate(self.handCards) if card[3]]
@@ -2178,16 +2849,14 @@ class GameController(QObject):
         bottomFlag = any(card[3] for card in self.handCards)
         if topFlag:
             self.topCards = [self.handCards[index] for index in topCardsIndices]
-            for index in sorted(topCardsIndices, reverse=True):
-                self.handCards.pop(index)
+            self.handCards = [card for card in self.handCards if not card[2]]
             self.updateTopCardsSignal.emit(self.topCards)
             self.updatePlayerHandSignal.emit(self.handCards)
             print(self.topCards)
             print(self.handCards)
         elif bottomFlag:
             self.bottomCards = [self.handCards[index] for index in bottomCardsIndices]
-            for index in sorted(bottomCardsIndices, reverse=True):
-                self.handCards.pop(index)
+            self.handCards = [card for card in self.handCards if not card[3]]
             self.updateBottomCardsSignal.emit(self.bottomCards)
             self.updatePlayerHandSignal.emit(self.handCards)
             print(self.bottomCards)
@@ -2207,16 +2876,33 @@ class GameController(QObject):
         else:
             self.currentPlayer = (self.currentPlayer - 2) % self.numPlayers + 1
         self.currentPlayerChangedSignal.emit(self.currentPlayer)
-        self.broadcastUpdate('updateCurrentPlayer', {'currentPlayer': self.currentPlayer})
+        self.broadcastUpdate('updateCurrentPlayer', {'currentPlayer': self.currentPlayer, 'checksum': self.checksum()})
+
+    def checksum(self):
+        """
+        Zobrist checksum of this seat's copy of the table, sent with every turn change so
+        peers can detect a desync. The seven-switch is left out since the player who sets
+        it only broadcasts it.
+        """
+        return self.table.checksum()
+
+    def verifyChecksum(self, checksum):
+        """
+        Compare a peer's checksum with this seat's table after a turn change.
+        """
+        if checksum != self.checksum():
+            print(f"Desync detected by Player {self.playerIndex}: expected checksum {checksum:016x}, got {self.checksum():016x}")
+            table = self.table
+            if self.checksum() != tableChecksum(table.players, table.pile, table.deck, table.currentPlayer):
+                print(f"Player {self.playerIndex}'s running checksum no longer matches its table")
+            return False
+        return True
     
     def confirmTopCards(self):
         # Move selected cards to top cards
-        for index, card in self.selectedCards:
-            card = [card[0], card[1], True, False]
-            self.topCards.append(card)
-            self.handCards[index] = None
-
-        self.handCards = [card for card in self.handCards if card is not None]
+        selected = {index for index, card in self.selectedCards}
+        self.topCards = self.topCards + [sharedCard(card[0], card[1], True, False) for index, card in self.selectedCards]
+        self.handCards = [card for index, card in enumerate(self.handCards) if index not in selected]
         self.selectedCards.clear()
 
         self.topCardSelectionPhase = False
@@ -2292,29 +2978,20 @@ class GameController(QObject):
             'bottomCards': self.bottomCards
         }
         self.broadcastUpdate('updateCards', payload)
-        self.allPlayerCards[self.playerIndex] = {
-            'handCards': self.handCards,
-            'topCards': self.topCards,
-            'bottomCards': self.bottomCards,
-        }
     
     def updateOtherPlayerHand(self, playerIndex, handCards, topCards, bottomCards):
         """
         Update the hand cards of another player.
         """
-        self.allPlayerCards[playerIndex] = {
-            'handCards': handCards,
-            'topCards': topCards,
-            'bottomCards': bottomCards,
-        }
+        self.table.setCards(playerIndex, handCards, topCards, bottomCards)
+        player = self.table.player(playerIndex)
         if playerIndex != self.playerIndex:  
-            self.updateOtherPlayerCardsSignal.emit(playerIndex, handCards, topCards, bottomCards)
+            self.updateOtherPlayerCardsSignal.emit(playerIndex, player.handCards, player.topCards, player.bottomCards)
     
     def calculateRankTotals(self):
         rankTotals = {}
-        for playerIndex, cards in self.allPlayerCards.items():
-            topCards = cards.get('topCards', [])
-            total = sum(RANKS[card[0]] for card in topCards)
+        for playerIndex, player in self.table.seats():
+            total = sum(RANKS[card[0]] for card in player.topCards)
             rankTotals[playerIndex] = total
         
         lowestPlayer = min(rankTotals, key=rankTotals.get)
@@ -2340,10 +3017,380 @@ class GameController(QObject):
         self.startMainViewSignal.emit()
         
     
+### Offline Game ###
+class AITask:
+    """
+    One AI decision queued on an AIExecutor. stop() asks a running search to finish
+    now with the best move it has found so far; cancel() also drops the result.
+    """
+    def __init__(self, function, callback, fallback):
+        self.function = function
+        self.callback = callback
+        self.fallback = fallback
+        self.stopEvent = threading.Event()
+        self.cancelled = False
+
+    def stop(self):
+        self.stopEvent.set()
+
+    def cancel(self):
+        self.cancelled = True
+        self.stopEvent.set()
+
+class AIExecutor(QObject):
+    """
+    Runs AI decisions one at a time on a worker thread, so a search never blocks the
+    GUI thread. Each task's function is called with the task's stop event and its
+    result is handed to the task's callback on the GUI thread through a queued signal.
+    """
+    taskFinished = Signal(object, object)
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self.tasks = queue.Queue()
+        self.taskFinished.connect(self.deliver, Qt.ConnectionType.QueuedConnection)
+        self.worker = threading.Thread(target=self.run, daemon=True)
+        self.worker.start()
+
+    def submit(self, function, callback, fallback=None):
+        """
+        Queue function(stopEvent); callback(result) runs on the GUI thread unless the
+        returned task is cancelled first. If function raises, the result is that of
+        fallback(stopEvent) instead, or None when there is none or it raises too, so
+        the callback always runs.
+        """
+        task = AITask(function, callback, fallback)
+        self.tasks.put(task)
+        return task
+
+    def run(self):
+        while True:
+            task = self.tasks.get()
+            if task is None:
+                return
+            if task.cancelled:
+                continue
+            try:
+                result = task.function(task.stopEvent)
+            except Exception as e:
+                print(f"AI task failed: {e}")
+                result = self.runFallback(task)
+            self.taskFinished.emit(task, result)
+
+    def runFallback(self, task):
+        if task.fallback is None:
+            return None
+        try:
+            return task.fallback(task.stopEvent)
+        except Exception as e:
+            print(f"AI task fallback failed: {e}")
+            return None
+
+    @Slot(object, object)
+    def deliver(self, task, result):
+        if not task.cancelled:
+            task.callback(result)
+
+    def shutdown(self):
+        self.tasks.put(None)
+
+class AIPlayer(QObject):
+    """
+    Plays one offline seat. Decisions are computed on the shared AIExecutor from a
+    snapshot of the seat's GameController and applied back on the GUI thread.
+    """
+    # Minimum time a move takes, so AI turns can be followed on screen
+    MOVE_DELAY_MS = 700
+
+    def __init__(self, controller, difficulty, executor):
+        super().__init__()
+        self.controller = controller
+        self.difficulty = difficulty
+        self.executor = executor
+        self.tracker = CardTracker(controller.numPlayers)
+        self.task = None
+        self.thinking = False
+        self.active = True
+
+    def stop(self):
+        self.active = False
+        if self.task is not None:
+            self.task.cancel()
+
+    def observePlay(self, playerIndex, cards, deckCount):
+        """
+        Follow cards placed on the pile by playerIndex; deckCount is the deck size before they drew.
+        """
+        self.tracker.observePlay(playerIndex - 1, [RANK_INDEX[card[0]] for card in cards], deckCount)
+
+    def observePickUp(self, playerIndex, blind):
+        self.tracker.pickUp(playerIndex - 1, blind)
+
+    def chooseTopCards(self):
+        hand = list(self.controller.handCards)
+        self.task = self.executor.submit(
+            lambda stopEvent: chooseTopCards(hand, self.difficulty),
+            self.applyTopCards,
+            lambda stopEvent: chooseTopCards(hand, 'Easy'),
+        )
+
+    def applyTopCards(self, indices):
+        if not self.active:
+            return
+        if indices is None:
+            indices = [0, 1, 2]
+        self.controller.selectedCards = [(index, self.controller.handCards[index]) for index in indices]
+        self.controller.confirmTopCards()
+
+    def takeTurn(self):
+        if self.thinking or not self.active:
+            return
+        self.thinking = True
+        controller = self.controller
+        # Opponents are reduced to what is visible on the table: card counts and top cards
+        opponents = {}
+        for index, player in controller.table.seats():
+            if index == controller.playerIndex:
+                continue
+            handCards = player.handCards
+            opponents[index] = {
+                'handCount': sum(1 for card in handCards if not card[2] and not card[3]),
+                'topCards': list(player.topCards) + [card for card in handCards if card[2]],
+                'bottomCount': len(player.bottomCards) + sum(1 for card in handCards if card[3]),
+            }
+        state = {
+            'hand': list(controller.handCards),
+            'pile': list(controller.pile),
+            'sevenSwitch': controller.sevenSwitch,
+            'deckCount': len(controller.deck),
+            'seat': controller.playerIndex,
+            'numPlayers': controller.numPlayers,
+            'clockwise': controller.clockwise,
+            'topCards': list(controller.topCards),
+            'bottomCount': len(controller.bottomCards),
+            'opponents': opponents,
+            'tracking': self.tracker.snapshot(),
+        }
+        turnStart = time.monotonic()
+        # Easy only looks at the seat's own hand, so it stands in if the difficulty fails;
+        # should that fail too, the None result picks up the pile
+        self.task = self.executor.submit(
+            lambda stopEvent: chooseMove(state, self.difficulty, stopEvent=stopEvent),
+            partial(self.moveChosen, turnStart),
+            lambda stopEvent: chooseMove(state, 'Easy'),
+        )
+
+    def moveChosen(self, turnStart, indices):
+        # Pad quick decisions out to MOVE_DELAY_MS with a timer rather than sleeping on the worker
+        remaining = self.MOVE_DELAY_MS - (time.monotonic() - turnStart) * 1000
+        QTimer.singleShot(max(0, int(remaining)), partial(self.applyMove, indices))
+
+    def applyMove(self, indices):
+        self.thinking = False
+        controller = self.controller
+        if not self.active or controller.gameWon or controller.currentPlayer != controller.playerIndex:
+            return
+        if not indices:
+            controller.pickUpPile()
+            return
+        controller.selectedCards = [(controller.handCards[index], None) for index in indices]
+        controller.placeCard()
+        # 2s, 10s and four of a kind keep the turn
+        if not controller.pickUpPending and not controller.gameWon and controller.currentPlayer == controller.playerIndex:
+            self.takeTurn()
+
+class OfflineGameView(QObject):
+    """
+    Runs an offline game: deals the cards, gives the human seat (always Player 1) a
+    GameView and every other seat an AIPlayer, and relays each controller's
+    broadcastUpdate to the others through an in-process loopback instead of sockets.
+    """
+    HUMAN_INDEX = 1
+
+    def __init__(self, mainMenu, numPlayers, difficulty, parentCoords):
+        super().__init__()
+        self.mainMenu = mainMenu
+        self.numPlayers = numPlayers
+        self.difficulty = difficulty
+        self.parentCoords = parentCoords
+        self.controllers = {}
+        self.aiPlayers = {}
+        self.gameView = None
+        self.gameOverDialog = None
+        self.marshaller = GuiMarshaller(self)
+        self.aiExecutor = AIExecutor(self)
+        self.dispatcher = ActionDispatcher({
+            'updateCards': self.handleUpdateCards,
+            'confirmedTopCards': self.handleConfirmedTopCards,
+            'startMainGame': self.handleStartMainGame,
+            'updateCurrentPlayer': self.handleUpdateCurrentPlayer,
+            'updateDeck': self.handleUpdateDeck,
+            'drawCards': self.handleDrawCards,
+            'updatePile': self.handleUpdatePile,
+            'updatePileLabel': self.handleUpdatePileLabel,
+            'sevenSwitch': self.handleSevenSwitch,
+            'gameOver': self.handleGameOver,
+            'gameEnd': self.handleGameEnd,
+            'gameClose': self.handleGameClose,
+        })
+
+    def wireCopy(self, data):
+        """
+        Copy data the way the socket protocol would, so every seat gets its own lists.
+        """
+        return json.loads(json.dumps(data))
+
+    def startGame(self):
+        # The search workers only pay off for these seats, so they start with the first such game
+        if self.difficulty in PARALLEL_DIFFICULTIES:
+            warmSearchPool()
+        # Every seat gets its own table from the deal, as clients do from deckSync
+        deckSync = TableState.deal(newDeck(), self.numPlayers).deckSyncData()
+        self.controllers = {
+            playerIndex: GameController(TableState.fromDeckSync(self.wireCopy(deckSync)), playerIndex, self.loopbackFor(playerIndex), {})
+            for playerIndex in range(1, self.numPlayers + 1)
+        }
+        self.aiPlayers = {
+            playerIndex: AIPlayer(controller, self.difficulty, self.aiExecutor)
+            for playerIndex, controller in self.controllers.items() if playerIndex != self.HUMAN_INDEX
+        }
+        # The AI seats track cards from every move as it is made, not from the pile updates
+        for controller in self.controllers.values():
+            controller.cardsPlayedSignal.connect(self.observePlay)
+            controller.pileTakenSignal.connect(self.observePickUp)
+
+        humanController = self.controllers[self.HUMAN_INDEX]
+        self.gameView = createGameView(humanController, self.parentCoords, self.numPlayers, self.mainMenu)
+        self.gameView.show()
+        humanController.startGame()
+        for aiPlayer in self.aiPlayers.values():
+            aiPlayer.chooseTopCards()
+
+    def loopbackFor(self, sender):
+        def broadcastUpdate(action, data):
+            self.marshaller.post(self.deliver, sender, self.wireCopy({"action": action, **data}))
+        return broadcastUpdate
+
+    def deliver(self, sender, data):
+        try:
+            self.dispatcher.dispatch(data, sender)
+        except ProtocolError as e:
+            print(f"Ignored offline message from Player {sender}: {e}")
+
+    def receivers(self, sender):
+        return [controller for playerIndex, controller in self.controllers.items() if playerIndex != sender]
+
+    def handleUpdateCards(self, data, sender):
+        for controller in self.receivers(sender):
+            controller.updateOtherPlayerHand(data['playerIndex'], data['handCards'], data['topCards'], data['bottomCards'])
+
+    def handleConfirmedTopCards(self, data, sender):
+        # Player 1 plays the host's part and starts the main game once everyone confirmed
+        if sender != self.HUMAN_INDEX:
+            humanController = self.controllers[self.HUMAN_INDEX]
+            humanController.topCardConfirms += 1
+            humanController.checkAllPlayersConfirmed()
+
+    def handleStartMainGame(self, data, sender):
+        for controller in self.receivers(sender):
+            controller.clockwise = data['direction']
+            controller.startMainGame(data['lowestPlayer'])
+        self.promptPlayer(data['lowestPlayer'])
+
+    def handleUpdateCurrentPlayer(self, data, sender):
+        for controller in self.receivers(sender):
+            controller.currentPlayer = data['currentPlayer']
+            controller.verifyChecksum(data['checksum'])
+        if sender != self.HUMAN_INDEX:
+            self.gameView.updateCurrentPlayer(data['currentPlayer'])
+        self.promptPlayer(data['currentPlayer'])
+
+    def handleUpdateDeck(self, data, sender):
+        for controller in self.receivers(sender):
+            controller.deck = self.wireCopy(data['deck'])
+        if sender != self.HUMAN_INDEX:
+            self.gameView.updateDeck(data['deck'])
+
+    def handleDrawCards(self, data, sender):
+        for controller in self.receivers(sender):
+            controller.deck.draw(data['count'])
+        if sender != self.HUMAN_INDEX:
+            self.gameView.updateDeck(self.controllers[self.HUMAN_INDEX].deck)
+
+    def handleUpdatePile(self, data, sender):
+        for controller in self.receivers(sender):
+            controller.pile = self.wireCopy(data['pile'])
+        if sender != self.HUMAN_INDEX:
+            self.gameView.updatePile(data['pile'])
+
+    def handleUpdatePileLabel(self, data, sender):
+        if sender != self.HUMAN_INDEX:
+            self.gameView.updatePileLabel(data['pileLabel'])
+
+    def handleSevenSwitch(self, data, sender):
+        for controller in self.receivers(sender):
+            controller.sevenSwitch = data['sevenSwitch']
+
+    def handleGameOver(self, data, sender):
+        self.stopAIPlayers()
+        self.gameView.gameOver(data['winner'])
+        self.showGameOverDialog(data['winner'])
+
+    def handleGameEnd(self, data, sender):
+        self.stopAIPlayers()
+        self.showGameOverDialog(data['winner'])
+
+    def handleGameClose(self, data, sender):
+        self.stopAIPlayers()
+
+    def observePlay(self, playerIndex, cards, deckCount):
+        for aiPlayer in self.aiPlayers.values():
+            aiPlayer.observePlay(playerIndex, cards, deckCount)
+
+    def observePickUp(self, playerIndex, blind):
+        for aiPlayer in self.aiPlayers.values():
+            aiPlayer.observePickUp(playerIndex, blind)
+
+    def promptPlayer(self, playerIndex):
+        aiPlayer = self.aiPlayers.get(playerIndex)
+        if aiPlayer:
+            aiPlayer.takeTurn()
+
+    def stopAIPlayers(self):
+        for aiPlayer in self.aiPlayers.values():
+            aiPlayer.stop()
+
+    def showGameOverDialog(self, winner):
+        QTimer.singleShot(0, lambda: self._showGameOverDialogInMainThread(winner))
+
+    def _showGameOverDialogInMainThread(self, winner):
+        self.gameOverDialog = GameOverDialog(winner, self.gameView.geometry(), 1)
+        self.gameOverDialog.playAgainSignal.connect(self.playAgain)
+        self.gameOverDialog.mainMenuSignal.connect(self.returnToMainMenu)
+        self.gameOverDialog.exitSignal.connect(QApplication.instance().quit)
+        self.gameOverDialog.exec()
+
+    def playAgain(self):
+        self.gameOverDialog.accept()
+        self.gameView.hide()
+        self.gameView.deleteLater()
+        self.startGame()
+
+    def returnToMainMenu(self):
+        self.stopAIPlayers()
+        self.aiExecutor.shutdown()
+        self.gameView.returnToMainMenu()
+
+    def close(self):
+        self.stopAIPlayers()
+        self.aiExecutor.shutdown()
+        if self.gameView:
+            self.gameView.hide()
+
 ### Main Application ###
 if __name__ == "__main__":
     app = QApplication(sys.argv)
-    app.setStyleSheet(Dark)
+    app.setStyleSheet(darkStyleSheet())
     homeMenu = HomeMenu()
     def onExit():
         # Ensure all resources are cleaned up
@@ -2351,6 +3398,8 @@ if __name__ == "__main__":
             homeMenu.localGame.close()
         if hasattr(homeMenu, 'onlineMenu') and homeMenu.onlineMenu:
             homeMenu.onlineMenu.close()
+        homeMenu.cardPreloader.stop()
+        shutdownSearchPool()
 
     app.aboutToQuit.connect(onExit)  # Ensure cleanup on app exit
     homeMenu.show()
@@ -0,0 +1,656 @@
+"""
+AI players for offline games. Decisions are plain functions of a state snapshot so
+they can run on a worker thread (or in headless tools) without touching Qt.
+
+Easy plays at random, Medium plays the move palaceEval scores best. Hard and Impossible run an information set
+Monte Carlo tree search (ISMCTS) over palaceRules.PalaceState: every iteration deals
+the cards the seat cannot see at random (a determinization) and plays the game out.
+"""
+import os
+import math
+import time
+import random
+import threading
+import multiprocessing
+from itertools import combinations
+from concurrent.futures import FIRST_COMPLETED, BrokenExecutor, ProcessPoolExecutor, wait
+from concurrent.futures import TimeoutError as FutureTimeoutError
+from palaceEndgame import EndgameSolver, SolverLimitExceeded, isEndgame
+from palaceEval import bestMoves, positionFromObservation, scoreMoves
+from palaceRules import (
+    RANKS, RANK_INDEX, RANK_NAMES, NUM_RANKS, TWO, TEN, PICK_UP, BLIND,
+    PalaceState, decodeMove, isCardPlayable,
+)
+
+AI_DIFFICULTIES = ['Easy', 'Medium', 'Hard', 'Impossible']
+
+# Seconds of search per move for the difficulties that use ISMCTS. A core runs about 4k
+# iterations a second (a playout is around 50 moves of PalaceState.apply), so Hard searches
+# about 200 iterations a move. Against Medium in two player games (palaceSim --iterations,
+# 200 games each, 100 at 2400) search wins 60% of games at 50 iterations, 65% at 150, 68%
+# at 600 and 67% at 2400: past a few hundred iterations more playouts buy nothing
+# measurable. Hard sits on that plateau, and Impossible's longer budget is for the endgame
+# solver, which averages over more determinizations the longer it has.
+AI_TIME_BUDGETS = {'Hard': 0.05, 'Impossible': 0.2}
+
+# Difficulties whose search is spread over the shared process pool, when it is running
+PARALLEL_DIFFICULTIES = {'Impossible'}
+
+# Difficulties that solve the endgame exactly once the deck is empty and few cards are left
+ENDGAME_DIFFICULTIES = {'Impossible'}
+
+# Determinizations the endgame solver averages over when a search is bounded by
+# iterations instead of time (engineMove's maxIterations)
+FIXED_ENDGAME_SOLVES = 16
+
+# Extra seconds to wait for pool workers beyond the search budget before giving up
+SEARCH_POOL_TIMEOUT = 2.0
+
+# Seconds to wait for the pool workers to start before searching without them
+SEARCH_POOL_STARTUP_TIMEOUT = 10.0
+
+# Seconds between checks of the stop event while waiting for pool workers
+STOP_POLL_INTERVAL = 0.01
+
+# Shared by every AI seat in the process, so solved positions carry over between moves
+endgameSolver = EndgameSolver(lambda state: candidateMoves(state))
+
+# Shared process pool for parallel search and its size, set by startSearchPool() once
+# the workers are running
+searchPool = None
+searchWorkers = 0
+searchPoolLock = threading.Lock()
+# Shared counter bumped to stop every worker search started before it (see GenerationStop)
+searchGeneration = None
+
+# UCB exploration constant used while selecting children during search
+EXPLORATION = 0.7
+
+# Chance that a playout picks a random legal move instead of the heuristic one
+PLAYOUT_RANDOMNESS = 0.1
+
+# Top card rule for Medium and up, fitted to self-play by fitTopCards.py: the win chance
+# each rank adds when placed on top, plus a bonus when the 3 top cards hold a pair
+TOP_CARD_WEIGHTS = {
+    '2': 0.2551, '3': 0.0413, '4': 0.0524, '5': 0.0557, '6': 0.0500, '7': 0.0956, '8': 0.0798,
+    '9': 0.1016, '10': 0.2404, 'J': 0.1176, 'Q': 0.1391, 'K': 0.1698, 'A': 0.2014,
+}
+TOP_PAIR_BONUS = 0.0213
+
+# Playout policy: lowest ordinary rank first, then 10s, then 2s
+PLAYOUT_ORDER = [rank for rank in range(NUM_RANKS) if rank not in (TWO, TEN)] + [TEN, TWO]
+
+def bestTopRanks(ranks):
+    """
+    The 3 rank indices of a hand with the highest TOP_CARD_WEIGHTS total (plus
+    TOP_PAIR_BONUS for a pair), ties going to the higher RANKS total.
+    """
+    def score(topRanks):
+        names = [RANK_NAMES[rank] for rank in topRanks]
+        pair = len(set(topRanks)) < 3
+        return sum(TOP_CARD_WEIGHTS[name] for name in names) + (TOP_PAIR_BONUS if pair else 0.0), sum(RANKS[name] for name in names)
+    return list(max(combinations(sorted(ranks), 3), key=score))
+
+def bestTopCards(hand):
+    """
+    Indices of the 3 cards of a hand (value, suit, ...) that bestTopRanks places on top.
+    """
+    remaining = list(range(len(hand)))
+    indices = []
+    for rank in bestTopRanks([RANK_INDEX[card[0]] for card in hand]):
+        index = next(i for i in remaining if RANK_INDEX[hand[i][0]] == rank)
+        remaining.remove(index)
+        indices.append(index)
+    return indices
+
+def chooseTopCards(hand, difficulty, rng=random):
+    """
+    Indices of the 3 hand cards to place face up during top card selection.
+    """
+    if difficulty == 'Easy':
+        return rng.sample(range(len(hand)), 3)
+    return bestTopCards(hand)
+
+def playableGroups(hand, pile, sevenSwitch):
+    """
+    Map each playable value in hand to the indices of the cards that can be placed together.
+    """
+    groups = {}
+    for i, card in enumerate(hand):
+        if not card[3] and isCardPlayable(card, pile, sevenSwitch):
+            groups.setdefault(card[0], []).append(i)
+    return groups
+
+def chooseMove(state, difficulty, rng=random, timeBudget=None, stopEvent=None):
+    """
+    Pick the cards to place for a seat. Setting stopEvent (a threading.Event) while
+    the search runs makes it return the best move found so far.
+
+    state is a snapshot dict with 'hand', 'pile', 'sevenSwitch' and 'deckCount'; all
+    but Easy also need 'seat', 'numPlayers', 'clockwise', 'topCards', 'bottomCount' and
+    'opponents' (see observe()), and may carry a CardTracker snapshot as 'tracking'.
+    timeBudget overrides AI_TIME_BUDGETS.
+    Returns indices into state['hand'], or an empty list to pick up the pile.
+    """
+    hand = state['hand']
+    if difficulty == 'Easy':
+        blind = [i for i, card in enumerate(hand) if card[3]]
+        if blind and len(blind) == len(hand):
+            # Bottom cards are face down: any of them is as good as another
+            return [rng.choice(blind)]
+        groups = playableGroups(hand, state['pile'], state['sevenSwitch'])
+        if not groups:
+            return []
+        indices = groups[rng.choice(list(groups))]
+        return indices[:rng.randint(1, len(indices))]
+    observation = observe(state)
+    if difficulty not in AI_TIME_BUDGETS:
+        move = evaluatedMove(observation, rng)
+    else:
+        if timeBudget is None:
+            timeBudget = AI_TIME_BUDGETS[difficulty]
+        move = None
+        if difficulty in ENDGAME_DIFFICULTIES and not observation['deckCount']:
+            move = endgameMove(observation, timeBudget, rng, stopEvent)
+        if move is None and difficulty in PARALLEL_DIFFICULTIES and searchPool is not None:
+            move, _ = parallelSearchMove(observation, timeBudget, searchPool, searchWorkers, rng, stopEvent)
+        elif move is None:
+            move, _ = searchMove(observation, timeBudget, rng, stopEvent=stopEvent)
+    return moveToIndices(move, hand, rng)
+
+def evaluatedMove(observation, rng=random):
+    """
+    Medium: the candidate move palaceEval scores highest. The seat's own cards are known,
+    so any determinization gives the same candidates.
+    """
+    moves = candidateMoves(determinize(observation, rng))
+    if len(moves) <= 1:
+        return moves[0] if moves else PICK_UP
+    scores = scoreMoves([positionFromObservation(observation)], [moves])[0]
+    return moves[max(range(len(moves)), key=lambda i: scores[i])]
+
+def moveToIndices(move, hand, rng=random):
+    """
+    Translate an engine move back into indices of the seat's hand cards.
+    """
+    if move == PICK_UP:
+        return []
+    if move == BLIND:
+        return [rng.choice([i for i, card in enumerate(hand) if card[3]])]
+    rank, count = decodeMove(move)
+    value = RANK_NAMES[rank]
+    return [i for i, card in enumerate(hand) if card[0] == value and not card[3]][:count]
+
+def rankCounts(cards):
+    counts = [0] * NUM_RANKS
+    for card in cards:
+        counts[RANK_INDEX[card[0]]] += 1
+    return counts
+
+def observe(state):
+    """
+    Reduce a seat's snapshot to what that seat is allowed to know, in engine terms
+    (players numbered from 0). 'opponents' maps player index to a dict with the
+    'handCount', 'topCards' and 'bottomCount' of that player.
+    Cards in hand flagged as top cards are public, flagged bottom cards are unknown.
+    """
+    numPlayers = state['numPlayers']
+    seat = state['seat'] - 1
+    hand = [card for card in state['hand'] if not card[2] and not card[3]]
+    tops = [[0] * NUM_RANKS for _ in range(numPlayers)]
+    handSizes = [0] * numPlayers
+    bottomCounts = [0] * numPlayers
+    tops[seat] = rankCounts(list(state['topCards']) + [card for card in state['hand'] if card[2]])
+    handSizes[seat] = len(hand)
+    bottomCounts[seat] = state['bottomCount'] + sum(1 for card in state['hand'] if card[3])
+    for index, player in state['opponents'].items():
+        tops[index - 1] = rankCounts(player['topCards'])
+        handSizes[index - 1] = player['handCount']
+        bottomCounts[index - 1] = player['bottomCount']
+    pile = [RANK_INDEX[card[0]] for card in state['pile']]
+    unseen = [4] * NUM_RANKS
+    for counts in [rankCounts(hand)] + tops + [rankCounts(state['pile'])]:
+        for rank, count in enumerate(counts):
+            unseen[rank] -= count
+    observation = {
+        'numPlayers': numPlayers,
+        'seat': seat,
+        'direction': 1 if state['clockwise'] else -1,
+        'hand': rankCounts(hand),
+        'tops': tops,
+        'handSizes': handSizes,
+        'bottomCounts': bottomCounts,
+        'pile': pile,
+        'sevenSwitch': state['sevenSwitch'],
+        'deckCount': state['deckCount'],
+        'unseen': unseen,
+    }
+    if state.get('tracking'):
+        addTracking(observation, state['tracking'])
+    return observation
+
+def addTracking(observation, tracking):
+    """
+    Add a palaceTracker.CardTracker snapshot to an observation: burned cards are no
+    longer unseen, and 'known' and 'lacking' give the other players' known hand cards
+    and the ranks they are assumed not to hold, for determinize().
+    """
+    seat = observation['seat']
+    unseen = observation['unseen']
+    for rank, count in enumerate(tracking['burned']):
+        unseen[rank] -= count
+    observation['known'] = [[0] * NUM_RANKS if player == seat else counts for player, counts in enumerate(tracking['known'])]
+    observation['lacking'] = tracking['lacking']
+    return observation
+
+def observeState(state, seat, tracker=None):
+    """
+    The observation a seat has of a full PalaceState, for headless games between AIs,
+    with what tracker (a palaceTracker.CardTracker following the game) has inferred.
+    """
+    # Only the rank on top of the pile matters to the rules, so the order below it is arbitrary
+    pile = []
+    for rank, count in enumerate(state.pile):
+        if rank != state.pileTop:
+            pile.extend([rank] * count)
+    if state.pileSize:
+        pile.extend([state.pileTop] * state.pile[state.pileTop])
+    unseen = [4] * NUM_RANKS
+    for counts in [state.hands[seat], state.pile] + state.tops:
+        for rank, count in enumerate(counts):
+            unseen[rank] -= count
+    observation = {
+        'numPlayers': state.numPlayers,
+        'seat': seat,
+        'direction': state.direction,
+        'hand': state.hands[seat][:],
+        'tops': [top[:] for top in state.tops],
+        'handSizes': state.handSizes[:],
+        'bottomCounts': [len(bottom) for bottom in state.bottoms],
+        'pile': pile,
+        'sevenSwitch': state.sevenSwitch,
+        'deckCount': len(state.deck),
+        'unseen': unseen,
+    }
+    if tracker is not None:
+        addTracking(observation, tracker.snapshot())
+    return observation
+
+def determinize(observation, rng=random):
+    """
+    Build a PalaceState consistent with an observation, dealing the unseen cards at
+    random to the opponents' hands, every bottom card and the deck. Opponents get the
+    cards the observation's 'known' says they hold, and the rest of their hands avoid
+    the ranks they are 'lacking' where possible. Unseen cards left over are treated
+    as burned.
+    """
+    numPlayers = observation['numPlayers']
+    seat = observation['seat']
+    known = observation.get('known')
+    lacking = observation.get('lacking')
+    state = PalaceState(numPlayers)
+    state.current = seat
+    state.direction = observation['direction']
+    state.sevenSwitch = observation['sevenSwitch']
+    for rank in observation['pile']:
+        state.addToPile(rank, 1)
+    available = observation['unseen'][:]
+    if known:
+        for player in range(numPlayers):
+            if player == seat:
+                continue
+            room = observation['handSizes'][player]
+            hand = state.hands[player]
+            for rank, count in enumerate(known[player]):
+                count = min(count, available[rank], room)
+                if count > 0:
+                    hand[rank] = count
+                    available[rank] -= count
+                    room -= count
+    pool = [rank for rank, count in enumerate(available) for _ in range(count)]
+    rng.shuffle(pool)
+
+    def take(count, lackingRanks=None):
+        if count <= 0:
+            return []
+        dealt = []
+        if lackingRanks is not None and any(lackingRanks):
+            # Deal random cards of the ranks the player is not assumed to lack first,
+            # swapping the last card into each gap so the pool stays shuffled for the rest
+            allowed = [index for index, rank in enumerate(pool) if not lackingRanks[rank]]
+            for index in sorted(rng.sample(allowed, min(count, len(allowed))), reverse=True):
+                dealt.append(pool[index])
+                pool[index] = pool[-1]
+                pool.pop()
+        rest = count - len(dealt)
+        if rest > 0:
+            dealt.extend(pool[len(pool) - rest:])
+            del pool[len(pool) - rest:]
+        return dealt
+
+    for player in range(numPlayers):
+        state.tops[player] = observation['tops'][player][:]
+        state.topSizes[player] = sum(state.tops[player])
+        if player == seat:
+            state.hands[player] = observation['hand'][:]
+        else:
+            hand = state.hands[player]
+            for rank in take(observation['handSizes'][player] - sum(hand), lacking[player] if lacking else None):
+                hand[rank] += 1
+        state.handSizes[player] = sum(state.hands[player])
+    for player in range(numPlayers):
+        state.bottoms[player] = take(observation['bottomCounts'][player])
+    state.deck = take(observation['deckCount'])
+    state.rehash()
+    return state
+
+class SearchNode:
+    """
+    A node of the ISMCTS tree. player is the seat that made move to reach it; wins
+    counts playouts that seat went on to win. available counts the iterations in
+    which move was legal, since determinizations disagree about which moves exist.
+    """
+    __slots__ = ('move', 'parent', 'player', 'children', 'visits', 'wins', 'available')
+
+    def __init__(self, move=None, parent=None, player=None):
+        self.move = move
+        self.parent = parent
+        self.player = player
+        self.children = {}
+        self.visits = 0
+        self.wins = 0
+        self.available = 1
+
+    def selectChild(self, moves, exploration):
+        best = None
+        bestScore = -1.0
+        for move in moves:
+            child = self.children[move]
+            child.available += 1
+            score = child.wins / child.visits + exploration * math.sqrt(math.log(child.available) / child.visits)
+            if score > bestScore:
+                best = child
+                bestScore = score
+        return best
+
+def heuristicMove(state, difficulty, rng=random):
+    """
+    Engine counterpart of chooseMove for the difficulties that do not search, for
+    headless games. Easy plays a random amount of a random playable rank, Medium the
+    candidate move palaceEval scores highest.
+    """
+    if difficulty != 'Easy':
+        return bestMoves([state], [candidateMoves(state)])[0]
+    plays = [move for move in state.legalMoves() if move != PICK_UP]
+    if not plays:
+        return PICK_UP
+    if plays == [BLIND]:
+        return BLIND
+    zone = state.activeZone(state.current)
+    rank = rng.choice(sorted({decodeMove(move)[0] for move in plays}))
+    return rank * 5 + rng.randint(1, zone[rank])
+
+def engineTopCards(hand, difficulty, rng=random):
+    """
+    Engine counterpart of chooseTopCards: the 3 ranks of a 6 rank hand to place on top.
+    """
+    if difficulty == 'Easy':
+        return rng.sample(hand, 3)
+    return bestTopRanks(hand)
+
+def engineMove(state, difficulty, rng=random, timeBudget=None, tracker=None, maxIterations=None):
+    """
+    The move a difficulty makes for the current player of a full PalaceState, seeing
+    only what that player could see at the table (plus what tracker has inferred).
+    maxIterations bounds the search by iterations instead of time (and the endgame by
+    FIXED_ENDGAME_SOLVES solves), so the move depends only on rng.
+    """
+    if difficulty in AI_TIME_BUDGETS:
+        maxSolves = None
+        if maxIterations is not None:
+            timeBudget = math.inf
+            maxSolves = FIXED_ENDGAME_SOLVES
+        elif timeBudget is None:
+            timeBudget = AI_TIME_BUDGETS[difficulty]
+        observation = observeState(state, state.current, tracker)
+        if difficulty in ENDGAME_DIFFICULTIES and not state.deck:
+            move = endgameMove(observation, timeBudget, rng, maxSolves=maxSolves)
+            if move is not None:
+                return move
+        return searchMove(observation, timeBudget, rng, maxIterations)[0]
+    return heuristicMove(state, difficulty, rng)
+
+def candidateMoves(state):
+    """
+    The legal moves worth searching: every copy of an ordinary rank at once and a single
+    2 or 10 (extra copies of those only waste them). Picking up is only considered when
+    nothing can be played.
+    """
+    player = state.current
+    zone = state.activeZone(player)
+    if zone is None:
+        return [BLIND] if state.bottoms[player] else []
+    moves = []
+    for rank in range(NUM_RANKS):
+        count = zone[rank]
+        if count and state.isPlayable(rank):
+            moves.append(rank * 5 + (1 if rank == TWO or rank == TEN else count))
+    if not moves and state.pileSize:
+        moves.append(PICK_UP)
+    return moves
+
+def playoutMove(state, rng):
+    """
+    Fast default policy for playouts: the lowest playable ordinary rank (all copies),
+    then 10s and 2s, otherwise pick up. Occasionally plays a random legal move instead.
+    """
+    if rng.random() < PLAYOUT_RANDOMNESS:
+        return rng.choice(candidateMoves(state))
+    player = state.current
+    zone = state.activeZone(player)
+    if zone is None:
+        return BLIND if state.bottoms[player] else PICK_UP
+    for rank in PLAYOUT_ORDER:
+        if zone[rank] and state.isPlayable(rank):
+            return rank * 5 + zone[rank]
+    return PICK_UP
+
+def playout(state, rng=random):
+    """
+    Play state to the end and return the winner. Games that hit MAX_MOVES are
+    awarded to the player with the fewest cards left.
+    """
+    while not state.isTerminal():
+        state.apply(playoutMove(state, rng))
+    if state.winner is None:
+        return min(range(state.numPlayers), key=state.cardsLeft)
+    return state.winner
+
+def endgameMove(observation, timeBudget, rng=random, stopEvent=None, maxSolves=None):
+    """
+    Solve the endgame exactly for as many determinizations as fit in timeBudget (at
+    least one, at most maxSolves, stopping early once stopEvent is set) and play the
+    move with the best total win chance for the seat.
+    Returns None when the position is not an endgame or cannot be solved in time.
+    """
+    seat = observation['seat']
+    deadline = time.perf_counter() + timeBudget
+    totals = {}
+    solves = 0
+    while not totals or (
+        time.perf_counter() < deadline and not (stopEvent and stopEvent.is_set())
+        and (maxSolves is None or solves < maxSolves)
+    ):
+        state = determinize(observation, rng)
+        if not isEndgame(state):
+            return None
+        try:
+            values = endgameSolver.moveValues(state, deadline)
+        except SolverLimitExceeded:
+            return None
+        if not values:
+            return None
+        for move, moveValues in values.items():
+            totals[move] = totals.get(move, 0.0) + moveValues[seat]
+        solves += 1
+    return max(totals, key=totals.get)
+
+def searchTree(observation, timeBudget, rng=random, maxIterations=None, exploration=EXPLORATION, stopEvent=None):
+    """
+    Run ISMCTS from an observation for timeBudget seconds (or maxIterations, or until
+    stopEvent is set, whichever comes first) and return (root, iterations). The tree
+    is valid after every iteration, so stopping early just means fewer visits.
+    """
+    root = SearchNode()
+    deadline = time.perf_counter() + timeBudget
+    iterations = 0
+    while time.perf_counter() < deadline and (maxIterations is None or iterations < maxIterations):
+        if stopEvent is not None and stopEvent.is_set():
+            break
+        state = determinize(observation, rng)
+        node = root
+        moves = candidateMoves(state)
+        while moves and not state.isTerminal():
+            untried = [move for move in moves if move not in node.children]
+            if untried:
+                move = rng.choice(untried)
+                for known in moves:
+                    if known in node.children:
+                        node.children[known].available += 1
+                child = SearchNode(move, node, state.current)
+                node.children[move] = child
+                state.apply(move)
+                node = child
+                break
+            node = node.selectChild(moves, exploration)
+            state.apply(node.move)
+            moves = candidateMoves(state)
+        winner = playout(state, rng)
+        while node is not None:
+            node.visits += 1
+            if node.player == winner:
+                node.wins += 1
+            node = node.parent
+        iterations += 1
+    return root, iterations
+
+def bestRootMove(visits, observation, rng=random):
+    """
+    The most visited root move, or the Medium choice if nothing was searched.
+    """
+    if not visits:
+        return evaluatedMove(observation, rng)
+    return max(visits, key=visits.get)
+
+def searchMove(observation, timeBudget, rng=random, maxIterations=None, exploration=EXPLORATION, stopEvent=None):
+    """
+    Single threaded ISMCTS. Returns (move, iterations).
+    """
+    root, iterations = searchTree(observation, timeBudget, rng, maxIterations, exploration, stopEvent)
+    visits = {move: child.visits for move, child in root.children.items()}
+    return bestRootMove(visits, observation, rng), iterations
+
+class GenerationStop:
+    """
+    Stop event for a search in a pool worker: set once searchGeneration has moved on
+    from the generation the search was started in.
+    """
+    def __init__(self, generation):
+        self.generation = generation
+
+    def is_set(self):
+        return searchGeneration is not None and searchGeneration.value != self.generation
+
+def initWorker(generation):
+    global searchGeneration
+    searchGeneration = generation
+
+def searchRootVisits(observation, timeBudget, seed, generation=0):
+    """
+    Worker side of parallelSearchMove: an independent search returning root visit
+    counts, which are plain dicts and cheap to send back between processes.
+    """
+    root, iterations = searchTree(observation, timeBudget, random.Random(seed), stopEvent=GenerationStop(generation))
+    return {move: child.visits for move, child in root.children.items()}, iterations
+
+def warmUpWorker():
+    return os.getpid()
+
+def searchPoolContext():
+    """
+    The pool is started once Qt's threads are running, so its workers must not be forked
+    from this process: they come from a forkserver where there is one, else are spawned.
+    """
+    methods = multiprocessing.get_all_start_methods()
+    return multiprocessing.get_context('forkserver' if 'forkserver' in methods else 'spawn')
+
+def startSearchPool(workers=None):
+    """
+    Create the shared process pool used by parallel search and wait for its workers to
+    start before publishing it, so searches made meanwhile run on their own thread instead
+    of waiting for the workers. Safe to call from any thread. Returns the pool, or None if
+    the workers did not start.
+    """
+    global searchPool, searchWorkers, searchGeneration
+    with searchPoolLock:
+        if searchPool is None:
+            workers = workers or os.cpu_count() or 1
+            context = searchPoolContext()
+            generation = context.RawValue('i', 0)
+            pool = ProcessPoolExecutor(max_workers=workers, mp_context=context, initializer=initWorker, initargs=(generation,))
+            try:
+                for future in [pool.submit(warmUpWorker) for _ in range(workers)]:
+                    future.result(timeout=SEARCH_POOL_STARTUP_TIMEOUT)
+            except (BrokenExecutor, RuntimeError, OSError, FutureTimeoutError) as e:
+                print(f"Search pool did not start, searching locally: {e}")
+                pool.shutdown(wait=False, cancel_futures=True)
+                return None
+            searchWorkers, searchGeneration = workers, generation
+            searchPool = pool
+        return searchPool
+
+def warmSearchPool(workers=None):
+    """
+    Start the shared process pool on a background thread, for when a game with a
+    PARALLEL_DIFFICULTIES seat is created.
+    """
+    if searchPool is None:
+        threading.Thread(target=startSearchPool, args=(workers,), daemon=True).start()
+
+def shutdownSearchPool():
+    global searchPool
+    with searchPoolLock:
+        if searchPool is not None:
+            searchPool.shutdown(wait=False, cancel_futures=True)
+            searchPool = None
+
+def parallelSearchMove(observation, timeBudget, pool, workers, rng=random, stopEvent=None):
+    """
+    Root parallel ISMCTS: every worker searches its own tree from independent
+    determinizations for the whole budget and the root visit counts are summed.
+    Once stopEvent is set, stops the workers' searches and uses those that have
+    finished. Falls back to searching on this thread if the pool is unavailable.
+    Returns (move, iterations).
+    """
+    generation = searchGeneration.value if searchGeneration is not None else 0
+    try:
+        futures = {pool.submit(searchRootVisits, observation, timeBudget, rng.getrandbits(32), generation)
+                   for _ in range(workers)}
+        deadline = time.perf_counter() + timeBudget + SEARCH_POOL_TIMEOUT
+        visits = {}
+        iterations = 0
+        while futures and not (stopEvent and stopEvent.is_set()):
+            if time.perf_counter() > deadline:
+                raise FutureTimeoutError(f"search workers did not finish within {timeBudget + SEARCH_POOL_TIMEOUT:.1f} s")
+            done, futures = wait(futures, timeout=STOP_POLL_INTERVAL, return_when=FIRST_COMPLETED)
+            for future in done:
+                rootVisits, workerIterations = future.result()
+                for move, count in rootVisits.items():
+                    visits[move] = visits.get(move, 0) + count
+                iterations += workerIterations
+        if futures and searchGeneration is not None:
+            searchGeneration.value = generation + 1
+    except (BrokenExecutor, RuntimeError, TimeoutError, FutureTimeoutError) as e:
+        print(f"Parallel search failed, searching locally: {e}")
+        return searchMove(observation, timeBudget, rng, stopEvent=stopEvent)
+    return bestRootMove(visits, observation, rng), iterations
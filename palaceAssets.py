@@ -0,0 +1,211 @@
+"""
+Asset lookup and card images at display size.
+
+Assets are named by their path relative to palaceData ('cards/back.png'), whatever the
+OS. The first lookup lists every asset once, either from a compiled Qt resource bundle
+(palaceData.rcc next to this module, built by `buildAssets.py --bundle`) or from the
+palaceData directory next to this module, so later lookups never touch the filesystem
+and a missing asset is known without probing for it. assetPath() gives the path Qt
+should open.
+
+The source card PNGs in palaceData/cards are far larger than the CARD_WIDTH x CARD_HEIGHT
+they are shown at. buildAssets.py writes pre-scaled 8-bit RGBA copies to
+cards/{CARD_WIDTH}x{CARD_HEIGHT}/, at display size ({name}.png) and at twice that for
+HiDPI screens ({name}@2x.png). cardImage() prefers those and only decodes and scales
+the source image when a variant is missing, so changing the card size never picks up
+variants built for another size.
+
+cardImage() returns a QImage and is safe to call from any thread; cardPixmap() must be
+called on the GUI thread and caches one pixmap per card, scale and rotation. A
+CardPreloader fills that cache in the background, so the first deal reads nothing.
+"""
+import os
+import threading
+from PySide6.QtGui import QGuiApplication, QIcon, QImage, QPixmap, QTransform
+from PySide6.QtCore import Qt, QObject, Signal, Slot, QDirIterator, QResource
+from palaceRules import VALUES, SUITS
+
+# Constants for card dimensions
+CARD_WIDTH = 56
+CARD_HEIGHT = 84
+
+PACKAGE_DIR = os.path.dirname(os.path.abspath(__file__))
+ASSET_DIR = os.path.join(PACKAGE_DIR, 'palaceData')
+BUNDLE_PATH = os.path.join(PACKAGE_DIR, 'palaceData.rcc')
+# Prefix the bundle's files are registered under
+BUNDLE_ROOT = ':/palaceData'
+
+SCALED_DIR = f"cards/{CARD_WIDTH}x{CARD_HEIGHT}"
+# Pixel densities buildAssets.py writes variants for
+SCALES = (1, 2)
+# Rotations cards are shown at (side seats are turned by 90 degrees either way)
+ROTATIONS = (0, 90, -90)
+
+_assetRoot = None
+_assetIndex = None
+_assetLock = threading.Lock()
+
+def loadAssetIndex():
+    """
+    The asset root and the relative paths of every asset under it, from the resource
+    bundle if it exists and registers, from ASSET_DIR otherwise.
+    """
+    if os.path.exists(BUNDLE_PATH):
+        if QResource.registerResource(BUNDLE_PATH):
+            index = set()
+            files = QDirIterator(BUNDLE_ROOT, QDirIterator.IteratorFlag.Subdirectories)
+            while files.hasNext():
+                path = files.next()
+                if files.fileInfo().isFile():
+                    index.add(path[len(BUNDLE_ROOT) + 1:])
+            return BUNDLE_ROOT, index
+        print(f"Could not register {BUNDLE_PATH}, reading assets from {ASSET_DIR}")
+    index = set()
+    for directory, _, files in os.walk(ASSET_DIR):
+        relative = os.path.relpath(directory, ASSET_DIR).replace(os.sep, '/')
+        for file in files:
+            index.add(file if relative == '.' else f"{relative}/{file}")
+    return ASSET_DIR, index
+
+def assetPath(relative):
+    """
+    The path Qt should open for an asset ('cards/back.png'), or None if there is no
+    such asset.
+    """
+    global _assetRoot, _assetIndex
+    with _assetLock:
+        if _assetIndex is None:
+            _assetRoot, _assetIndex = loadAssetIndex()
+    if relative not in _assetIndex:
+        return None
+    if _assetRoot == BUNDLE_ROOT:
+        return f"{BUNDLE_ROOT}/{relative}"
+    return os.path.join(_assetRoot, *relative.split('/'))
+
+def filePath(relative):
+    """
+    Where an asset lives in the palaceData directory, for tools that write assets.
+    """
+    return os.path.join(ASSET_DIR, *relative.split('/'))
+
+_windowIcon = None
+
+def windowIcon():
+    global _windowIcon
+    if _windowIcon is None:
+        path = assetPath("palaceIcon.ico")
+        _windowIcon = QIcon(path) if path else QIcon()
+    return _windowIcon
+
+def cardName(card, faceUp=True):
+    """
+    File name (without extension) of a card's image, or of the card back.
+    """
+    return f"{card[0].lower()}_of_{card[1].lower()}" if faceUp else "back"
+
+def cardNames():
+    """
+    Every card image, back included.
+    """
+    return [cardName((value, suit)) for value in VALUES for suit in SUITS] + ["back"]
+
+def sourcePath(name):
+    return f"cards/{name}.png"
+
+def scaledPath(name, scale=1):
+    return f"{SCALED_DIR}/{name}@{scale}x.png" if scale != 1 else f"{SCALED_DIR}/{name}.png"
+
+def scaleImage(image, scale=1):
+    """
+    image scaled to fit the card size at scale times the pixel density, as 8-bit RGBA.
+    """
+    return image.convertToFormat(QImage.Format.Format_ARGB32).scaled(
+        CARD_WIDTH * scale, CARD_HEIGHT * scale, Qt.AspectRatioMode.KeepAspectRatio, Qt.TransformationMode.SmoothTransformation
+    )
+
+def cardImage(name, scale=1):
+    """
+    A card image at display size for the given pixel density, read from the pre-scaled
+    variant when there is one. Null if the card has no image at all.
+    """
+    path = assetPath(scaledPath(name, scale))
+    if path:
+        return QImage(path)
+    path = assetPath(sourcePath(name))
+    if path:
+        return scaleImage(QImage(path), scale)
+    return QImage()
+
+def displayScale():
+    """
+    1, or 2 on HiDPI screens.
+    """
+    app = QGuiApplication.instance()
+    return 2 if app is not None and app.devicePixelRatio() > 1 else 1
+
+def rotatedImage(image, rotation):
+    if not rotation:
+        return image
+    return image.transformed(QTransform().rotate(rotation), Qt.TransformationMode.SmoothTransformation)
+
+_pixmapCache = {}
+
+def cachePixmap(name, scale, rotation, image):
+    pixmap = QPixmap.fromImage(image)
+    pixmap.setDevicePixelRatio(scale)
+    _pixmapCache[(name, scale, rotation)] = pixmap
+    return pixmap
+
+def cardPixmap(name, rotation=0):
+    """
+    A cached pixmap of a card image at display size, rotated by rotation degrees.
+    """
+    scale = displayScale()
+    pixmap = _pixmapCache.get((name, scale, rotation))
+    if pixmap is None:
+        pixmap = cachePixmap(name, scale, rotation, rotatedImage(cardImage(name, scale), rotation))
+    return pixmap
+
+class CardPreloader(QObject):
+    """
+    Decodes every card image, at every rotation in ROTATIONS, on a worker thread and
+    hands each card's images to the GUI thread through a queued signal, where they are
+    turned into pixmaps and cached for cardPixmap(). Cards asked for before they arrive
+    are still loaded on the spot.
+    """
+    imageLoaded = Signal(str, int, object)
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self.stopEvent = threading.Event()
+        self.worker = None
+        self.imageLoaded.connect(self.deliver, Qt.ConnectionType.QueuedConnection)
+
+    def start(self):
+        """
+        Start preloading for the current display scale, skipping cards already cached.
+        """
+        scale = displayScale()
+        names = [name for name in cardNames()
+                 if any((name, scale, rotation) not in _pixmapCache for rotation in ROTATIONS)]
+        self.worker = threading.Thread(target=self.run, args=(names, scale), daemon=True)
+        self.worker.start()
+
+    def run(self, names, scale):
+        for name in names:
+            if self.stopEvent.is_set():
+                return
+            image = cardImage(name, scale)
+            if image.isNull():
+                print(f"Could not load card image {name}")
+                continue
+            self.imageLoaded.emit(name, scale, [rotatedImage(image, rotation) for rotation in ROTATIONS])
+
+    @Slot(str, int, object)
+    def deliver(self, name, scale, images):
+        for rotation, image in zip(ROTATIONS, images):
+            if (name, scale, rotation) not in _pixmapCache:
+                cachePixmap(name, scale, rotation, image)
+
+    def stop(self):
+        self.stopEvent.set()
@@ -0,0 +1,154 @@
+"""
+Exact endgame solver for the strongest AI.
+
+Once the deck is empty and few cards are left, a determinized PalaceState is small enough
+to search completely. The solver is max-n: every player picks the move that maximizes
+their own chance of winning, and values are tuples of win probabilities, one per player.
+Playing a blind bottom card is a chance node over the ranks left in that player's bottom
+cards, since their order is unknown to everyone.
+
+Positions are cached in a transposition table keyed by the state's Zobrist hash
+(PalaceState.zobrist, which treats bottom cards as a multiset) with least recently used
+eviction. Pickups can repeat positions forever, so a
+position already on the search path, or one deeper than maxDepth, is scored by cards
+left instead. Values that depend on such an estimate are marked inexact; they are still
+reused from the table, so every position is expanded at most once.
+"""
+import time
+import threading
+from collections import OrderedDict
+from palaceRules import BLIND
+
+# Endgames are solved once the deck is empty and at most this many cards are left in play
+ENDGAME_CARDS = 10
+
+class SolverLimitExceeded(Exception):
+    """
+    Raised when a solve visits more than maxNodes positions or runs past its deadline;
+    the caller falls back to search.
+    """
+
+def isEndgame(state):
+    if state.deck:
+        return False
+    return sum(state.cardsLeft(player) for player in range(state.numPlayers)) <= ENDGAME_CARDS
+
+def estimatedValues(state):
+    """
+    Win chances for a position that is not searched further, shared out in inverse
+    proportion to the cards each player has left.
+    """
+    weights = [1.0 / (state.cardsLeft(player) + 1) for player in range(state.numPlayers)]
+    total = sum(weights)
+    return tuple(weight / total for weight in weights)
+
+class EndgameSolver:
+    """
+    Max-n solver with an LRU transposition table shared between solves, so positions
+    reached again on later moves are answered from the table. moveGenerator returns the
+    moves considered in a position (all legal moves by default); the solution is exact
+    over those moves. Safe to share between threads; the table is locked for each
+    lookup and store.
+    """
+    def __init__(self, moveGenerator=None, maxEntries=200000, maxNodes=10000, maxDepth=60):
+        self.moveGenerator = moveGenerator or (lambda state: state.legalMoves())
+        self.maxEntries = maxEntries
+        self.maxNodes = maxNodes
+        self.maxDepth = maxDepth
+        self.table = OrderedDict()
+        self.lock = threading.Lock()
+        # Positions expanded by the solve running on each thread
+        self.local = threading.local()
+        self.hits = 0
+        self.misses = 0
+
+    def key(self, state):
+        return state.zobrist
+
+    def lookup(self, key):
+        with self.lock:
+            entry = self.table.get(key)
+            if entry is None:
+                self.misses += 1
+                return None
+            self.table.move_to_end(key)
+            self.hits += 1
+            return entry
+
+    def store(self, key, values, exact):
+        with self.lock:
+            self.table[key] = (values, exact)
+            self.table.move_to_end(key)
+            while len(self.table) > self.maxEntries:
+                self.table.popitem(last=False)
+
+    def moveValues(self, state, deadline=None):
+        """
+        Map every move of state's current player to the value tuple it leads to.
+        Raises SolverLimitExceeded if the position is too big to solve by deadline
+        (a time.perf_counter() value).
+        """
+        self.local.nodes = 0
+        self.local.deadline = deadline
+        path = set()
+        return {move: self.afterMove(state, move, self.maxDepth, path)[0] for move in self.moveGenerator(state)}
+
+    def bestMove(self, state, deadline=None):
+        player = state.current
+        values = self.moveValues(state, deadline)
+        return max(values, key=lambda move: values[move][player]), values
+
+    def afterMove(self, state, move, depth, path):
+        if move != BLIND:
+            child = state.copy()
+            child.apply(move)
+            return self.value(child, depth - 1, path)
+        # Chance node: each distinct rank left in the bottom cards, weighted by its count
+        bottom = state.bottoms[state.current]
+        values = [0.0] * state.numPlayers
+        exact = True
+        for rank in set(bottom):
+            child = state.copy()
+            child.bottoms[child.current].remove(rank)
+            child.bottoms[child.current].append(rank)
+            child.apply(BLIND)
+            childValues, childExact = self.value(child, depth - 1, path)
+            weight = bottom.count(rank) / len(bottom)
+            for player, value in enumerate(childValues):
+                values[player] += weight * value
+            exact = exact and childExact
+        return tuple(values), exact
+
+    def value(self, state, depth, path):
+        """
+        (values, exact) of a position; exact is False if a cycle or the depth limit
+        was hit anywhere below it.
+        """
+        if state.winner is not None:
+            return tuple(1.0 if player == state.winner else 0.0 for player in range(state.numPlayers)), True
+        key = self.key(state)
+        if key in path or depth <= 0:
+            return estimatedValues(state), False
+        cached = self.lookup(key)
+        if cached is not None:
+            return cached
+        self.local.nodes += 1
+        if self.local.nodes > self.maxNodes:
+            raise SolverLimitExceeded(f"endgame needs more than {self.maxNodes} positions")
+        if self.local.deadline is not None and self.local.nodes % 256 == 0 and time.perf_counter() > self.local.deadline:
+            raise SolverLimitExceeded("endgame solve ran out of time")
+
+        player = state.current
+        path.add(key)
+        try:
+            best = None
+            exact = True
+            for move in self.moveGenerator(state):
+                values, childExact = self.afterMove(state, move, depth, path)
+                exact = exact and childExact
+                if best is None or values[player] > best[player]:
+                    best = values
+        finally:
+            path.discard(key)
+        self.store(key, best, exact)
+        return best, exact
@@ -0,0 +1,160 @@
+"""
+Batch evaluation of candidate moves for the heuristic AI and the simulator.
+
+A position is reduced to rank-count vectors (13 ranks in VALUES order, as in
+palaceRules.PalaceState) and every candidate move is scored with a one-ply estimate:
+cards shed, the value of the cards given up (by VALUES), and the chance the next
+player cannot beat the new pile top given the cards the mover has not seen (a
+hypergeometric draw of the next player's hand), weighted by the size of the pile
+they would then pick up.
+
+With NumPy installed, scoreMoves() scores a whole batch of positions at once with
+rank-count matrices; without it the same formula runs in pure Python. NumPy is only
+imported the first time a batch is scored, so importing this module stays cheap.
+"""
+import math
+from itertools import zip_longest
+from palaceRules import VALUES, RANK_NAMES, NUM_RANKS, TWO, SEVEN, TEN, PICK_UP, BLIND
+
+# Set by loadNumpy(): the numpy module, or None if it is not installed
+np = None
+numpyLoaded = False
+
+def loadNumpy():
+    global np, numpyLoaded
+    if not numpyLoaded:
+        numpyLoaded = True
+        try:
+            import numpy
+            np = numpy
+        except ImportError:
+            np = None
+    return np
+
+# Padding for unused move slots in a batch
+NO_MOVE = -3
+
+# Weight of the pile the next player is expected to pick up
+PILE_WEIGHT = 0.1
+# KEEP_VALUE[rank]: what holding a card of that rank is worth, by VALUES up to 1 for an
+# ace, with 2s and 10s above every ordinary card
+SPECIAL_KEEP_VALUE = 1.2
+KEEP_VALUE = [SPECIAL_KEEP_VALUE if name in ('2', '10') else (VALUES[name] - 2) / 12 for name in RANK_NAMES]
+# While the deck lasts a played card is replaced by a random one rather than shed
+MEAN_KEEP_VALUE = sum(KEEP_VALUE) / NUM_RANKS
+
+def beatsAfter(rank):
+    """
+    Ranks that can be played on a pile right after rank was played on it.
+    """
+    if rank == SEVEN:
+        return [other for other in range(NUM_RANKS) if other <= SEVEN or other == TEN]
+    return [other for other in range(NUM_RANKS) if other >= rank or other == TWO or other == TEN]
+
+# BEATS[rank][other] is 1 when other can be played right after rank
+BEATS = [[1 if other in beatsAfter(rank) else 0 for other in range(NUM_RANKS)] for rank in range(NUM_RANKS)]
+
+# LOG_FALLING[n][k] = log(n * (n - 1) * ... * (n - k + 1)), -inf when k > n. The chance that
+# k cards drawn from n miss all b of them is exp(LOG_FALLING[n - b][k] - LOG_FALLING[n][k]).
+def logFallingRow(n):
+    row = [0.0]
+    for k in range(1, 53):
+        row.append(row[-1] + math.log(n - k + 1) if k <= n else float('-inf'))
+    return row
+
+LOG_FALLING = [logFallingRow(n) for n in range(53)]
+
+def positionOf(state, observer=None):
+    """
+    The batch row for a PalaceState seen by observer (the current player by default):
+    (unseen counts, next player's hand size, pile size, pile top, pile run, deck size).
+    """
+    observer = state.current if observer is None else observer
+    unseen = [4] * NUM_RANKS
+    for counts in [state.hands[observer], state.pile] + state.tops:
+        for rank, count in enumerate(counts):
+            unseen[rank] = max(unseen[rank] - count, 0)
+    nextPlayer = (state.current + state.direction) % state.numPlayers
+    return unseen, state.handSizes[nextPlayer], state.pileSize, state.pileTop, state.pileRun, len(state.deck)
+
+def positionFromObservation(observation):
+    """
+    The batch row for a palaceAI observation of the seat to move.
+    """
+    pile = observation['pile']
+    pileTop = pile[-1] if pile else -1
+    pileRun = 0
+    for rank in reversed(pile):
+        if rank != pileTop:
+            break
+        pileRun += 1
+    nextPlayer = (observation['seat'] + observation['direction']) % observation['numPlayers']
+    unseen = [max(count, 0) for count in observation['unseen']]
+    return unseen, observation['handSizes'][nextPlayer], len(pile), pileTop, pileRun, observation['deckCount']
+
+def scoreMove(unseen, nextHandSize, pileSize, pileTop, pileRun, deckSize, move):
+    """
+    Pure Python score of one move; the reference for scoreMoves().
+    """
+    if move == BLIND or move == NO_MOVE:
+        return 0.0 if move == BLIND else float('-inf')
+    if move == PICK_UP:
+        return -float(pileSize)
+    rank, count = divmod(move, 5)
+    score = count * ((MEAN_KEEP_VALUE if deckSize else 1.0) - KEEP_VALUE[rank])
+    # Moves that keep the turn (2, 10 and four of a kind) leave no pile for the next player
+    if rank == TEN or rank == TWO or (rank == pileTop and pileRun + count >= 4):
+        return score
+    total = sum(unseen)
+    beating = sum(count * beats for count, beats in zip(unseen, BEATS[rank]))
+    # Hands bigger than the unseen cards hold all of them
+    drawn = min(nextHandSize, total)
+    cannotBeat = math.exp(LOG_FALLING[total - beating][drawn] - LOG_FALLING[total][drawn])
+    return score + PILE_WEIGHT * cannotBeat * (pileSize + count)
+
+def scoreMovesPython(positions, moves):
+    return [[scoreMove(*position, move) for move in row] for position, row in zip(positions, moves)]
+
+def scoreMovesNumpy(positions, moves):
+    unseen = np.array([position[0] for position in positions], dtype=np.float64)
+    nextHandSize, pileSize, pileTop, pileRun, deckSize = np.array([position[1:] for position in positions], dtype=np.int64).T
+    moveArray = np.array(list(zip_longest(*moves, fillvalue=NO_MOVE)), dtype=np.int64).T.reshape(len(moves), -1)
+
+    played = moveArray >= 0
+    rank = np.where(played, moveArray // 5, 0)
+    count = np.where(played, moveArray % 5, 0)
+    # Unseen cards that beat each move's rank: (batch, moves, ranks) summed over ranks
+    beating = np.einsum('br,bmr->bm', unseen, np.asarray(BEATS, dtype=np.float64)[rank])
+    total = unseen.sum(axis=1).astype(np.int64)[:, None]
+    drawn = np.minimum(nextHandSize[:, None], total)
+    logFalling = np.asarray(LOG_FALLING)
+    cannotBeat = np.exp(logFalling[total - beating.astype(np.int64), drawn] - logFalling[total, drawn])
+
+    shed = count * (np.where(deckSize > 0, MEAN_KEEP_VALUE, 1.0)[:, None] - np.asarray(KEEP_VALUE)[rank])
+    scores = shed + PILE_WEIGHT * cannotBeat * (pileSize[:, None] + count)
+    keepsTurn = (rank == TEN) | (rank == TWO) | ((rank == pileTop[:, None]) & (pileRun[:, None] + count >= 4))
+    scores = np.where(keepsTurn, shed, scores)
+    scores = np.where(played, scores, 0.0)
+    scores = np.where(moveArray == PICK_UP, -pileSize[:, None].astype(np.float64), scores)
+    scores = np.where(moveArray == NO_MOVE, -np.inf, scores)
+    return scores
+
+def scoreMoves(positions, moves):
+    """
+    Score every candidate move of every position. positions are rows from positionOf(),
+    moves a list of move lists (one per position, any lengths). Returns one row of
+    scores per position; with NumPy this is a (positions, max moves) array padded
+    with -inf.
+    """
+    if not positions:
+        return []
+    if loadNumpy() is None:
+        return scoreMovesPython(positions, moves)
+    return scoreMovesNumpy(positions, moves)
+
+def bestMoves(states, moves):
+    """
+    The highest scoring move of each state, each seen by its current player.
+    """
+    scores = scoreMoves([positionOf(state) for state in states], moves)
+    return [row[max(range(len(row)), key=lambda i: scoreRow[i])] for row, scoreRow in zip(moves, scores)]
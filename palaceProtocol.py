@@ -0,0 +1,120 @@
+"""
+Shared JSON protocol definitions for the host and client.
+
+Every message is a single JSON object terminated by a newline with an 'action'
+field. ACTION_SCHEMAS lists the fields each action must carry and their types;
+ActionDispatcher maps action names to handlers so that dispatch is a single
+dictionary lookup regardless of how many actions exist.
+"""
+
+class ProtocolError(ValueError):
+    pass
+
+ACTION_SCHEMAS = {
+    # Lobby
+    'setIndex': {'index': int},
+    'join': {},
+    'updateLog': {'log': str},
+    'leaveLobby': {},
+    'updateNumPlayersLobby': {},
+    'shutdownServer': {},
+    # Game setup
+    'deckSync': {'deck': list, 'players': dict, 'numPlayers': int},
+    'confirmedTopCards': {},
+    'startMainGame': {'lowestPlayer': int, 'direction': bool},
+    'startNewGame': {},
+    # Game state
+    'updateCards': {'playerIndex': int, 'handCards': list, 'topCards': list, 'bottomCards': list},
+    'updateCurrentPlayer': {'currentPlayer': int, 'checksum': int},
+    'updateDeck': {'deck': list},
+    'drawCards': {'count': int},
+    'updatePile': {'pile': list},
+    'updatePileLabel': {'pileLabel': str},
+    'sevenSwitch': {'sevenSwitch': bool},
+    # Game end and disconnects
+    'gameOver': {'winner': (int, str)},
+    'gameEnd': {'winner': (int, str)},
+    'updatePlayAgainCount': {'playAgainCount': int},
+    'playerDisconnected': {},
+    'switchToTwoPlayerLayout': {'remainingPlayers': list},
+    'switchToThreePlayerLayout': {'remainingPlayers': list},
+    'gameClose': {},
+}
+
+# Actions that only carry the latest value of some piece of state, so a newer
+# message makes an older undelivered one with the same key redundant. drawCards
+# moves the deck on from where it is, so every one must be delivered.
+COALESCED_ACTIONS = {
+    'updateDeck', 'updatePile', 'updatePileLabel', 'sevenSwitch', 'updatePlayAgainCount',
+}
+
+# Actions carrying a checksum of the table as it stands when they are sent. Each is
+# delivered on its own, and nothing sent before one is merged with anything sent after it.
+CHECKSUM_ACTIONS = {'updateCurrentPlayer'}
+
+def coalesceKey(data):
+    """
+    Key under which pending deliveries of this message may be merged, or None
+    if every message of this action must be delivered in order.
+    """
+    action = data['action']
+    if action == 'updateCards':
+        return (action, data['playerIndex'])
+    if action in COALESCED_ACTIONS:
+        return action
+    return None
+
+def coalesceBarrier(data):
+    """
+    Whether pending deliveries must not be merged across this message.
+    """
+    return data['action'] in CHECKSUM_ACTIONS
+
+def validateMessage(data, schemas=ACTION_SCHEMAS):
+    """
+    Check that a decoded message names a known action and carries its required fields.
+    """
+    if not isinstance(data, dict):
+        raise ProtocolError(f"message is not a JSON object: {data!r}")
+    action = data.get('action')
+    schema = schemas.get(action)
+    if schema is None:
+        raise ProtocolError(f"unknown action: {action!r}")
+    for field, fieldType in schema.items():
+        if field not in data:
+            raise ProtocolError(f"'{action}' is missing field '{field}'")
+        # bool is a subclass of int, so reject it explicitly for int fields
+        value = data[field]
+        if not isinstance(value, fieldType) or (fieldType is int and isinstance(value, bool)):
+            raise ProtocolError(f"'{action}' field '{field}' has type {type(value).__name__}")
+    return action
+
+class ActionDispatcher:
+    """
+    Registered handler table (action name -> handler) with schema validation.
+    Extra positional arguments passed to dispatch() are forwarded to the handler,
+    e.g. the client socket and player index on the host.
+    """
+    def __init__(self, handlers=None, schemas=ACTION_SCHEMAS):
+        self.schemas = schemas
+        self.handlers = {}
+        for action, handler in (handlers or {}).items():
+            self.register(action, handler)
+
+    def register(self, action, handler):
+        if action not in self.schemas:
+            raise ProtocolError(f"no schema for action: {action!r}")
+        self.handlers[action] = handler
+
+    def resolve(self, data):
+        """
+        Validate a message and return its handler without calling it.
+        """
+        action = validateMessage(data, self.schemas)
+        handler = self.handlers.get(action)
+        if handler is None:
+            raise ProtocolError(f"no handler registered for action: {action!r}")
+        return handler
+
+    def dispatch(self, data, *args):
+        return self.resolve(data)(data, *args)
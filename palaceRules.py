@@ -0,0 +1,417 @@
+"""
+Palace rules shared by the GUI, the AI players and headless tools. Nothing in this
+module imports Qt.
+
+A card is a (value, suit, isTopCard, isBottomCard) sequence, as sent over the wire.
+"""
+import random
+
+RANKS = {'3': 2, '4': 3, '5': 4, '6': 5, '8': 6, '9': 7, 'J': 8, 'Q': 9, '7': 10, 'K': 11, 'A': 12, '2': 13, '10': 14}
+VALUES = {'2': 2, '3': 3, '4': 4, '5': 5, '6': 6, '7': 7, '8': 8, '9': 9, '10': 10, 'J': 11, 'Q': 12, 'K': 13, 'A': 14}
+SUITS = ['hearts', 'diamonds', 'clubs', 'spades']
+
+def newDeck(rng=random):
+    deck = [(value, suit, False, False) for value in VALUES.keys() for suit in SUITS]
+    rng.shuffle(deck)
+    return deck
+
+def isCardPlayable(card, pile, sevenSwitch):
+    """
+    Whether card may be placed on pile. Face-down bottom cards can always be attempted.
+    """
+    topCard = pile[-1] if pile else None
+    if sevenSwitch:
+        return VALUES[card[0]] <= 7 or card[0] in ['2', '10']
+    if not topCard:
+        return True
+    if card[3]:
+        return True
+    return card[0] == '2' or card[0] == '10' or VALUES[card[0]] >= VALUES[topCard[0]]
+
+# Headless engine used by AI search and simulations.
+# Suits never affect the rules, so cards are rank indices in VALUES order ('2' is 0, 'A' is 12).
+RANK_NAMES = list(VALUES)
+RANK_INDEX = {name: index for index, name in enumerate(RANK_NAMES)}
+NUM_RANKS = len(RANK_NAMES)
+TWO = RANK_INDEX['2']
+SEVEN = RANK_INDEX['7']
+TEN = RANK_INDEX['10']
+
+# Moves are ints: rank * 5 + count places count cards of rank from the active zone
+PICK_UP = -1
+BLIND = -2
+
+# Games longer than this are abandoned without a winner
+MAX_MOVES = 1000
+
+# Zobrist keys: a position's hash is the XOR of one random 64-bit key per feature it has,
+# so PalaceState can update it in O(1) whenever a feature changes. Zones are keyed by
+# (rank, count held) with a count of 0 keyed 0; deck ranks by their position in the deck.
+# The seed is fixed so every process and every peer uses the same keys.
+MAX_PLAYERS = 4
+_zobristRng = random.Random(0x9A1ACE)
+
+def zobristKeys(count):
+    return [_zobristRng.getrandbits(64) for _ in range(count)]
+
+def countKeys():
+    return [[0] + zobristKeys(4) for _ in range(NUM_RANKS)]
+
+HAND_KEYS = [countKeys() for _ in range(MAX_PLAYERS)]
+TOP_KEYS = [countKeys() for _ in range(MAX_PLAYERS)]
+BOTTOM_KEYS = [countKeys() for _ in range(MAX_PLAYERS)]
+PILE_KEYS = countKeys()
+DECK_KEYS = [zobristKeys(NUM_RANKS) for _ in range(len(SUITS) * NUM_RANKS)]
+# Indexed by pileTop + 1 and pileRun, so an empty pile adds nothing
+PILE_TOP_KEYS = [0] + zobristKeys(NUM_RANKS)
+PILE_RUN_KEYS = [0] + zobristKeys(4)
+SEVEN_SWITCH_KEY = zobristKeys(1)[0]
+COUNTERCLOCKWISE_KEY = zobristKeys(1)[0]
+CURRENT_KEYS = zobristKeys(MAX_PLAYERS)
+
+CARD_ZONES = ('handCards', 'topCards', 'bottomCards')
+_cardKeys = None
+
+def cardKeys():
+    """
+    Card level keys for tableChecksum, generated on first use from their own seed since
+    most processes never need them: (player, zone, card) keys and (position, card) keys
+    for the ordered pile and deck, cards numbered rank * 4 + suit. Pile positions count
+    from the bottom card of the pile and deck positions from the last card of the deck,
+    so placing on the pile or drawing from the deck leaves every other card's key as it was.
+    """
+    global _cardKeys
+    if _cardKeys is None:
+        rng = random.Random(0xCA4D)
+        cards = len(SUITS) * NUM_RANKS
+        keys = lambda: [rng.getrandbits(64) for _ in range(cards)]
+        _cardKeys = (
+            [[keys() for _ in CARD_ZONES] for _ in range(MAX_PLAYERS)],
+            [keys() for _ in range(cards)],
+            [keys() for _ in range(cards)],
+        )
+    return _cardKeys
+
+def cardNumber(card):
+    return RANK_INDEX[card[0]] * len(SUITS) + SUITS.index(card[1])
+
+def zoneChecksum(keys, cards):
+    """
+    XOR of the keys of an unordered zone's cards.
+    """
+    checksum = 0
+    for card in cards:
+        checksum ^= keys[cardNumber(card)]
+    return checksum
+
+def orderedChecksum(keys, cards, start=0):
+    """
+    XOR of the keys of cards at positions start, start + 1, ... of an ordered zone.
+    """
+    checksum = 0
+    for position, card in enumerate(cards, start):
+        checksum ^= keys[position][cardNumber(card)]
+    return checksum
+
+def tableChecksum(players, pile, deck, currentPlayer):
+    """
+    64-bit Zobrist hash of a table: players are the seats' palaceTable.PlayerStates in
+    seat order, each with handCards, topCards and bottomCards. Card order within a zone
+    and the top/bottom flags are ignored; pile and deck order are not. Peers holding the
+    same table get the same checksum.
+
+    Computed from scratch; palaceTable.TableState keeps the same value up to date as
+    its table changes.
+    """
+    zoneKeys, pileKeys, deckKeys = cardKeys()
+    checksum = orderedChecksum(pileKeys, pile) ^ orderedChecksum(deckKeys, reversed(list(deck)))
+    for seatKeys, player in zip(zoneKeys, players):
+        for keys, zone in zip(seatKeys, CARD_ZONES):
+            checksum ^= zoneChecksum(keys, getattr(player, zone))
+    if currentPlayer is not None:
+        checksum ^= CURRENT_KEYS[currentPlayer - 1]
+    return checksum
+
+def encodeMove(rank, count):
+    return rank * 5 + count
+
+def decodeMove(move):
+    return divmod(move, 5)
+
+def defaultTopCards(hand):
+    """
+    The 3 strongest ranks of a 6 card hand by RANKS, used when no policy picks the top cards.
+    """
+    return sorted(hand, key=lambda rank: RANKS[RANK_NAMES[rank]], reverse=True)[:3]
+
+class PalaceState:
+    """
+    A compact, copyable Palace position following the same rules as GameController:
+    hands and top cards are per-rank counts, bottom cards and the deck are rank lists
+    (drawn from the end), and the pile keeps its rank counts plus the top rank and the
+    length of the run of that rank for four of a kind.
+    Players are numbered from 0 here; direction is 1 for clockwise, -1 otherwise.
+
+    zobrist is a 64-bit hash of the position (every zone, the pile, the deck order, the
+    seven-switch, the turn and direction; bottom cards as a multiset since their order is
+    hidden), kept up to date by every move, for use as a cache key. Code that fills in
+    the fields directly must call rehash() afterwards.
+    """
+    __slots__ = ('numPlayers', 'hands', 'handSizes', 'tops', 'topSizes', 'bottoms', 'deck',
+                 'pile', 'pileSize', 'pileTop', 'pileRun', 'sevenSwitch', 'current',
+                 'direction', 'winner', 'moves', 'pickUps', 'zobrist')
+
+    def __init__(self, numPlayers):
+        self.numPlayers = numPlayers
+        self.hands = [[0] * NUM_RANKS for _ in range(numPlayers)]
+        self.handSizes = [0] * numPlayers
+        self.tops = [[0] * NUM_RANKS for _ in range(numPlayers)]
+        self.topSizes = [0] * numPlayers
+        self.bottoms = [[] for _ in range(numPlayers)]
+        self.deck = []
+        self.pile = [0] * NUM_RANKS
+        self.pileSize = 0
+        self.pileTop = -1
+        self.pileRun = 0
+        self.sevenSwitch = False
+        self.current = 0
+        self.direction = 1
+        self.winner = None
+        self.moves = 0
+        self.pickUps = 0
+        self.zobrist = CURRENT_KEYS[0]
+
+    def copy(self):
+        state = PalaceState.__new__(PalaceState)
+        state.numPlayers = self.numPlayers
+        state.hands = [hand[:] for hand in self.hands]
+        state.handSizes = self.handSizes[:]
+        state.tops = [top[:] for top in self.tops]
+        state.topSizes = self.topSizes[:]
+        state.bottoms = [bottom[:] for bottom in self.bottoms]
+        state.deck = self.deck[:]
+        state.pile = self.pile[:]
+        state.pileSize = self.pileSize
+        state.pileTop = self.pileTop
+        state.pileRun = self.pileRun
+        state.sevenSwitch = self.sevenSwitch
+        state.current = self.current
+        state.direction = self.direction
+        state.winner = self.winner
+        state.moves = self.moves
+        state.pickUps = self.pickUps
+        state.zobrist = self.zobrist
+        return state
+
+    def rehash(self):
+        """
+        Recompute zobrist from scratch.
+        """
+        zobrist = 0
+        for player in range(self.numPlayers):
+            for keys, counts in ((HAND_KEYS, self.hands), (TOP_KEYS, self.tops)):
+                for rank, count in enumerate(counts[player]):
+                    zobrist ^= keys[player][rank][count]
+            bottom = self.bottoms[player]
+            for rank in set(bottom):
+                zobrist ^= BOTTOM_KEYS[player][rank][bottom.count(rank)]
+        for rank, count in enumerate(self.pile):
+            zobrist ^= PILE_KEYS[rank][count]
+        for position, rank in enumerate(self.deck):
+            zobrist ^= DECK_KEYS[position][rank]
+        zobrist ^= PILE_TOP_KEYS[self.pileTop + 1] ^ PILE_RUN_KEYS[self.pileRun] ^ CURRENT_KEYS[self.current]
+        if self.sevenSwitch:
+            zobrist ^= SEVEN_SWITCH_KEY
+        if self.direction == -1:
+            zobrist ^= COUNTERCLOCKWISE_KEY
+        self.zobrist = zobrist
+        return zobrist
+
+    @classmethod
+    def deal(cls, numPlayers, rng=random, topCardPolicies=None):
+        """
+        Shuffle and deal a new game the way HostLobby.startGame does, let every player
+        pick 3 of their 6 hand cards as top cards, and pick the starting player.
+        topCardPolicies optionally gives each player a function from the 6 hand ranks to
+        the 3 ranks placed on top; defaultTopCards is used otherwise.
+        """
+        state = cls(numPlayers)
+        deck = [rank for rank in range(NUM_RANKS) for _ in range(4)]
+        rng.shuffle(deck)
+        for player in range(numPlayers):
+            state.bottoms[player] = deck[-3:]
+            hand = deck[-9:-3]
+            del deck[-9:]
+            topCards = topCardPolicies[player](hand) if topCardPolicies else defaultTopCards(hand)
+            for rank in hand:
+                state.hands[player][rank] += 1
+            for rank in topCards:
+                state.hands[player][rank] -= 1
+                state.tops[player][rank] += 1
+            state.handSizes[player] = len(hand) - len(topCards)
+            state.topSizes[player] = len(topCards)
+        state.deck = deck
+        state.chooseStartingPlayer()
+        state.rehash()
+        return state
+
+    def chooseStartingPlayer(self):
+        """
+        Same as GameController.calculateRankTotals: the lowest top card total starts and
+        play moves towards the adjacent player with the lower total.
+        """
+        totals = [sum(RANKS[RANK_NAMES[rank]] * count for rank, count in enumerate(top)) for top in self.tops]
+        lowest = min(range(self.numPlayers), key=totals.__getitem__)
+        self.current = lowest
+        self.direction = 1
+        if self.numPlayers > 2:
+            left = (lowest - 1) % self.numPlayers
+            right = (lowest + 1) % self.numPlayers
+            secondLowest = left if totals[left] <= totals[right] else right
+            self.direction = 1 if secondLowest == right else -1
+
+    def isTerminal(self):
+        return self.winner is not None or self.moves >= MAX_MOVES
+
+    def cardsLeft(self, player):
+        return self.handSizes[player] + self.topSizes[player] + len(self.bottoms[player])
+
+    def isPlayable(self, rank):
+        if self.sevenSwitch:
+            return rank <= SEVEN or rank == TEN
+        if not self.pileSize:
+            return True
+        return rank == TWO or rank == TEN or rank >= self.pileTop
+
+    def activeZone(self, player):
+        """
+        The per-rank counts the player plays from, or None when only bottom cards are left.
+        """
+        if self.handSizes[player]:
+            return self.hands[player]
+        if self.topSizes[player]:
+            return self.tops[player]
+        return None
+
+    def legalMoves(self):
+        player = self.current
+        zone = self.activeZone(player)
+        moves = []
+        if zone is None:
+            if self.bottoms[player]:
+                moves.append(BLIND)
+        else:
+            for rank in range(NUM_RANKS):
+                count = zone[rank]
+                if count and self.isPlayable(rank):
+                    for placed in range(1, count + 1):
+                        moves.append(rank * 5 + placed)
+        if self.pileSize:
+            moves.append(PICK_UP)
+        return moves
+
+    def apply(self, move):
+        player = self.current
+        self.moves += 1
+        if move == PICK_UP:
+            self.pickUp(player)
+            self.rotate()
+            return
+        if move == BLIND:
+            bottom = self.bottoms[player]
+            rank = bottom.pop()
+            left = bottom.count(rank)
+            self.zobrist ^= BOTTOM_KEYS[player][rank][left + 1] ^ BOTTOM_KEYS[player][rank][left]
+            count = 1
+            if not self.isPlayable(rank):
+                # The revealed card goes on the pile and the player picks everything up
+                self.addToPile(rank, 1)
+                self.pickUp(player)
+                self.rotate()
+                return
+        else:
+            rank, count = divmod(move, 5)
+            if self.handSizes[player]:
+                zone = self.hands[player]
+                keys = HAND_KEYS[player][rank]
+                self.handSizes[player] -= count
+            else:
+                zone = self.tops[player]
+                keys = TOP_KEYS[player][rank]
+                self.topSizes[player] -= count
+            held = zone[rank]
+            zone[rank] = held - count
+            self.zobrist ^= keys[held] ^ keys[held - count]
+        self.addToPile(rank, count)
+
+        hand = self.hands[player]
+        handKeys = HAND_KEYS[player]
+        deck = self.deck
+        while self.handSizes[player] < 3 and deck:
+            drawn = deck.pop()
+            held = hand[drawn]
+            hand[drawn] = held + 1
+            self.handSizes[player] += 1
+            self.zobrist ^= DECK_KEYS[len(deck)][drawn] ^ handKeys[drawn][held] ^ handKeys[drawn][held + 1]
+
+        keepsTurn = True
+        if self.pileRun >= 4 or rank == TEN:
+            self.burn()
+        else:
+            sevenSwitch = rank == SEVEN
+            if sevenSwitch != self.sevenSwitch:
+                self.sevenSwitch = sevenSwitch
+                self.zobrist ^= SEVEN_SWITCH_KEY
+            keepsTurn = rank == TWO
+        if not self.handSizes[player] and not self.topSizes[player] and not self.bottoms[player] and not deck:
+            self.winner = player
+            return
+        if not keepsTurn:
+            self.rotate()
+
+    def addToPile(self, rank, count):
+        held = self.pile[rank]
+        self.pile[rank] = held + count
+        self.pileSize += count
+        zobrist = self.zobrist ^ PILE_KEYS[rank][held] ^ PILE_KEYS[rank][held + count] ^ PILE_RUN_KEYS[self.pileRun]
+        if rank == self.pileTop:
+            self.pileRun += count
+        else:
+            zobrist ^= PILE_TOP_KEYS[self.pileTop + 1] ^ PILE_TOP_KEYS[rank + 1]
+            self.pileTop = rank
+            self.pileRun = count
+        self.zobrist = zobrist ^ PILE_RUN_KEYS[self.pileRun]
+
+    def pickUp(self, player):
+        hand = self.hands[player]
+        handKeys = HAND_KEYS[player]
+        for rank, count in enumerate(self.pile):
+            if count:
+                held = hand[rank]
+                hand[rank] = held + count
+                self.zobrist ^= handKeys[rank][held] ^ handKeys[rank][held + count]
+        self.handSizes[player] += self.pileSize
+        self.pickUps += 1
+        self.clearPile()
+
+    def burn(self):
+        self.clearPile()
+
+    def clearPile(self):
+        zobrist = self.zobrist ^ PILE_TOP_KEYS[self.pileTop + 1] ^ PILE_RUN_KEYS[self.pileRun]
+        for rank, count in enumerate(self.pile):
+            if count:
+                zobrist ^= PILE_KEYS[rank][count]
+        if self.sevenSwitch:
+            zobrist ^= SEVEN_SWITCH_KEY
+        self.zobrist = zobrist
+        self.pile = [0] * NUM_RANKS
+        self.pileSize = 0
+        self.pileTop = -1
+        self.pileRun = 0
+        self.sevenSwitch = False
+
+    def rotate(self):
+        current = (self.current + self.direction) % self.numPlayers
+        self.zobrist ^= CURRENT_KEYS[self.current] ^ CURRENT_KEYS[current]
+        self.current = current
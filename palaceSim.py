@@ -0,0 +1,208 @@
+"""
+Headless self-play simulator for measuring rule and AI changes at scale.
+
+Plays games between AI policies on palaceRules.PalaceState (no Qt), spreading them over
+all cores, and reports win rates, game lengths, pickups per game and games per second.
+
+    python palaceSim.py --games 1000 --players 3 --policies Medium Hard --csv results.csv
+
+Policies are the AI difficulties (Easy, Medium, Hard, Impossible; case insensitive) and
+are assigned to seats in order, repeating if there are fewer policies than players.
+Seats are rotated between games so no policy keeps the starting advantage.
+"""
+import os
+import csv
+import sys
+import json
+import time
+import random
+import argparse
+from concurrent.futures import ProcessPoolExecutor
+from palaceRules import PalaceState
+from palaceAI import AI_DIFFICULTIES, candidateMoves, engineMove, engineTopCards
+from palaceEval import bestMoves
+from palaceTracker import CardTracker
+
+# Policies scored together for all running games with palaceEval.bestMoves
+BATCH_POLICIES = {'Medium'}
+
+# Chunks of games handed to each worker process
+CHUNKS_PER_WORKER = 4
+
+COLUMNS = ['game', 'seed', 'numPlayers', 'policies', 'winner', 'winnerPolicy', 'moves', 'pickUps', 'abandoned', 'seconds']
+
+def seatPolicies(policies, numPlayers, game):
+    """
+    Policy of every seat for one game: policies repeated to fill the table, rotated by game.
+    """
+    table = [policies[i % len(policies)] for i in range(numPlayers)]
+    shift = game % numPlayers
+    return table[shift:] + table[:shift]
+
+def startGame(game, seed, numPlayers, policies):
+    rng = random.Random(seed)
+    seats = seatPolicies(policies, numPlayers, game)
+    state = PalaceState.deal(
+        numPlayers, rng, [lambda hand, policy=policy: engineTopCards(hand, policy, rng) for policy in seats]
+    )
+    return {
+        'game': game, 'seed': seed, 'rng': rng, 'seats': seats, 'state': state,
+        'tracker': CardTracker(numPlayers), 'start': time.perf_counter(),
+    }
+
+def resultRow(game):
+    """
+    The result row (a dict keyed by COLUMNS) of a finished game.
+    """
+    state = game['state']
+    seats = game['seats']
+    return {
+        'game': game['game'],
+        'seed': game['seed'],
+        'numPlayers': state.numPlayers,
+        'policies': '|'.join(seats),
+        'winner': state.winner,
+        'winnerPolicy': seats[state.winner] if state.winner is not None else None,
+        'moves': state.moves,
+        'pickUps': state.pickUps,
+        'abandoned': state.winner is None,
+        'seconds': time.perf_counter() - game['start'],
+    }
+
+def playGames(games, numPlayers, policies, timeBudget=None, maxIterations=None):
+    """
+    Play (game, seed) pairs in lockstep: every step, the positions of all games whose
+    current player uses a batch policy are scored with a single palaceEval call. Each
+    game has a CardTracker following it for the searching policies.
+    """
+    running = [startGame(game, seed, numPlayers, policies) for game, seed in games]
+    rows = []
+    while running:
+        batched = [game for game in running if game['seats'][game['state'].current] in BATCH_POLICIES]
+        if batched:
+            states = [game['state'] for game in batched]
+            for game, move in zip(batched, bestMoves(states, [candidateMoves(state) for state in states])):
+                game['tracker'].trackMove(game['state'], move)
+                game['state'].apply(move)
+        for game in running:
+            state = game['state']
+            policy = game['seats'][state.current]
+            if policy not in BATCH_POLICIES and not state.isTerminal():
+                move = engineMove(state, policy, game['rng'], timeBudget, game['tracker'], maxIterations)
+                game['tracker'].trackMove(state, move)
+                state.apply(move)
+        stillRunning = []
+        for game in running:
+            if game['state'].isTerminal():
+                rows.append(resultRow(game))
+            else:
+                stillRunning.append(game)
+        running = stillRunning
+    return sorted(rows, key=lambda row: row['game'])
+
+def simulate(numGames, numPlayers, policies, seed=0, workers=None, timeBudget=None, maxIterations=None):
+    """
+    Play numGames games over a process pool and return their rows in game order.
+    Every game's seed is derived from seed. Easy and Medium games replay exactly from
+    it; Hard and Impossible only do when maxIterations bounds their search, since a
+    time budget searches as far as the machine gets. Each worker gets a few large
+    chunks so batch policies see many positions per call.
+    """
+    games = [(game, seed * 1000003 + game) for game in range(numGames)]
+    workers = workers or os.cpu_count() or 1
+    chunkSize = max(1, -(-numGames // (workers * CHUNKS_PER_WORKER)))
+    chunks = [games[i:i + chunkSize] for i in range(0, len(games), chunkSize)]
+    if workers == 1:
+        return playGames(games, numPlayers, policies, timeBudget, maxIterations)
+    rows = []
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        futures = [pool.submit(playGames, chunk, numPlayers, policies, timeBudget, maxIterations) for chunk in chunks]
+        for future in futures:
+            rows.extend(future.result())
+    return rows
+
+def summarize(rows, policies, elapsed):
+    policies = list(dict.fromkeys(policies))
+    finished = [row for row in rows if not row['abandoned']]
+    seatsPlayed = {policy: 0 for policy in policies}
+    wins = {policy: 0 for policy in policies}
+    for row in rows:
+        for policy in row['policies'].split('|'):
+            seatsPlayed[policy] += 1
+        if row['winnerPolicy'] is not None:
+            wins[row['winnerPolicy']] += 1
+    games = len(rows) or 1
+    return {
+        'games': len(rows),
+        'abandoned': len(rows) - len(finished),
+        'winRates': {policy: wins[policy] / games for policy in policies},
+        'winsPerSeat': {policy: wins[policy] / seatsPlayed[policy] if seatsPlayed[policy] else 0.0 for policy in policies},
+        'averageMoves': sum(row['moves'] for row in rows) / games,
+        'averagePickUps': sum(row['pickUps'] for row in rows) / games,
+        'gamesPerSecond': len(rows) / elapsed if elapsed else 0.0,
+        'seconds': elapsed,
+    }
+
+def formatSummary(summary):
+    lines = [
+        f"{summary['games']} games in {summary['seconds']:.1f} s ({summary['gamesPerSecond']:.1f} games/s), "
+        f"{summary['abandoned']} abandoned",
+        f"Average game length: {summary['averageMoves']:.1f} moves, {summary['averagePickUps']:.2f} pickups",
+    ]
+    for policy, rate in summary['winRates'].items():
+        lines.append(f"  {policy:<10} wins {rate * 100:5.1f}% of games, {summary['winsPerSeat'][policy] * 100:5.1f}% per seat")
+    return "\n".join(lines)
+
+def writeCsv(rows, path):
+    with open(path, 'w', newline='') as f:
+        writer = csv.DictWriter(f, fieldnames=COLUMNS)
+        writer.writeheader()
+        writer.writerows(rows)
+
+def writeColumns(rows, path):
+    """
+    Write rows column by column ({column: [values]}), which loads straight into
+    columnar tools such as pandas.DataFrame.
+    """
+    with open(path, 'w') as f:
+        json.dump({column: [row[column] for row in rows] for column in COLUMNS}, f)
+
+def parsePolicies(names):
+    byName = {difficulty.lower(): difficulty for difficulty in AI_DIFFICULTIES}
+    policies = []
+    for name in names:
+        if name.lower() not in byName:
+            raise argparse.ArgumentTypeError(f"unknown policy {name!r}, expected one of {', '.join(AI_DIFFICULTIES)}")
+        policies.append(byName[name.lower()])
+    return policies
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Play Palace games between AI policies headlessly.")
+    parser.add_argument('--games', type=int, default=1000, help="number of games to play")
+    parser.add_argument('--players', type=int, default=2, choices=[2, 3, 4], help="players per game")
+    parser.add_argument('--policies', nargs='+', default=['Medium'], help="AI difficulty per seat")
+    parser.add_argument('--budget', type=float, default=None, help="search seconds per move for Hard/Impossible")
+    parser.add_argument('--iterations', type=int, default=None,
+                        help="search iterations per move for Hard/Impossible instead of a time budget")
+    parser.add_argument('--workers', type=int, default=None, help="worker processes (default: all cores)")
+    parser.add_argument('--seed', type=int, default=0, help="base seed (runs replay exactly unless Hard/Impossible search by time)")
+    parser.add_argument('--csv', help="write one row per game to this CSV file")
+    parser.add_argument('--columns', help="write results as columnar JSON to this file")
+    args = parser.parse_args(argv)
+    try:
+        policies = parsePolicies(args.policies)
+    except argparse.ArgumentTypeError as e:
+        parser.error(str(e))
+
+    start = time.perf_counter()
+    rows = simulate(args.games, args.players, policies, args.seed, args.workers, args.budget, args.iterations)
+    summary = summarize(rows, policies, time.perf_counter() - start)
+    print(formatSummary(summary))
+    if args.csv:
+        writeCsv(rows, args.csv)
+    if args.columns:
+        writeColumns(rows, args.columns)
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,239 @@
+"""
+Game state of one table, shared by GameController and the lobbies.
+Nothing in this module imports Qt.
+
+A TableState is the single owner of a table's state: the Deck, the pile, the turn and
+one PlayerState per seat. All three are slotted, and every card they hold is one of the
+shared tuples in CARDS, so a table is a few small objects and lists of references
+instead of dicts of per-seat card copies.
+
+A TableState also keeps its checksum (palaceRules.tableChecksum) up to date as the
+table changes, so changes to its cards go through its methods rather than the lists.
+"""
+from itertools import islice
+from palaceRules import (
+    VALUES, SUITS, CARD_ZONES, CURRENT_KEYS, cardKeys, cardNumber, orderedChecksum, zoneChecksum,
+)
+
+# Every (value, suit, isTopCard, isBottomCard) card, one tuple each for all tables
+CARDS = {
+    (value, suit, isTop, isBottom): (value, suit, isTop, isBottom)
+    for value in VALUES for suit in SUITS for isTop in (False, True) for isBottom in (False, True)
+}
+
+def sharedCard(value, suit, isTop=False, isBottom=False):
+    return CARDS[value, suit, isTop, isBottom]
+
+def sharedCards(cards):
+    """
+    The shared tuples for cards, which may be lists decoded from JSON.
+    """
+    return [CARDS[tuple(card)] for card in cards]
+
+class Deck:
+    """
+    The draw deck: a shuffled sequence of cards that never changes and a cursor at the
+    next card to draw. Draws and deals take index ranges and only move the cursor, so
+    peers can follow a draw from its count alone ('drawCards'). Iterating and len()
+    cover the cards left.
+
+    zobrist is the deck's part of the table checksum, updated by every draw.
+    """
+    __slots__ = ('cards', 'cursor', 'zobrist')
+
+    def __init__(self, cards=(), cursor=0):
+        self.cards = tuple(sharedCards(cards))
+        self.cursor = cursor
+        self.zobrist = orderedChecksum(cardKeys()[2], reversed(self.cards[cursor:]))
+
+    def __len__(self):
+        return len(self.cards) - self.cursor
+
+    def __iter__(self):
+        return islice(self.cards, self.cursor, None)
+
+    def draw(self, count=1):
+        """
+        Take the next count cards, or what is left when the deck runs out.
+        """
+        if count < 0:
+            raise ValueError(f"cannot draw {count} cards")
+        start = self.cursor
+        self.cursor = min(len(self.cards), start + count)
+        drawn = self.cards[start:self.cursor]
+        self.zobrist ^= orderedChecksum(cardKeys()[2], reversed(drawn), len(self.cards) - self.cursor)
+        return list(drawn)
+
+    def remaining(self):
+        """
+        The cards left as a list, for messages.
+        """
+        return list(self.cards[self.cursor:])
+
+    def extended(self, cards):
+        """
+        A new deck of the cards left followed by cards.
+        """
+        return Deck(self.remaining() + list(cards))
+
+class PlayerState:
+    __slots__ = ('handCards', 'topCards', 'bottomCards')
+
+    def __init__(self, handCards=(), topCards=(), bottomCards=()):
+        self.setCards(handCards, topCards, bottomCards)
+
+    def setCards(self, handCards, topCards, bottomCards):
+        self.handCards = sharedCards(handCards)
+        self.topCards = sharedCards(topCards)
+        self.bottomCards = sharedCards(bottomCards)
+
+    def allCards(self):
+        return self.handCards + self.topCards + self.bottomCards
+
+class TableState:
+    """
+    Seats are numbered from 1 like player indices; players[0] is Player 1.
+
+    zobrist is the seats' and the pile's part of the table checksum, kept up to date by
+    the methods that change them. Code that fills in the fields directly must call
+    rehash() afterwards.
+    """
+    __slots__ = ('numPlayers', 'players', 'deck', 'pile', 'currentPlayer', 'clockwise', 'sevenSwitch', 'zobrist')
+
+    def __init__(self, numPlayers, deck=()):
+        self.numPlayers = numPlayers
+        self.players = [PlayerState() for _ in range(numPlayers)]
+        self.deck = Deck(deck)
+        self.pile = []
+        self.currentPlayer = None
+        self.clockwise = None
+        self.sevenSwitch = False
+        self.zobrist = 0
+
+    @classmethod
+    def deal(cls, deck, numPlayers):
+        """
+        Deal 3 bottom cards and a 6 card hand to every seat from a shuffled deck; the
+        rest of the deck stays on the table.
+        """
+        table = cls(numPlayers, deck)
+        for player in table.players:
+            cards = table.deck.draw(9)
+            player.bottomCards = [sharedCard(card[0], card[1], False, True) for card in cards[:3]]
+            player.handCards = [sharedCard(card[0], card[1]) for card in cards[3:]]
+        table.rehash()
+        return table
+
+    @classmethod
+    def fromDeckSync(cls, data):
+        """
+        The table described by a 'deckSync' message.
+        """
+        table = cls(data['numPlayers'], data['deck'])
+        for playerIndex, player in table.seats():
+            dealt = data['players'].get(f'player{playerIndex}', {})
+            player.setCards(dealt.get('hand', []), dealt.get('topCards', []), dealt.get('bottomCards', []))
+        table.rehash()
+        return table
+
+    def deckSyncData(self):
+        """
+        The fields of the 'deckSync' message that starts a game at this table.
+        """
+        players = {
+            f'player{playerIndex}': {'bottomCards': player.bottomCards, 'topCards': player.topCards, 'hand': player.handCards}
+            for playerIndex, player in self.seats()
+        }
+        return {'deck': self.deck.remaining(), 'players': players, 'numPlayers': self.numPlayers}
+
+    def player(self, playerIndex):
+        return self.players[playerIndex - 1]
+
+    def seats(self):
+        """
+        (playerIndex, PlayerState) for every seat.
+        """
+        return enumerate(self.players, start=1)
+
+    def reseat(self, playerIndices):
+        """
+        Keep only the seats in playerIndices, renumbered from 1 in that order, after
+        players leave.
+        """
+        self.players = [self.player(playerIndex) for playerIndex in playerIndices]
+        self.numPlayers = len(self.players)
+        self.rehash()
+
+    def zoneKeys(self, player, zone):
+        return cardKeys()[0][self.players.index(player)][CARD_ZONES.index(zone)]
+
+    def setZone(self, player, zone, cards):
+        """
+        Replace one of a seat's zones ('handCards', 'topCards' or 'bottomCards').
+        """
+        keys = self.zoneKeys(player, zone)
+        cards = sharedCards(cards)
+        self.zobrist ^= zoneChecksum(keys, getattr(player, zone)) ^ zoneChecksum(keys, cards)
+        setattr(player, zone, cards)
+
+    def setCards(self, playerIndex, handCards, topCards, bottomCards):
+        player = self.player(playerIndex)
+        for zone, cards in zip(CARD_ZONES, (handCards, topCards, bottomCards)):
+            self.setZone(player, zone, cards)
+
+    def addCards(self, player, zone, cards):
+        self.zobrist ^= zoneChecksum(self.zoneKeys(player, zone), cards)
+        getattr(player, zone).extend(cards)
+
+    def takeCard(self, player, zone, card):
+        """
+        Remove card from one of a seat's zones and return the copy it held.
+        """
+        cards = getattr(player, zone)
+        taken = cards.pop(cards.index(card))
+        self.zobrist ^= self.zoneKeys(player, zone)[cardNumber(taken)]
+        return taken
+
+    def setPile(self, cards):
+        keys = cardKeys()[1]
+        cards = sharedCards(cards)
+        self.zobrist ^= orderedChecksum(keys, self.pile) ^ orderedChecksum(keys, cards)
+        self.pile = cards
+
+    def addToPile(self, card):
+        self.zobrist ^= cardKeys()[1][len(self.pile)][cardNumber(card)]
+        self.pile.append(card)
+
+    def burn(self):
+        """
+        Clear the pile, keeping the list so views holding it see it empty.
+        """
+        self.zobrist ^= orderedChecksum(cardKeys()[1], self.pile)
+        self.pile.clear()
+
+    def pickUp(self, player):
+        """
+        Move the pile into a seat's hand.
+        """
+        self.addCards(player, 'handCards', self.pile)
+        self.burn()
+
+    def rehash(self):
+        """
+        Recompute zobrist from the seats and the pile.
+        """
+        zoneKeys, pileKeys, _ = cardKeys()
+        checksum = orderedChecksum(pileKeys, self.pile)
+        for seatKeys, player in zip(zoneKeys, self.players):
+            for keys, zone in zip(seatKeys, CARD_ZONES):
+                checksum ^= zoneChecksum(keys, getattr(player, zone))
+        self.zobrist = checksum
+
+    def checksum(self):
+        """
+        The table's palaceRules.tableChecksum, from the running hashes.
+        """
+        checksum = self.zobrist ^ self.deck.zobrist
+        if self.currentPlayer is not None:
+            checksum ^= CURRENT_KEYS[self.currentPlayer - 1]
+        return checksum
@@ -0,0 +1,116 @@
+import os
+import json
+import time
+import itertools
+import threading
+from collections import deque
+
+# Set PALACE_TRACE=1 to attach trace IDs to every outgoing protocol message
+TRACE_ENABLED = os.environ.get("PALACE_TRACE") == "1"
+
+# Turns kept for summary(); older turns are dropped so a long session stays bounded
+MAX_TRACED_TURNS = 500
+
+class TurnLatencyTracer:
+    """
+    Attaches trace IDs to outgoing protocol messages and records them on receipt,
+    producing a per-turn latency breakdown (client encode, network, host relay, render).
+
+    Timestamps are wall-clock (time.time()) so they can be compared across machines;
+    on a LAN the breakdown is only as accurate as the clocks are in sync.
+    """
+    def __init__(self, origin=None, enabled=TRACE_ENABLED):
+        self.origin = origin
+        self.enabled = enabled
+        self.sequence = itertools.count(1)
+        self.turnStart = None
+        self.turns = deque(maxlen=MAX_TRACED_TURNS)
+        self.lock = threading.Lock()
+
+    def encode(self, action, data):
+        """
+        Serialize an outgoing message, appending a trace header when tracing is enabled.
+        """
+        if not self.enabled:
+            return json.dumps({"action": action, **data}) + "\n"
+        encodeStart = time.time()
+        if self.turnStart is None:
+            self.turnStart = encodeStart
+        body = json.dumps({"action": action, **{k: v for k, v in data.items() if k != 'trace'}})
+        sent = time.time()
+        trace = {
+            'id': f"{self.origin}-{next(self.sequence)}",
+            'origin': self.origin,
+            'turnStart': self.turnStart,
+            'encode': sent - encodeStart,
+            'sent': sent,
+        }
+        if action == 'updateCurrentPlayer':
+            self.turnStart = None
+        return body[:-1] + ', "trace": ' + json.dumps(trace) + "}\n"
+
+    def markReceived(self, data, recvTime):
+        """
+        Stamp a relayed message with the host's receive time and return a snapshot
+        of its trace, taken before the relay adds its own timestamp.
+        """
+        trace = data.get('trace')
+        if not self.enabled or trace is None:
+            return None
+        trace['hostRecv'] = recvTime
+        return dict(trace)
+
+    def markRelayed(self, data):
+        trace = data.get('trace')
+        if self.enabled and trace is not None and 'hostRecv' in trace:
+            trace['relayed'] = time.time()
+
+    def record(self, action, trace, recvTime, doneTime):
+        """
+        Record a received message. A turn is closed by its 'updateCurrentPlayer' message.
+        """
+        if not self.enabled or not trace:
+            return None
+        sent = trace['sent']
+        hostRecv = trace.get('hostRecv')
+        relayed = trace.get('relayed')
+        if hostRecv is not None and relayed is not None:
+            network = (hostRecv - sent) + (recvTime - relayed)
+            relay = relayed - hostRecv
+        else:
+            network = recvTime - sent
+            relay = 0.0
+        breakdown = {
+            'id': trace['id'],
+            'action': action,
+            'encode': trace['encode'],
+            'network': network,
+            'relay': relay,
+            'render': doneTime - recvTime,
+            'total': doneTime - trace.get('turnStart', sent),
+        }
+        if action == 'updateCurrentPlayer':
+            with self.lock:
+                self.turns.append(breakdown)
+            print(self.formatBreakdown(breakdown))
+        return breakdown
+
+    def formatBreakdown(self, breakdown):
+        return (f"[trace {breakdown['id']}] turn latency {breakdown['total'] * 1000:.1f} ms "
+                f"(client encode {breakdown['encode'] * 1000:.2f} ms, "
+                f"network {breakdown['network'] * 1000:.1f} ms, "
+                f"host relay {breakdown['relay'] * 1000:.2f} ms, "
+                f"render {breakdown['render'] * 1000:.1f} ms)")
+
+    def summary(self):
+        """
+        Average breakdown (in seconds) over the last MAX_TRACED_TURNS recorded turns.
+        """
+        with self.lock:
+            turns = list(self.turns)
+        if not turns:
+            return {}
+        keys = ['encode', 'network', 'relay', 'render', 'total']
+        result = {key: sum(turn[key] for turn in turns) / len(turns) for key in keys}
+        result['turns'] = len(turns)
+        return result
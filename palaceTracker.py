@@ -0,0 +1,104 @@
+"""
+Card tracking from public events, for the AI's picture of the other players' hands.
+
+Everyone at the table sees the pile being played on, picked up and burned. From that
+stream a CardTracker keeps, per player (numbered from 0, ranks in VALUES order as in
+palaceRules.PalaceState):
+
+- known: rank counts of cards known to be in the player's hand, i.e. picked up from
+  the pile and not played since.
+- lacking: ranks the rest of the player's hand is assumed not to hold. Picking up the
+  pile means nothing in hand could be played on it; the assumption is dropped as soon
+  as the player draws unknown cards from the deck.
+- burned: rank counts of cards burned out of the game.
+
+The GUI reports every play and pickup as it happens with observePlay() and pickUp();
+headless games call trackMove() before applying each move. palaceAI uses snapshot() to deal opponents their known
+cards and to avoid dealing them ranks they lack.
+"""
+from palaceRules import NUM_RANKS, TEN, PICK_UP, BLIND
+from palaceEval import beatsAfter
+
+class CardTracker:
+    def __init__(self, numPlayers):
+        self.numPlayers = numPlayers
+        self.known = [[0] * NUM_RANKS for _ in range(numPlayers)]
+        self.lacking = [[False] * NUM_RANKS for _ in range(numPlayers)]
+        self.burned = [0] * NUM_RANKS
+        self.pile = []
+
+    def play(self, player, ranks, deckCount):
+        """
+        player placed ranks on the pile; deckCount is the deck size before they draw back up.
+        """
+        known = self.known[player]
+        for rank in ranks:
+            if known[rank]:
+                known[rank] -= 1
+        if deckCount:
+            self.lacking[player] = [False] * NUM_RANKS
+        self.pile.extend(ranks)
+
+    def pickUp(self, player, blind=False):
+        """
+        player picked up the pile. A pickup after a failed blind card says nothing about
+        the hand, which is empty at that point.
+        """
+        lacking = [False] * NUM_RANKS
+        if self.pile and not blind:
+            for rank in beatsAfter(self.pile[-1]):
+                lacking[rank] = True
+        self.lacking[player] = lacking
+        known = self.known[player]
+        for rank in self.pile:
+            known[rank] += 1
+        self.pile = []
+
+    def burn(self):
+        for rank in self.pile:
+            self.burned[rank] += 1
+        self.pile = []
+
+    def pileBurns(self):
+        """
+        Whether the cards last played burn the pile (a 10 or four of a kind on top).
+        """
+        pile = self.pile
+        return bool(pile) and (pile[-1] == TEN or (len(pile) >= 4 and len(set(pile[-4:])) == 1))
+
+    def observePlay(self, player, ranks, deckCount):
+        """
+        player placed ranks on the pile (deckCount as for play()), burning it if the
+        cards on top burn it.
+        """
+        self.play(player, ranks, deckCount)
+        if self.pileBurns():
+            self.burn()
+
+    def trackMove(self, state, move):
+        """
+        Follow move, about to be applied to the PalaceState state, using only what the
+        table sees: the cards played, a blind card once it is turned over, and pickups.
+        """
+        player = state.current
+        if move == PICK_UP:
+            self.pickUp(player)
+            return
+        if move == BLIND:
+            rank = state.bottoms[player][-1]
+            self.pile.append(rank)
+            if not state.isPlayable(rank):
+                self.pickUp(player, blind=True)
+                return
+            if self.pileBurns():
+                self.burn()
+        else:
+            rank, count = divmod(move, 5)
+            self.observePlay(player, [rank] * count, len(state.deck))
+
+    def snapshot(self):
+        return {
+            'known': [counts[:] for counts in self.known],
+            'lacking': [ranks[:] for ranks in self.lacking],
+            'burned': self.burned[:],
+        }
@@ -0,0 +1,63 @@
+from palaceEndgame import EndgameSolver, SolverLimitExceeded, isEndgame
+from palaceRules import BLIND, PICK_UP, RANK_INDEX, PalaceState, encodeMove
+
+def endgame(hand, pile, otherHand, bottom=()):
+    """
+    Player 0 to move in a 2 player endgame with an empty deck.
+    """
+    state = PalaceState(2)
+    for player, ranks in enumerate((hand, otherHand)):
+        for rank in ranks:
+            state.hands[player][RANK_INDEX[rank]] += 1
+        state.handSizes[player] = len(ranks)
+    state.bottoms[0] = [RANK_INDEX[rank] for rank in bottom]
+    for rank in pile:
+        state.addToPile(RANK_INDEX[rank], 1)
+    state.rehash()
+    return state
+
+def test_solves_a_won_position():
+    state = endgame(['4', '4'], [], ['3'])
+    assert isEndgame(state)
+    move, values = EndgameSolver().bestMove(state)
+    assert values[move] == (1.0, 0.0)
+    # Playing one 4 also wins: the 3 cannot go on it, so player 1 picks up
+    assert values[encodeMove(RANK_INDEX['4'], 1)] == (1.0, 0.0)
+
+def test_finds_the_only_winning_move():
+    # Only the 10 burns the pile and keeps the turn; anything else lets the A go out
+    state = endgame(['10', '5'], ['9'], ['A'])
+    move, values = EndgameSolver().bestMove(state)
+    assert move == encodeMove(RANK_INDEX['10'], 1)
+    assert values[move] == (1.0, 0.0)
+    assert values[PICK_UP] == (0.0, 1.0)
+
+def test_blind_card_is_a_chance_node():
+    # Whichever of the K and the 3 is turned over first, the other comes next
+    state = endgame([], ['5'], ['6', '6', '6'], bottom=['K', '3'])
+    values = EndgameSolver().moveValues(state)
+    assert set(values) == {BLIND, PICK_UP}
+    win, loss = values[BLIND]
+    assert 0.0 < win < 1.0 and abs(win + loss - 1.0) < 1e-9
+
+def test_table_keeps_the_most_recently_used_entries():
+    solver = EndgameSolver(maxEntries=2)
+    solver.store(1, (1.0, 0.0), True)
+    solver.store(2, (0.0, 1.0), True)
+    assert solver.lookup(1) is not None
+    solver.store(3, (0.5, 0.5), True)
+    assert list(solver.table) == [1, 3]
+    assert solver.lookup(2) is None
+
+def test_table_stays_within_its_bound_while_solving():
+    state = endgame(['3', '5', '8', 'J'], [], ['4', '6', '9', 'Q'])
+    full = EndgameSolver()
+    full.moveValues(state)
+    assert len(full.table) > 20
+    bounded = EndgameSolver(maxEntries=20)
+    try:
+        bounded.moveValues(state)
+    except SolverLimitExceeded:
+        # Evicted positions are solved again, so a small table may not finish
+        pass
+    assert len(bounded.table) == 20
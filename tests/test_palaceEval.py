@@ -0,0 +1,56 @@
+import math
+import random
+import pytest
+import palaceEval
+from palaceEval import positionOf, scoreMove, scoreMovesNumpy, scoreMovesPython
+from palaceRules import BLIND, PICK_UP, RANK_INDEX, PalaceState, encodeMove
+
+pytest.importorskip('numpy')
+
+@pytest.fixture(autouse=True)
+def numpyLoaded():
+    assert palaceEval.loadNumpy() is not None
+
+def samplePositions(count, seed=0):
+    """
+    Positions and legal moves from random games, every size of move list and both
+    players' points of view.
+    """
+    rng = random.Random(seed)
+    positions, moves = [], []
+    while len(positions) < count:
+        state = PalaceState.deal(rng.choice([2, 3, 4]), rng)
+        while not state.isTerminal() and len(positions) < count:
+            legal = state.legalMoves()
+            positions.append(positionOf(state, rng.randrange(state.numPlayers)))
+            moves.append(legal)
+            state.apply(rng.choice(legal))
+    return positions, moves
+
+def assertAgree(positions, moves):
+    numpyScores = scoreMovesNumpy(positions, moves)
+    pythonScores = scoreMovesPython(positions, moves)
+    assert numpyScores.shape == (len(positions), max(len(row) for row in moves))
+    for numpyRow, pythonRow in zip(numpyScores, pythonScores):
+        assert numpyRow[:len(pythonRow)].tolist() == pytest.approx(pythonRow, rel=1e-9, abs=1e-12)
+        assert all(score == -math.inf for score in numpyRow[len(pythonRow):])
+
+def test_numpy_scores_agree_with_score_move_in_played_games():
+    assertAgree(*samplePositions(2000))
+
+def test_numpy_scores_agree_on_edge_cases():
+    unseen = [0] * 13
+    unseen[RANK_INDEX['3']] = 2
+    positions = [
+        # Fewer unseen cards than the next hand holds, a run of three on the pile
+        (unseen, 5, 3, RANK_INDEX['Q'], 3, 0),
+        # Empty pile and a full deck
+        ([4] * 13, 3, 0, -1, 0, 30),
+    ]
+    moves = [
+        [encodeMove(RANK_INDEX['Q'], 1), encodeMove(RANK_INDEX['K'], 2), PICK_UP, BLIND],
+        [encodeMove(RANK_INDEX['2'], 1), encodeMove(RANK_INDEX['10'], 1), encodeMove(RANK_INDEX['7'], 3)],
+    ]
+    assertAgree(positions, moves)
+    # Four of a kind keeps the turn, so only the shed value counts
+    assert scoreMove(*positions[0], encodeMove(RANK_INDEX['Q'], 1)) == pytest.approx(1.0 - palaceEval.KEEP_VALUE[RANK_INDEX['Q']])
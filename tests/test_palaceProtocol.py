@@ -0,0 +1,46 @@
+import pytest
+from palaceProtocol import ActionDispatcher, ProtocolError, coalesceBarrier, coalesceKey, validateMessage
+
+def test_validate_accepts_a_well_formed_message():
+    assert validateMessage({'action': 'drawCards', 'count': 2}) == 'drawCards'
+    assert validateMessage({'action': 'gameOver', 'winner': "Alice"}) == 'gameOver'
+    assert validateMessage({'action': 'gameOver', 'winner': 3}) == 'gameOver'
+
+@pytest.mark.parametrize('data', [
+    ['drawCards', 2],
+    {'count': 2},
+    {'action': 'noSuchAction'},
+    {'action': 'drawCards'},
+    {'action': 'drawCards', 'count': "2"},
+    {'action': 'drawCards', 'count': True},
+    {'action': 'sevenSwitch', 'sevenSwitch': 1},
+    {'action': 'updatePile', 'pile': "[]"},
+])
+def test_validate_rejects_malformed_messages(data):
+    with pytest.raises(ProtocolError):
+        validateMessage(data)
+
+def test_coalesce_keys():
+    assert coalesceKey({'action': 'updatePile', 'pile': []}) == 'updatePile'
+    assert coalesceKey({'action': 'updateCards', 'playerIndex': 2}) == ('updateCards', 2)
+    assert coalesceKey({'action': 'updateCards', 'playerIndex': 2}) != coalesceKey({'action': 'updateCards', 'playerIndex': 3})
+    # Every draw moves the deck on, and checksums are checked one by one
+    assert coalesceKey({'action': 'drawCards', 'count': 1}) is None
+    assert coalesceKey({'action': 'updateCurrentPlayer', 'currentPlayer': 1, 'checksum': 0}) is None
+    assert coalesceBarrier({'action': 'updateCurrentPlayer', 'currentPlayer': 1, 'checksum': 0})
+    assert not coalesceBarrier({'action': 'updatePile', 'pile': []})
+
+def test_dispatch_calls_the_registered_handler_with_extra_arguments():
+    calls = []
+    dispatcher = ActionDispatcher({'drawCards': lambda data, *args: calls.append((data['count'], args)) or 'drawn'})
+    assert dispatcher.dispatch({'action': 'drawCards', 'count': 3}, 'socket', 2) == 'drawn'
+    assert calls == [(3, ('socket', 2))]
+
+def test_dispatch_rejects_malformed_and_unhandled_messages():
+    dispatcher = ActionDispatcher({'drawCards': lambda data: None})
+    with pytest.raises(ProtocolError):
+        dispatcher.dispatch({'action': 'drawCards', 'count': "3"})
+    with pytest.raises(ProtocolError):
+        dispatcher.dispatch({'action': 'updatePile', 'pile': []})
+    with pytest.raises(ProtocolError):
+        dispatcher.register('noSuchAction', lambda data: None)
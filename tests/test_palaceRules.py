@@ -0,0 +1,55 @@
+import random
+import pytest
+from palaceRules import PICK_UP, RANK_INDEX, PalaceState, encodeMove
+
+def assertHashed(state):
+    assert state.zobrist == state.copy().rehash()
+
+def position(hand, pile=(), deck=(), otherHand=('5', '5', '6')):
+    """
+    Player 0 to move in a 2 player game, holding hand over the pile, with the deck drawn from the end.
+    """
+    state = PalaceState(2)
+    for player, ranks in enumerate((hand, otherHand)):
+        for rank in ranks:
+            state.hands[player][RANK_INDEX[rank]] += 1
+        state.handSizes[player] = len(ranks)
+        state.bottoms[player] = [RANK_INDEX['9']]
+    for rank in pile:
+        state.addToPile(RANK_INDEX[rank], 1)
+    state.deck = [RANK_INDEX[rank] for rank in deck]
+    state.rehash()
+    return state
+
+def test_play_updates_the_hash():
+    state = position(['8', '8', 'J', '4'], pile=['6'], deck=['Q', '3'])
+    state.apply(encodeMove(RANK_INDEX['8'], 2))
+    assert state.pileSize == 3 and state.current == 1
+    assertHashed(state)
+
+def test_pick_up_updates_the_hash():
+    state = position(['4', 'K'], pile=['6', '9', '9'])
+    state.apply(PICK_UP)
+    assert state.pileSize == 0 and state.handSizes[0] == 5
+    assertHashed(state)
+
+@pytest.mark.parametrize('hand, pile', [
+    (['10', 'K', 'K'], ['6', '7']),
+    (['Q', 'K', 'K'], ['6', 'Q', 'Q', 'Q']),
+])
+def test_burn_updates_the_hash(hand, pile):
+    state = position(hand, pile=pile, deck=['3'])
+    rank = hand[0]
+    state.apply(encodeMove(RANK_INDEX[rank], 1))
+    assert state.pileSize == 0 and state.current == 0
+    assertHashed(state)
+
+@pytest.mark.parametrize('numPlayers', [2, 3, 4])
+def test_hash_follows_whole_games(numPlayers):
+    rng = random.Random(numPlayers)
+    for _ in range(5):
+        state = PalaceState.deal(numPlayers, rng)
+        assertHashed(state)
+        while not state.isTerminal():
+            state.apply(rng.choice(state.legalMoves()))
+            assertHashed(state)
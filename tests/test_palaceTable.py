@@ -0,0 +1,85 @@
+import json
+import random
+import pytest
+from palaceRules import newDeck, tableChecksum
+from palaceTable import Deck, TableState, sharedCard
+
+def fullChecksum(table):
+    return tableChecksum(table.players, table.pile, table.deck, table.currentPlayer)
+
+def dealtTable(numPlayers=4, seed=7):
+    table = TableState.deal(newDeck(random.Random(seed)), numPlayers)
+    table.currentPlayer = 1
+    return table
+
+def test_checksum_follows_every_change():
+    table = dealtTable()
+    assert table.checksum() == fullChecksum(table)
+    player = table.player(1)
+
+    def play(card):
+        table.addToPile(table.takeCard(player, 'handCards', card))
+        table.addCards(player, 'handCards', table.deck.draw(1))
+        assert table.checksum() == fullChecksum(table)
+
+    for card in list(player.handCards[:3]):
+        play(card)
+    table.pickUp(table.player(2))
+    assert not table.pile
+    assert table.checksum() == fullChecksum(table)
+
+    play(player.handCards[0])
+    table.burn()
+    assert table.checksum() == fullChecksum(table)
+
+    table.setZone(player, 'topCards', [sharedCard(card[0], card[1], True) for card in player.handCards[:3]])
+    table.setCards(3, [], [], table.player(3).bottomCards)
+    table.setPile([('5', 'clubs', False, False), ('9', 'hearts', False, False)])
+    table.currentPlayer = 4
+    assert table.checksum() == fullChecksum(table)
+
+    table.reseat([1, 2, 4])
+    table.currentPlayer = 3
+    assert table.checksum() == fullChecksum(table)
+    table.deck = table.deck.extended(table.player(3).allCards())
+    assert table.checksum() == fullChecksum(table)
+
+def test_checksum_tells_tables_apart():
+    table, other = dealtTable(), dealtTable()
+    assert table.checksum() == other.checksum()
+    other.addToPile(other.takeCard(other.player(2), 'handCards', other.player(2).handCards[0]))
+    assert table.checksum() != other.checksum()
+
+def test_deck_draws_stop_at_the_end():
+    cards = newDeck(random.Random(1))[:5]
+    deck = Deck(cards)
+    assert deck.draw(3) == cards[:3]
+    assert len(deck) == 2 and deck.remaining() == cards[3:]
+    assert deck.draw(0) == []
+    assert deck.draw(4) == cards[3:]
+    assert len(deck) == 0 and deck.remaining() == [] and not deck
+    assert deck.draw(1) == []
+    assert deck.cursor == 5
+    with pytest.raises(ValueError):
+        deck.draw(-1)
+
+def test_deck_drawn_cards_are_shared():
+    deck = Deck([['A', 'spades', False, False], ['2', 'hearts', False, False]])
+    drawn = deck.draw(2)
+    assert drawn[0] is sharedCard('A', 'spades')
+    assert deck.extended(drawn).remaining() == drawn
+
+def test_deck_sync_round_trip():
+    table = dealtTable(3)
+    table.deck.draw(4)
+    data = json.loads(json.dumps({'action': 'deckSync', **table.deckSyncData()}))
+    synced = TableState.fromDeckSync(data)
+    assert synced.numPlayers == 3
+    assert synced.deck.remaining() == table.deck.remaining()
+    for (_, player), (_, syncedPlayer) in zip(table.seats(), synced.seats()):
+        assert syncedPlayer.handCards == player.handCards
+        assert syncedPlayer.topCards == player.topCards
+        assert syncedPlayer.bottomCards == player.bottomCards
+    # The turn is set later, by 'startMainGame'
+    synced.currentPlayer = table.currentPlayer
+    assert synced.checksum() == table.checksum()
@@ -0,0 +1,53 @@
+import random
+import pytest
+from palaceRules import BLIND, NUM_RANKS, RANK_INDEX, PalaceState
+from palaceTracker import CardTracker
+
+K, THREE, SIX, NINE = (RANK_INDEX[rank] for rank in ('K', '3', '6', '9'))
+
+def test_pick_up_marks_the_ranks_that_would_have_beaten_the_pile():
+    tracker = CardTracker(2)
+    tracker.observePlay(0, [NINE], 10)
+    tracker.pickUp(1)
+    lacking = tracker.lacking[1]
+    assert lacking[K] and lacking[RANK_INDEX['2']] and lacking[RANK_INDEX['10']] and not lacking[THREE]
+    assert tracker.known[1][NINE] == 1 and not tracker.pile
+
+def test_blind_pick_up_keeps_the_cards_but_assumes_nothing():
+    tracker = CardTracker(2)
+    tracker.observePlay(0, [K], 0)
+    # Player 1 turns over a 3 from their bottom cards, which cannot go on a K
+    tracker.play(1, [THREE], 0)
+    tracker.pickUp(1, blind=True)
+    assert tracker.lacking[1] == [False] * NUM_RANKS
+    assert tracker.known[1][K] == 1 and tracker.known[1][THREE] == 1
+
+def test_track_move_follows_a_failed_blind_card():
+    state = PalaceState(2)
+    state.bottoms[0] = [NINE, THREE]
+    state.hands[1][SIX] = 2
+    state.handSizes[1] = 2
+    state.bottoms[1] = [NINE]
+    state.addToPile(K, 1)
+    state.rehash()
+    tracker = CardTracker(2)
+    tracker.observePlay(1, [K], 0)
+    tracker.trackMove(state, BLIND)
+    state.apply(BLIND)
+    assert state.hands[0][K] == 1 and state.hands[0][THREE] == 1
+    assert tracker.known[0] == state.hands[0]
+    assert tracker.lacking[0] == [False] * NUM_RANKS
+    assert not tracker.pile
+
+@pytest.mark.parametrize('numPlayers', [2, 3, 4])
+def test_known_cards_stay_in_hand_through_whole_games(numPlayers):
+    rng = random.Random(numPlayers)
+    for _ in range(5):
+        state = PalaceState.deal(numPlayers, rng)
+        tracker = CardTracker(numPlayers)
+        while not state.isTerminal():
+            move = rng.choice(state.legalMoves())
+            tracker.trackMove(state, move)
+            state.apply(move)
+            for player in range(numPlayers):
+                assert all(known <= held for known, held in zip(tracker.known[player], state.hands[player]))